@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""Benchmark writing paginated cut/termination pages and sheet titleblocks.
+
+Usage:
+  uv run python scripts/benchmarks/bench_aux_pages.py [--pages 100 500] [--repeat 3]
+
+Writes ``--pages`` one-row cut pages and as many termination pages for a
+DIN 6771 sheet, as ``generate_html_output`` does for a paginated harness,
+then renders the titleblock of ``--pages`` sheets that differ only in sheet
+number and part number.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from filare.models.metadata import (
+    AuthorSignature,
+    Metadata,
+    PageTemplateConfig,
+    PageTemplateTypes,
+    RevisionSignature,
+    SheetSizes,
+)
+from filare.models.options import PageOptions
+from filare.render import html
+
+
+def synthetic_metadata(output_dir: Path, sheets: int) -> Metadata:
+    return Metadata(
+        title="Bench harness",
+        pn="BENCH",
+        company="Acme",
+        address="1 Road",
+        output_dir=output_dir,
+        output_name="bench",
+        sheet_total=sheets,
+        sheet_current=1,
+        sheet_name="BENCH",
+        titlepage=output_dir / "titlepage",
+        output_names=["titlepage", "bench"],
+        files=[],
+        use_qty_multipliers=False,
+        multiplier_file_name="qty.txt",
+        template=PageTemplateConfig(
+            name=PageTemplateTypes.din_6771, sheetsize=SheetSizes.A4
+        ),
+        authors={
+            role: AuthorSignature(name="Alice", date="2024-01-01")
+            for role in ("created", "checked", "approved")
+        },
+        revisions={
+            rev: RevisionSignature(name="Bob", date="2024-01-02", changelog="init")
+            for rev in ("a", "b", "c")
+        },
+    )
+
+
+def best_of(repeat: int, func) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'pages':>6} {'aux pages [ms]':>15} {'titleblocks [ms]':>17}")
+    with tempfile.TemporaryDirectory(prefix="filare-bench-") as tmp:
+        for pages in args.pages:
+            metadata = synthetic_metadata(Path(tmp), pages)
+            options = PageOptions(
+                include_cut_diagram=True,
+                include_termination_diagram=True,
+                cut_rows_per_page=1,
+                termination_rows_per_page=1,
+            )
+            cut_rows = [
+                {"wire": f"W{idx}", "partno": "", "color": "RD", "length": "1 m"}
+                for idx in range(pages)
+            ]
+            termination_rows = [
+                {"source": f"X1:{idx}", "target": f"X2:{idx}"} for idx in range(pages)
+            ]
+            aux = best_of(
+                args.repeat,
+                lambda: html._write_aux_pages(
+                    Path(tmp) / "bench",
+                    metadata,
+                    options,
+                    {},
+                    cut_rows=cut_rows,
+                    termination_rows=termination_rows,
+                ),
+            )
+
+            def titleblocks() -> None:
+                for sheet in range(1, pages + 1):
+                    html.render_titleblock(
+                        metadata.model_copy(update={"sheet_current": sheet}),
+                        options,
+                        f"BENCH-{sheet:02d}",
+                    )
+
+            sheets = best_of(args.repeat, titleblocks)
+            print(f"{pages:>6} {aux * 1e3:>15.1f} {sheets * 1e3:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Benchmark the streaming BOM writers against the tabulate-based TSV render.
+
+Usage:
+  uv run python scripts/benchmarks/bench_bom_export.py [--sizes 10000 100000]
+
+Reports wall time and the peak memory allocated while writing (tracemalloc),
+on top of the BOM entries themselves. The tabulate render is skipped above
+``--render-limit`` entries.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+import tracemalloc
+from typing import Callable, Dict, Tuple
+
+from filare.models.bom import BomContent, BomEntry, BomRenderOptions
+from filare.models.numbers import NumberAndUnit
+from filare.models.partnumber import PartNumberInfo
+from filare.render.bom_export import write_bom_csv, write_bom_jsonl, write_bom_tsv
+
+
+def synthetic_bom(count: int) -> Dict[int, BomEntry]:
+    bom: Dict[int, BomEntry] = {}
+    for idx in range(count):
+        entry = BomEntry(
+            qty=NumberAndUnit(idx % 7 + 1, "m" if idx % 3 == 0 else None),
+            partnumbers=PartNumberInfo(pn=f"PN-{idx}", manufacturer="ACME"),
+            id=str(idx + 1),
+            description=f"Wire, 0.25 mm2, color {idx}",
+            category="WIRE",
+            designators=[f"W{idx}"],
+            per_harness={"H1": {"qty": NumberAndUnit(1, None)}},
+        )
+        bom[hash(entry)] = entry
+    return bom
+
+
+class _NullWriter(io.TextIOBase):
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def _measure(func: Callable[[], object]) -> Tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--render-limit", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'entries':>8} {'writer':>8} {'time [s]':>9} {'peak [MB]':>10}")
+    for size in args.sizes:
+        bom = synthetic_bom(size)
+        writers = {
+            "csv": lambda: write_bom_csv(_NullWriter(), bom),
+            "tsv": lambda: write_bom_tsv(_NullWriter(), bom),
+            "jsonl": lambda: write_bom_jsonl(_NullWriter(), bom),
+        }
+        if size <= args.render_limit:
+            writers["tabulate"] = lambda: _NullWriter().write(
+                BomContent(bom)
+                .get_bom_render(BomRenderOptions(restrict_printed_lengths=False))
+                .as_tsv()
+            )
+        for name, func in writers.items():
+            elapsed, peak = _measure(func)
+            print(f"{size:>8} {name:>8} {elapsed:>9.3f} {peak:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
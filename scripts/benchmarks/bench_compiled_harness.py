@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""Benchmark loading compiled harness artifacts against building from YAML.
+
+Usage:
+  uv run python scripts/benchmarks/bench_compiled_harness.py [--segments 10 100] [--repeat 5]
+
+Writes a synthetic harness YAML per size: a chain of 10-pin connectors
+(instantiated from one template) joined by shielded, color-coded cables, as
+``--segments`` connection sets. Times building the harness from YAML (parse,
+template expansion, validation, BOM) and loading its ``filare compile``
+artifact (freshness check, unpickling, BOM) into a new harness.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from filare.flows.build_harness import compile_harness
+from filare.flows.compiled_harness import compiled_path, find_compiled_harness
+from filare.models.harness import Harness
+from filare.models.metadata import Metadata
+
+PINS = 10
+
+
+def synthetic_yaml(segments: int) -> str:
+    lines = [
+        "metadata:",
+        "  title: bench",
+        "  pn: bench",
+        "connectors:",
+        "  X:",
+        "    type: Molex Micro-Fit",
+        "    subtype: female",
+        f"    pinlabels: [{', '.join(f'P{pin}' for pin in range(1, PINS + 1))}]",
+        "cables:",
+        "  W:",
+        "    gauge: 0.25 mm2",
+        "    length: 0.5",
+        "    color_code: DIN",
+        f"    wirecount: {PINS}",
+        "    shield: true",
+        "connections:",
+    ]
+    for idx in range(segments):
+        lines += [
+            "  -",
+            f"    - X.X{idx}: [1-{PINS}]",
+            f"    - W.W{idx}: [1-{PINS}]",
+            f"    - X.X{idx + 1}: [1-{PINS}]",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def load_compiled(yaml_file: Path) -> Harness:
+    compiled = find_compiled_harness(
+        [yaml_file], [], yaml_file.stem, [yaml_file.parent]
+    )
+    assert compiled is not None, "artifact not found or out of date"
+    harness = Harness(
+        metadata=Metadata(
+            **{
+                "title": yaml_file.stem,
+                "pn": yaml_file.stem,
+                "company": "",
+                "address": "",
+                **compiled.metadata,
+                "output_dir": yaml_file.parent,
+                "output_name": yaml_file.stem,
+                "files": [yaml_file],
+                "output_names": [yaml_file.stem],
+                "sheet_total": 1,
+                "sheet_current": 1,
+                "sheet_name": yaml_file.stem.upper(),
+                "titlepage": Path("titlepage"),
+                "use_qty_multipliers": False,
+                "multiplier_file_name": "quantity_multipliers.txt",
+            }
+        ),
+        options=compiled.options,
+        notes=compiled.notes,
+    )
+    compiled.apply(harness)
+    harness.populate_bom()
+    return harness
+
+
+def best_of(repeat: int, func) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'segments':>10} {'yaml (s)':>10} {'compiled (s)':>13} "
+        f"{'speedup':>8} {'artifact':>10}"
+    )
+    with tempfile.TemporaryDirectory(prefix="filare-bench-") as tmp:
+        for segments in args.segments:
+            yaml_file = Path(tmp) / f"bench{segments}.yml"
+            yaml_file.write_text(synthetic_yaml(segments), encoding="utf-8")
+            path = compile_harness([yaml_file]).write(compiled_path(yaml_file))
+            from_yaml = best_of(args.repeat, lambda: compile_harness([yaml_file]))
+            loaded = best_of(args.repeat, lambda: load_compiled(yaml_file))
+            size = f"{path.stat().st_size // 1024} KiB"
+            print(
+                f"{segments:>10} {from_yaml:>10.4f} {loaded:>13.4f} "
+                f"{from_yaml / loaded:>8.1f} {size:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
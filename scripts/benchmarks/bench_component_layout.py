@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Benchmark whole-graph vs. split-and-packed layout of a harness diagram.
+
+Usage:
+  uv run python scripts/benchmarks/bench_component_layout.py [--groups 100]
+
+Builds a synthetic harness with ``--groups`` independent connector-cable-
+connector groups and renders its SVG once as a single graph and once with
+``graphviz_split_components`` (one Graphviz process per group, run in
+parallel, then packed). The layout cache is disabled. Requires Graphviz.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from filare.models.harness import Harness
+from filare.models.metadata import Metadata
+from filare.models.notes import Notes
+from filare.models.options import PageOptions
+from filare.settings import settings
+
+
+def synthetic_harness(groups: int, wires: int) -> Harness:
+    harness = Harness(
+        metadata=Metadata(
+            title="bench",
+            pn="bench",
+            company="",
+            address="",
+            output_dir=Path("."),
+            output_name="bench",
+            sheet_total=1,
+            sheet_current=1,
+            sheet_name="BENCH",
+            titlepage=Path("titlepage"),
+            output_names=["bench"],
+            files=[],
+            use_qty_multipliers=False,
+            multiplier_file_name="qty.txt",
+        ),
+        options=PageOptions(),
+        notes=Notes(),
+    )
+    for idx in range(groups):
+        left, right, cable = f"X{idx}A", f"X{idx}B", f"W{idx}"
+        harness.add_connector_model({"designator": left, "pincount": wires})
+        harness.add_connector_model({"designator": right, "pincount": wires})
+        harness.add_cable_model(
+            {"designator": cable, "wirecount": wires, "colors": ["RD"] * wires}
+        )
+        for pin in range(1, wires + 1):
+            harness.connect(left, pin, cable, pin, right, pin)
+    return harness
+
+
+def _render(harness: Harness, split: bool) -> float:
+    settings.graphviz_split_components = split
+    start = time.perf_counter()
+    harness.render_graph("svg")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, nargs="+", default=[20, 100, 200])
+    parser.add_argument("--wires", type=int, default=4)
+    args = parser.parse_args()
+    settings.layout_cache = False
+
+    print(f"{'groups':>7} {'whole [s]':>10} {'split [s]':>10}")
+    for groups in args.groups:
+        harness = synthetic_harness(groups, args.wires)
+        whole = _render(harness, split=False)
+        split = _render(harness, split=True)
+        print(f"{groups:>7} {whole:>10.3f} {split:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""Measure the memory used by connector pins, cable wires and connections.
+
+Usage:
+  uv run python scripts/benchmarks/bench_component_memory.py [--pins 20000]
+
+Builds ``--pins / 100`` connectors with 100 pins each and as many 100-wire
+cables joining them in a chain, then reports the memory allocated for them
+(tracemalloc) and the per pin/wire/connection average.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+
+from filare.models.harness import Harness
+from filare.models.metadata import Metadata
+from filare.models.notes import Notes
+from filare.models.options import PageOptions
+
+PINS_PER_CONNECTOR = 100
+COLORS = ["RD", "BK", "BU", "GN", "YE", "WH", "BN", "VT", "GY", "OG"]
+
+
+def empty_harness() -> Harness:
+    return Harness(
+        metadata=Metadata(
+            title="bench",
+            pn="bench",
+            company="",
+            address="",
+            output_dir=Path("."),
+            output_name="bench",
+            sheet_total=1,
+            sheet_current=1,
+            sheet_name="BENCH",
+            titlepage=Path("titlepage"),
+            output_names=["bench"],
+            files=[],
+            use_qty_multipliers=False,
+            multiplier_file_name="qty.txt",
+        ),
+        options=PageOptions(),
+        notes=Notes(),
+    )
+
+
+def populate(harness: Harness, pins: int) -> int:
+    count = max(pins // PINS_PER_CONNECTOR, 2)
+    colors = [COLORS[i % len(COLORS)] for i in range(PINS_PER_CONNECTOR)]
+    for idx in range(count):
+        harness.add_connector_model(
+            {
+                "designator": f"X{idx}",
+                "pincount": PINS_PER_CONNECTOR,
+                "pincolors": colors,
+            }
+        )
+    for idx in range(count - 1):
+        harness.add_cable_model(
+            {"designator": f"W{idx}", "wirecount": PINS_PER_CONNECTOR, "colors": colors}
+        )
+        for pin in range(1, PINS_PER_CONNECTOR + 1):
+            harness.connect(f"X{idx}", pin, f"W{idx}", pin, f"X{idx + 1}", pin)
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pins", type=int, default=20000)
+    args = parser.parse_args()
+
+    harness = empty_harness()
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = populate(harness, args.pins)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    pins = count * PINS_PER_CONNECTOR
+    wires = (count - 1) * PINS_PER_CONNECTOR
+    objects = pins + 2 * wires  # pins, wires and connections
+    print(f"pins: {pins}, wires: {wires}, connections: {wires}")
+    print(f"{'build time [s]':>20} {elapsed:>10.3f}")
+    print(f"{'retained [MB]':>20} {current / 1e6:>10.2f}")
+    print(f"{'peak [MB]':>20} {peak / 1e6:>10.2f}")
+    print(f"{'bytes per object':>20} {current / objects:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
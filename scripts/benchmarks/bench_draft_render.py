@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Benchmark the draft render mode against the full render of a harness.
+
+Usage:
+  uv run python scripts/benchmarks/bench_draft_render.py [--connectors 50 200]
+
+Builds a synthetic harness of ``--connectors`` connector pairs joined by
+cables (with pin colors) and times building the DOT graph and, when Graphviz
+is installed, writing the SVG and PNG outputs with ``Harness.output``. The
+layout cache is disabled.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from filare.models.harness import Harness
+from filare.models.metadata import Metadata
+from filare.models.notes import Notes
+from filare.models.options import PageOptions
+from filare.render.layout_cache import graphviz_version
+from filare.settings import settings
+
+
+def synthetic_harness(pairs: int, pins: int, draft: bool) -> Harness:
+    harness = Harness(
+        metadata=Metadata(
+            title="bench",
+            pn="bench",
+            company="",
+            address="",
+            output_dir=Path("."),
+            output_name="bench",
+            sheet_total=1,
+            sheet_current=1,
+            sheet_name="BENCH",
+            titlepage=Path("titlepage"),
+            output_names=["bench"],
+            files=[],
+            use_qty_multipliers=False,
+            multiplier_file_name="qty.txt",
+        ),
+        options=PageOptions(),
+        notes=Notes(),
+        draft=draft,
+    )
+    colors = ["RD", "BK", "GN", "BU"]
+    for idx in range(pairs):
+        left, right, cable = f"X{idx}A", f"X{idx}B", f"W{idx}"
+        for designator in (left, right):
+            harness.add_connector_model(
+                {
+                    "designator": designator,
+                    "pincount": pins,
+                    "pinlabels": [f"S{pin}" for pin in range(pins)],
+                    "pincolors": [colors[pin % 4] for pin in range(pins)],
+                }
+            )
+        harness.add_cable_model(
+            {
+                "designator": cable,
+                "wirecount": pins,
+                "colors": [colors[pin % 4] for pin in range(pins)],
+            }
+        )
+        for pin in range(1, pins + 1):
+            harness.connect(left, pin, cable, pin, right, pin)
+    return harness
+
+
+def _measure(pairs: int, pins: int, draft: bool, render: bool):
+    harness = synthetic_harness(pairs, pins, draft)
+    start = time.perf_counter()
+    harness.create_graph()
+    build = time.perf_counter() - start
+    if not render:
+        return build, None
+    with TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        harness.output(Path(tmp) / "bench", fmt=("svg", "png"))
+        output = time.perf_counter() - start
+    return build, output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connectors", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--pins", type=int, default=8)
+    args = parser.parse_args()
+    settings.layout_cache = False
+    render = graphviz_version() is not None
+    if not render:
+        print("Graphviz not found; timing graph construction only.")
+
+    print(f"{'pairs':>6} {'mode':>6} {'graph [s]':>10} {'output [s]':>11}")
+    for pairs in args.connectors:
+        for mode, draft in (("full", False), ("draft", True)):
+            build, output = _measure(pairs, args.pins, draft, render)
+            shown = f"{output:>11.3f}" if output is not None else f"{'-':>11}"
+            print(f"{pairs:>6} {mode:>6} {build:>10.3f} {shown}")
+
+
+if __name__ == "__main__":
+    main()
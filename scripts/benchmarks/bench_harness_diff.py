@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""Benchmark the structural diff of two large harness revisions.
+
+Usage:
+  uv run python scripts/benchmarks/bench_harness_diff.py [--connections 10000]
+
+Builds two synthetic harnesses with ``--connections`` connections each; the
+second revision re-routes a few wires, drops a cable and changes a connector
+part number. Only ``diff_harnesses`` is timed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from filare.models.harness import Harness
+from filare.models.harness_diff import diff_harnesses
+from filare.models.metadata import Metadata
+from filare.models.notes import Notes
+from filare.models.options import PageOptions
+
+WIRES = 10
+
+
+def synthetic_harness(connections: int, revision: int) -> Harness:
+    harness = Harness(
+        metadata=Metadata(
+            title="bench",
+            pn="bench",
+            company="",
+            address="",
+            output_dir=Path("."),
+            output_name="bench",
+            sheet_total=1,
+            sheet_current=1,
+            sheet_name="BENCH",
+            titlepage=Path("titlepage"),
+            output_names=["bench"],
+            files=[],
+            use_qty_multipliers=False,
+            multiplier_file_name="qty.txt",
+        ),
+        options=PageOptions(),
+        notes=Notes(),
+    )
+    groups = max(connections // WIRES, 1)
+    for idx in range(groups):
+        left, right, cable = f"X{idx}A", f"X{idx}B", f"W{idx}"
+        pn = f"CON-{idx % 50}" if revision == 0 or idx % 97 else "CON-NEW"
+        harness.add_connector_model({"designator": left, "pincount": WIRES, "pn": pn})
+        harness.add_connector_model({"designator": right, "pincount": WIRES})
+        if revision and idx == groups - 1:
+            continue
+        harness.add_cable_model(
+            {"designator": cable, "wirecount": WIRES, "colors": ["RD"] * WIRES}
+        )
+        for pin in range(1, WIRES + 1):
+            to_pin = WIRES + 1 - pin if revision and idx % 101 == 0 else pin
+            harness.connect(left, pin, cable, pin, right, to_pin)
+    harness.populate_bom()
+    return harness
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, nargs="+", default=[10000])
+    args = parser.parse_args()
+
+    print(f"{'connections':>11} {'changes':>8} {'time [s]':>9}")
+    for size in args.connections:
+        old, new = synthetic_harness(size, 0), synthetic_harness(size, 1)
+        start = time.perf_counter()
+        result = diff_harnesses(old, new)
+        elapsed = time.perf_counter() - start
+        print(f"{size:>11} {len(result.rows()):>8} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
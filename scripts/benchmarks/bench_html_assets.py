@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""Benchmark inline against shared CSS and image assets in HTML output.
+
+Usage:
+  uv run python scripts/benchmarks/bench_html_assets.py [--pages 100 500] [--image-kib 64] [--repeat 3]
+
+Writes ``--pages`` one-row cut pages and as many termination pages for a
+DIN 6771 sheet, as ``generate_html_output`` does for a paginated harness,
+plus ``--pages`` sheets embedding the same ``--image-kib`` PNG (a connector
+photo in every diagram), once with ``html_assets: inline`` and once with
+``html_assets: shared``. Reports the time and the bytes written per mode.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from filare.models.metadata import Metadata, PageTemplateConfig, PageTemplateTypes
+from filare.models.options import PageOptions
+from filare.render import html
+from filare.settings import settings
+
+
+def synthetic_metadata(output_dir: Path, sheets: int) -> Metadata:
+    return Metadata(
+        title="Bench harness",
+        pn="BENCH",
+        company="Acme",
+        address="1 Road",
+        output_dir=output_dir,
+        output_name="bench",
+        sheet_total=sheets,
+        sheet_current=1,
+        sheet_name="BENCH",
+        titlepage=output_dir / "titlepage",
+        output_names=["titlepage", "bench"],
+        files=[],
+        use_qty_multipliers=False,
+        multiplier_file_name="qty.txt",
+        template=PageTemplateConfig(name=PageTemplateTypes.din_6771),
+    )
+
+
+OPTIONS = PageOptions(
+    include_cut_diagram=True,
+    include_termination_diagram=True,
+    cut_rows_per_page=1,
+    termination_rows_per_page=1,
+)
+
+
+def write_pages(output_dir: Path, pages: int, sheet_page: str) -> None:
+    html._write_aux_pages(
+        output_dir / "bench",
+        synthetic_metadata(output_dir, pages),
+        OPTIONS,
+        {},
+        cut_rows=[{"wire": f"W{idx}", "color": "RD"} for idx in range(pages)],
+        termination_rows=[{"source": f"X1:{idx}"} for idx in range(pages)],
+    )
+    for sheet in range(pages):
+        html._write_page(
+            output_dir / f"sheet{sheet}.html",
+            sheet_page.replace("@SHEET@", str(sheet)),
+            OPTIONS,
+        )
+
+
+def synthetic_sheet_page(image: bytes) -> str:
+    """A sheet with the page CSS and an embedded image, numbered at ``@SHEET@``."""
+    settings.html_assets = "inline"
+    with tempfile.TemporaryDirectory(prefix="filare-bench-") as tmp:
+        write_pages(Path(tmp), 1, "")
+        page = next(Path(tmp).glob("bench.cut*.html")).read_text(encoding="utf-8")
+    style = page[page.index("<style") : page.rindex("</style>") + len("</style>")]
+    data_uri = f"data:image/png;base64, {base64.b64encode(image).decode()}"
+    return (
+        f"<html><head>{style}</head><body>"
+        f'<svg><image xlink:href="{data_uri}" /></svg>@SHEET@</body></html>'
+    )
+
+
+def written_bytes(output_dir: Path) -> int:
+    return sum(path.stat().st_size for path in output_dir.rglob("*") if path.is_file())
+
+
+def best_of(repeat: int, func) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--image-kib", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sheet_page = synthetic_sheet_page(os.urandom(args.image_kib * 1024))
+    print(
+        f"{'pages':>6} {'mode':>7} {'time [ms]':>10} {'written [KiB]':>14} "
+        f"{'files':>6}"
+    )
+    for pages in args.pages:
+        for mode in ("inline", "shared"):
+            settings.html_assets = mode
+            with tempfile.TemporaryDirectory(prefix="filare-bench-") as tmp:
+                # a fresh directory per run, so shared assets are written each time
+                runs = iter(range(args.repeat))
+
+                def run() -> None:
+                    output_dir = Path(tmp) / str(next(runs))
+                    output_dir.mkdir()
+                    write_pages(output_dir, pages, sheet_page)
+
+                elapsed = best_of(args.repeat, run)
+                output_dir = Path(tmp) / "0"
+                files = sum(1 for path in output_dir.rglob("*") if path.is_file())
+                print(
+                    f"{pages:>6} {mode:>7} {elapsed * 1e3:>10.1f} "
+                    f"{written_bytes(output_dir) / 1024:>14.0f} {files:>6}"
+                )
+
+
+if __name__ == "__main__":
+    main()
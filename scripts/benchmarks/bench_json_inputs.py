@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""Benchmark JSON against YAML harness inputs and document representations.
+
+Usage:
+  uv run python scripts/benchmarks/bench_json_inputs.py [--segments 10 100 1000] [--repeat 5]
+
+Writes the same synthetic harness (a chain of 10-pin connectors joined by
+cables, as ``--segments`` connection sets, with every component spelled out
+as a generator would) as YAML and as JSON, and times parsing each through
+``parse_concat_merge_files``. Then times writing and reading back the document
+representation of a harness of that size in both formats.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import yaml
+
+from filare.models.document import DocumentHashRegistry, DocumentRepresentation
+from filare.models.page import HarnessPage, PageType, TitlePage
+from filare.parser import parse_concat_merge_files
+
+PINS = 10
+
+
+def synthetic_harness(segments: int) -> Dict[str, Any]:
+    pins = list(range(1, PINS + 1))
+    connectors = {
+        f"X{idx}": {
+            "type": "Molex Micro-Fit",
+            "subtype": "female",
+            "pn": f"43025-{idx:04d}",
+            "pinlabels": [f"P{pin}" for pin in pins],
+        }
+        for idx in range(segments + 1)
+    }
+    cables = {
+        f"W{idx}": {
+            "gauge": "0.25 mm2",
+            "length": 0.5,
+            "color_code": "DIN",
+            "wirecount": PINS,
+            "shield": True,
+        }
+        for idx in range(segments)
+    }
+    connections = [
+        [{f"X{idx}": pins}, {f"W{idx}": pins}, {f"X{idx + 1}": pins}]
+        for idx in range(segments)
+    ]
+    return {
+        "metadata": {"title": "bench", "pn": "bench"},
+        "connectors": connectors,
+        "cables": cables,
+        "connections": connections,
+    }
+
+
+def synthetic_document(harness: Dict[str, Any]) -> DocumentRepresentation:
+    return DocumentRepresentation(
+        metadata=harness["metadata"],
+        pages=[
+            TitlePage(type=PageType.title, name="titlepage"),
+            HarnessPage(type=PageType.harness, name="bench", formats=["svg"]),
+        ],
+        extras={"components": {**harness["connectors"], **harness["cables"]}},
+    )
+
+
+def best_of(repeat: int, func) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def round_trip(doc: DocumentRepresentation, path: Path) -> None:
+    doc.to_yaml(path)
+    loaded = DocumentRepresentation.from_yaml(path)
+    registry = DocumentHashRegistry(path.with_name(f"document_hashes{path.suffix}"))
+    registry.add(path.name, loaded.compute_hash())
+    registry.save()
+    registry.load()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'segments':>10} {'parse yaml (s)':>15} {'parse json (s)':>15} "
+        f"{'speedup':>8} {'doc yaml (s)':>13} {'doc json (s)':>13} {'speedup':>8}"
+    )
+    with tempfile.TemporaryDirectory(prefix="filare-bench-") as tmp:
+        for segments in args.segments:
+            harness = synthetic_harness(segments)
+            yaml_file = Path(tmp) / f"bench{segments}.yml"
+            json_file = Path(tmp) / f"bench{segments}.json"
+            yaml_file.write_text(yaml.safe_dump(harness, sort_keys=False))
+            json_file.write_text(json.dumps(harness))
+            assert parse_concat_merge_files([yaml_file], []) == (
+                parse_concat_merge_files([json_file], [])
+            )
+            parse_yaml = best_of(
+                args.repeat, lambda: parse_concat_merge_files([yaml_file], [])
+            )
+            parse_json = best_of(
+                args.repeat, lambda: parse_concat_merge_files([json_file], [])
+            )
+
+            doc = synthetic_document(harness)
+            doc_yaml = Path(tmp) / f"bench{segments}.document.yaml"
+            doc_json = Path(tmp) / f"bench{segments}.document.json"
+            dump_yaml = best_of(args.repeat, lambda: round_trip(doc, doc_yaml))
+            dump_json = best_of(args.repeat, lambda: round_trip(doc, doc_json))
+            print(
+                f"{segments:>10} {parse_yaml:>15.4f} {parse_json:>15.4f} "
+                f"{parse_yaml / parse_json:>8.1f} {dump_yaml:>13.4f} "
+                f"{dump_json:>13.4f} {dump_yaml / dump_json:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""Benchmark netlist construction and continuity queries.
+
+Usage:
+  uv run python scripts/benchmarks/bench_netlist.py [--pins 2000] [--queries 50000]
+
+Builds a synthetic harness of 10-pin connectors chained by cables (so nets
+span several cables), then times ``Harness.netlist`` and ``--queries`` random
+``connected()`` checks. For comparison, a sample of the same checks is run by
+scanning every cable connection (what ad-hoc code had to do before).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from filare.models.harness import Harness
+from filare.models.metadata import Metadata
+from filare.models.notes import Notes
+from filare.models.options import PageOptions
+
+PINS_PER_CONNECTOR = 10
+
+
+def synthetic_harness(pins: int) -> Harness:
+    harness = Harness(
+        metadata=Metadata(
+            title="bench",
+            pn="bench",
+            company="",
+            address="",
+            output_dir=Path("."),
+            output_name="bench",
+            sheet_total=1,
+            sheet_current=1,
+            sheet_name="BENCH",
+            titlepage=Path("titlepage"),
+            output_names=["bench"],
+            files=[],
+            use_qty_multipliers=False,
+            multiplier_file_name="qty.txt",
+        ),
+        options=PageOptions(),
+        notes=Notes(),
+    )
+    count = max(pins // PINS_PER_CONNECTOR, 2)
+    for idx in range(count):
+        harness.add_connector_model(
+            {"designator": f"X{idx}", "pincount": PINS_PER_CONNECTOR}
+        )
+    for idx in range(count - 1):
+        harness.add_cable_model(
+            {
+                "designator": f"W{idx}",
+                "wirecount": PINS_PER_CONNECTOR,
+                "colors": ["RD"] * PINS_PER_CONNECTOR,
+            }
+        )
+        for pin in range(1, PINS_PER_CONNECTOR + 1):
+            # break every fifth chain so there are several nets per pin position
+            if idx % 5 != 4:
+                harness.connect(f"X{idx}", pin, f"W{idx}", pin, f"X{idx + 1}", pin)
+    return harness
+
+
+def scan_connected(harness: Harness, a, b) -> bool:
+    """Reference check: breadth-first search over all cable connections."""
+    neighbours = defaultdict(set)
+    for cable in harness.cables.values():
+        for connection in cable._connections:
+            wire = (cable.designator, str(connection.via.id))
+            for pin in (connection.from_, connection.to):
+                if pin is not None:
+                    node = (pin.parent, str(pin.id))
+                    neighbours[node].add(wire)
+                    neighbours[wire].add(node)
+    seen, todo = {a}, [a]
+    while todo:
+        node = todo.pop()
+        if node == b:
+            return True
+        for other in neighbours[node] - seen:
+            seen.add(other)
+            todo.append(other)
+    return False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pins", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=50000)
+    parser.add_argument("--scan-queries", type=int, default=100)
+    args = parser.parse_args()
+
+    harness = synthetic_harness(args.pins)
+    pins = [
+        (designator, str(pin))
+        for designator, connector in harness.connectors.items()
+        for pin in connector.pin_objects
+    ]
+    rng = random.Random(0)
+    queries = [(rng.choice(pins), rng.choice(pins)) for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    netlist = harness.netlist
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    joined = sum(netlist.connected(a, b) for a, b in queries)
+    indexed = time.perf_counter() - start
+
+    sample = queries[: args.scan_queries]
+    start = time.perf_counter()
+    for a, b in sample:
+        assert scan_connected(harness, a, b) == netlist.connected(a, b)
+    scanned = (time.perf_counter() - start) / max(len(sample), 1) * len(queries)
+
+    print(f"pins: {len(pins)}, nets: {len(netlist)}, joined pairs: {joined}")
+    print(f"{'step':>22} {'time [s]':>9}")
+    print(f"{'netlist build':>22} {build:>9.4f}")
+    print(f"{'indexed queries':>22} {indexed:>9.4f}")
+    print(f"{'scan queries (est.)':>22} {scanned:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""Benchmark NumberAndUnit parsing and arithmetic as used by BOM aggregation.
+
+Usage:
+  uv run python scripts/benchmarks/bench_number_arithmetic.py [--entries 10000 100000]
+
+Each entry parses a length string, is scaled by a harness multiplier and is
+summed into a per-unit total, which mirrors ``_scale_qty``, ``__add__`` and
+``scale_per_harness`` when shared BOMs are merged.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from filare.models.numbers import NumberAndUnit
+
+LENGTHS = [f"{length} m" for length in (0.2, 0.5, 1, 1.5, 2, 3, 5)]
+
+
+def aggregate(count: int, seed: int = 0) -> NumberAndUnit:
+    rng = random.Random(seed)
+    total = NumberAndUnit(0, "m")
+    for _ in range(count):
+        qty = NumberAndUnit.to_number_and_unit(rng.choice(LENGTHS))
+        qty *= rng.randint(1, 4)
+        total += qty
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'entries':>10} {'time (s)':>10} {'total':>16}")
+    for count in args.entries:
+        start = time.perf_counter()
+        total = aggregate(count)
+        elapsed = time.perf_counter() - start
+        print(f"{count:>10} {elapsed:>10.3f} {str(total):>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""Benchmark bundling many HTML sheets into one PDF.
+
+Usage:
+  uv run python scripts/benchmarks/bench_pdf_bundle.py [--pages 10 50 150] [--image-kib 256] [--repeat 3]
+
+Writes ``--pages`` sheets that each show the same company logo (a PNG file)
+and the same connector photo (a ``--image-kib`` PNG embedded as a data URI,
+as ``embed_svg_images`` does) next to some text. Times the bundle written by
+``generate_pdf_output``, whose pages share one font configuration and image
+cache, against rendering every page with its own, and reports both PDF sizes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import io
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, List, cast
+
+from PIL import Image
+from weasyprint import HTML
+
+from filare.render.pdf import generate_pdf_output
+
+
+def png_bytes(kib: int) -> bytes:
+    side = max(8, int((kib * 1024 / 3) ** 0.5))
+    image = Image.frombytes("RGB", (side, side), os.urandom(side * side * 3))
+    data = io.BytesIO()
+    image.save(data, format="PNG")
+    return data.getvalue()
+
+
+def write_sheets(output_dir: Path, pages: int, image_kib: int) -> List[Path]:
+    (output_dir / "logo.png").write_bytes(png_bytes(16))
+    photo = base64.b64encode(png_bytes(image_kib)).decode()
+    sheets = []
+    for page in range(pages):
+        sheet = output_dir / f"sheet{page}"
+        sheet.with_suffix(".html").write_text(
+            "<!DOCTYPE html><html><body>"
+            f'<img src="logo.png" style="width:30mm"><h1>Sheet {page}</h1>'
+            f'<svg width="200pt" height="200pt"><image width="200" height="200" '
+            f'xlink:href="data:image/png;base64, {photo}"/></svg>'
+            f"<p>{'Connector X1 pin 1 to cable W1 wire 1. ' * 40}</p>"
+            "</body></html>",
+            encoding="utf-8",
+        )
+        sheets.append(sheet)
+    return sheets
+
+
+def unshared_bundle(sheets: List[Path], output_path: Path) -> None:
+    """The bundle as written before pages shared fonts and images."""
+    documents = [HTML(sheet.with_suffix(".html")).render() for sheet in sheets]
+    pages = [page for document in documents for page in document.pages]
+    cast(Any, documents[0]).copy(pages).write_pdf(output_path)
+
+
+def best_of(repeat: int, func) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 50, 150])
+    parser.add_argument("--image-kib", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'pages':>6} {'unshared [s]':>13} {'shared [s]':>11} "
+        f"{'unshared [KiB]':>15} {'shared [KiB]':>13}"
+    )
+    for pages in args.pages:
+        with tempfile.TemporaryDirectory(prefix="filare-bench-") as tmp:
+            sheets = write_sheets(Path(tmp), pages, args.image_kib)
+            unshared_pdf = Path(tmp) / "unshared.pdf"
+            shared_pdf = Path(tmp) / f"{Path(tmp).name}.pdf"
+            unshared = best_of(
+                args.repeat, lambda: unshared_bundle(sheets, unshared_pdf)
+            )
+            shared = best_of(args.repeat, lambda: generate_pdf_output(sheets))
+            print(
+                f"{pages:>6} {unshared:>13.2f} {shared:>11.2f} "
+                f"{unshared_pdf.stat().st_size / 1024:>15.0f} "
+                f"{shared_pdf.stat().st_size / 1024:>13.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
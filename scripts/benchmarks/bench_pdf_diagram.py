@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""Benchmark PDF pages with vector against raster diagrams.
+
+Usage:
+  uv run python scripts/benchmarks/bench_pdf_diagram.py [--elements 500 5000 20000] [--pages 4] [--dpi 150] [--repeat 3]
+
+Writes ``--pages`` sheets whose diagram is an SVG of ``--elements`` paths and
+labels (about the size of a Graphviz harness diagram with that many
+elements), together with a PNG of the same size at ``--dpi`` standing in for
+the raster diagram Graphviz renders. Times ``generate_pdf_output`` over the
+sheets with ``pdf_diagram: vector`` and ``pdf_diagram: raster`` and reports
+the time per page and the PDF size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from PIL import Image
+
+from filare.render.pdf import generate_pdf_output
+from filare.render.pdf_diagram import print_png_path
+from filare.settings import settings
+
+WIDTH_PT, HEIGHT_PT = 1000, 600
+
+
+def synthetic_svg(elements: int) -> str:
+    shapes = []
+    for idx in range(elements // 2):
+        x, y = (idx * 37) % WIDTH_PT, (idx * 17) % HEIGHT_PT
+        shapes.append(
+            f'<path fill="none" stroke="#000" d="M{x},{y}C{x + 20},{y + 5} '
+            f'{x + 40},{y - 5} {x + 60},{y}"/>'
+            f'<text x="{x}" y="{y}" font-size="6">W{idx}</text>'
+        )
+    return (
+        f'<svg width="{WIDTH_PT}pt" height="{HEIGHT_PT}pt" '
+        f'viewBox="0 0 {WIDTH_PT} {HEIGHT_PT}"><g>{"".join(shapes)}</g></svg>'
+    )
+
+
+def write_sheets(output_dir: Path, pages: int, elements: int, dpi: int) -> List[Path]:
+    svg = synthetic_svg(elements)
+    size = (WIDTH_PT * dpi // 72, HEIGHT_PT * dpi // 72)
+    sheets = []
+    for page in range(pages):
+        sheet = output_dir / f"sheet{page}"
+        sheet.with_suffix(".html").write_text(
+            "<!DOCTYPE html><html><body>"
+            f'<div id="diagram" class="diagram-default">{svg}</div>'
+            "</body></html>",
+            encoding="utf-8",
+        )
+        Image.new("RGB", size, "white").save(print_png_path(sheet))
+        sheets.append(sheet)
+    return sheets
+
+
+def best_of(repeat: int, func) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--elements", type=int, nargs="+", default=[500, 5000, 20000])
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    settings.pdf_diagram_dpi = args.dpi
+
+    print(f"{'elements':>9} {'mode':>7} {'per page [ms]':>14} {'pdf [KiB]':>10}")
+    for elements in args.elements:
+        with tempfile.TemporaryDirectory(prefix="filare-bench-") as tmp:
+            sheets = write_sheets(Path(tmp), args.pages, elements, args.dpi)
+            for mode in ("vector", "raster"):
+                settings.pdf_diagram = mode
+                elapsed = best_of(args.repeat, lambda: generate_pdf_output(sheets))
+                pdf = Path(tmp) / f"{Path(tmp).name}.pdf"
+                print(
+                    f"{elements:>9} {mode:>7} {elapsed / args.pages * 1e3:>14.1f} "
+                    f"{pdf.stat().st_size / 1024:>10.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""Benchmark the staged document build pipeline against a serial loop.
+
+Usage:
+  uv run python scripts/benchmarks/bench_stage_pipeline.py [--sheets 20] [--layout-workers 1 4]
+
+Sheets go through the stages of ``filare run``: parsing (CPU-bound Python),
+Graphviz layout (a subprocess, simulated by a sleep that releases the GIL
+like waiting on ``dot`` does) and writing (CPU-bound Python, only once all
+sheets were parsed). Stage costs are set in milliseconds per sheet.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from filare.flows.pipeline import Pipeline, Stage
+
+
+def _spin(ms: float) -> None:
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sheets", type=int, default=20)
+    parser.add_argument("--parse-ms", type=float, default=30)
+    parser.add_argument("--layout-ms", type=float, default=60)
+    parser.add_argument("--write-ms", type=float, default=10)
+    parser.add_argument("--layout-workers", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    def parse(sheet):
+        _spin(args.parse_ms)
+        return sheet
+
+    def layout(sheet):
+        time.sleep(args.layout_ms / 1000)
+        return sheet
+
+    def write(sheet):
+        _spin(args.write_ms)
+        return sheet
+
+    sheets = range(args.sheets)
+    start = time.perf_counter()
+    for sheet in sheets:
+        write(layout(parse(sheet)))
+    serial = time.perf_counter() - start
+
+    print(f"{'mode':>20} {'time (s)':>10} {'speedup':>8}")
+    print(f"{'serial':>20} {serial:>10.3f} {1:>8.2f}")
+    for workers in args.layout_workers:
+        pipeline = Pipeline(
+            [
+                Stage("parse", parse),
+                Stage("layout", layout, workers=workers),
+                Stage("write", write, after="parse"),
+            ]
+        )
+        start = time.perf_counter()
+        pipeline.run(sheets)
+        elapsed = time.perf_counter() - start
+        label = f"pipeline x{workers}"
+        print(f"{label:>20} {elapsed:>10.3f} {serial / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
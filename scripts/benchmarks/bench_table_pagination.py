@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""Benchmark BOM table pagination.
+
+Usage:
+  uv run python scripts/benchmarks/bench_table_pagination.py [--rows 1000 5000]
+
+Times ``BomRender.paginate`` (HTML for every page) and the row-only
+``paginate_table`` split for synthetic BOMs of ``--rows`` lines.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from filare.models.bom import BomRender
+from filare.models.table_models import TablePaginationOptions, paginate_table
+
+HEADER = ["#", "Qty", "Unit", "Description", "Designators"]
+COLUMNS_CLASS = [
+    "bom_col_id",
+    "bom_col_qty",
+    "bom_col_unit",
+    "bom_col_description",
+    "bom_col_designators",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--rows-per-page", type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{'rows':>6} {'pages':>6} {'split [ms]':>11} {'html [ms]':>10}")
+    for count in args.rows:
+        rows = [
+            [str(idx), "1", "m", f"Wire, 0.25 mm2, color {idx}", f"W{idx}"]
+            for idx in range(count)
+        ]
+        render = BomRender(HEADER, rows, columns_class=COLUMNS_CLASS)
+        start = time.perf_counter()
+        chunks = paginate_table(rows, args.rows_per_page)
+        split = (time.perf_counter() - start) * 1e3
+        start = time.perf_counter()
+        render.paginate(TablePaginationOptions(rows_per_page=args.rows_per_page))
+        html = (time.perf_counter() - start) * 1e3
+        print(f"{count:>6} {len(chunks):>6} {split:>11.2f} {html:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Benchmark text_overlap.compute_overlaps against the pairwise reference.
+
+Usage:
+  uv run python scripts/benchmarks/bench_text_overlap.py [--sizes 1000 10000 100000]
+
+Nodes are laid out like table cells (rows of fixed-height text with a small
+random jitter), which is the dense case seen on BOM and pin table pages. The
+pairwise reference is skipped above ``--bruteforce-limit`` nodes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List
+
+from filare.tools.text_overlap import (
+    Node,
+    Rect,
+    compute_overlaps,
+    compute_overlaps_bruteforce,
+)
+
+
+def synthetic_nodes(count: int, seed: int = 0) -> List[Node]:
+    rng = random.Random(seed)
+    columns = 8
+    nodes: List[Node] = []
+    for idx in range(count):
+        row, col = divmod(idx, columns)
+        nodes.append(
+            Node(
+                text=f"cell {idx}",
+                rect=Rect(
+                    x=col * 120 + rng.uniform(-3, 3),
+                    y=row * 14 + rng.uniform(-2, 2),
+                    width=rng.uniform(30, 118),
+                    height=12,
+                ),
+                tag="TD",
+                id_attr="",
+                classes=[],
+            )
+        )
+    return nodes
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--bruteforce-limit", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>8} {'overlaps':>9} {'grid [s]':>10} {'pairwise [s]':>13}")
+    for size in args.sizes:
+        nodes = synthetic_nodes(size)
+        grid_time, overlaps = _timed(compute_overlaps, nodes, 1.0, 2.0)
+        pairwise = "skipped"
+        if size <= args.bruteforce_limit:
+            pairwise_time, reference = _timed(
+                compute_overlaps_bruteforce, nodes, 1.0, 2.0
+            )
+            assert len(reference) == len(overlaps)
+            pairwise = f"{pairwise_time:.3f}"
+        print(f"{size:>8} {len(overlaps):>9} {grid_time:>10.3f} {pairwise:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,32 @@
 """Filare CLI package powered by Typer."""
 
 # Pre-load submodules to avoid circular imports when initializing the CLI.
+import filare.cli.cache as _cache  # noqa: F401
+import filare.cli.compile_harness as _compile_harness  # noqa: F401
+import filare.cli.diff as _diff  # noqa: F401
 import filare.cli.drawio as _drawio  # noqa: F401
 import filare.cli.interface as _interface  # noqa: F401
 import filare.cli.interface_config as _interface_config  # noqa: F401
+import filare.cli.merge_shards as _merge_shards  # noqa: F401
 import filare.cli.metadata as _metadata  # noqa: F401
+import filare.cli.netlist as _netlist  # noqa: F401
 import filare.cli.overlap as _overlap  # noqa: F401
 import filare.cli.qty as _qty  # noqa: F401
 import filare.cli.render as _render  # noqa: F401
 import filare.cli.examples as _examples  # noqa: F401
 from filare.cli.main import (
     app,
+    cache,
     cli,
+    compile_harness,
+    diff,
     drawio,
     examples,
     interface,
     interface_config,
+    merge_shards,
     metadata,
+    netlist,
     overlap,
     qty,
     render_callback,
@@ -35,4 +45,9 @@ __all__ = [
     "interface",
     "interface_config",
     "overlap",
+    "cache",
+    "netlist",
+    "diff",
+    "merge_shards",
+    "compile_harness",
 ]
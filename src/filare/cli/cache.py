@@ -0,0 +1,61 @@
+"""Typer command group to inspect and prune the Graphviz layout cache."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import typer
+
+from filare.render.layout_cache import LayoutCache, default_cache_dir
+from filare.settings import resolve_settings, typer_kwargs
+
+cache_app = typer.Typer(
+    help="Inspect and prune the Graphviz layout cache.",
+    context_settings={"help_option_names": ["-h", "--help"]},
+    **typer_kwargs(),
+)
+
+
+def _layout_cache() -> LayoutCache:
+    resolved = resolve_settings()
+    return LayoutCache(
+        resolved.layout_cache_dir or default_cache_dir(),
+        resolved.layout_cache_max_mb * 1024 * 1024,
+    )
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+@cache_app.command("stats")
+def stats_command() -> None:
+    """Show the location, entry count and size of the layout cache."""
+    stats = _layout_cache().stats()
+    typer.echo(f"directory: {stats.directory}")
+    typer.echo(f"entries:   {stats.entries}")
+    typer.echo(f"size:      {_mb(stats.total_bytes)} / {_mb(stats.max_bytes)}")
+
+
+@cache_app.command("prune")
+def prune_command(
+    max_mb: Optional[float] = typer.Option(
+        None,
+        "--max-mb",
+        help="Evict least recently used entries down to this size (default: configured bound).",
+    ),
+    clear: bool = typer.Option(False, "--all", help="Remove every cached layout."),
+) -> None:
+    """Evict least recently used layouts until the cache fits its size bound."""
+    cache = _layout_cache()
+    if clear:
+        limit: Optional[int] = 0
+    elif max_mb is not None:
+        limit = int(max_mb * 1024 * 1024)
+    else:
+        limit = None
+    removed = cache.prune(limit)
+    stats = cache.stats()
+    typer.echo(
+        f"Removed {removed} entries; {stats.entries} left ({_mb(stats.total_bytes)})."
+    )
@@ -0,0 +1,86 @@
+"""Typer command writing compiled harness artifacts for fast reloads."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from filare.flows import compile_harness
+from filare.flows.compiled_harness import compiled_path
+from filare.settings import typer_kwargs
+
+compile_app = typer.Typer(
+    help="Compile harness YAML into binary artifacts that later builds load "
+    "instead of parsing the YAML again.",
+    context_settings={
+        "help_option_names": ["-h", "--help"],
+        "allow_interspersed_args": True,
+    },
+    **typer_kwargs(),
+)
+
+
+@compile_app.callback(invoke_without_command=True)
+def compile_files(
+    files: List[Path] = typer.Argument(
+        ...,
+        exists=True,
+        readable=True,
+        dir_okay=False,
+        help="YAML harness files to compile.",
+    ),
+    components: List[Path] = typer.Option(
+        [],
+        "-c",
+        "--components",
+        exists=True,
+        readable=True,
+        file_okay=True,
+        dir_okay=False,
+        help="YAML file containing component templates prepended to each harness (optional).",
+    ),
+    metadata: List[Path] = typer.Option(
+        [],
+        "-d",
+        "--metadata",
+        exists=True,
+        readable=True,
+        file_okay=True,
+        dir_okay=False,
+        help="YAML file containing metadata/options merged into each harness (optional).",
+    ),
+    output_dir: Optional[Path] = typer.Option(
+        None,
+        "-o",
+        "--output-dir",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Directory for the artifacts; use the output directory of the later "
+        "builds (default: input file directory).",
+    ),
+    output_name: Optional[str] = typer.Option(
+        None,
+        "-O",
+        "--output-name",
+        help="Output name the later builds use, if different from the input file name.",
+    ),
+) -> None:
+    """Compile each harness file; builds with the same inputs then load it.
+
+    With the `compiled_harness` setting enabled, an artifact is used by
+    `filare run` (and the other commands building a harness) as long as none
+    of its input, component and metadata files nor the Filare sources
+    changed; otherwise the YAML is parsed again.
+    """
+    for harness_file in sorted(files):
+        compiled = compile_harness(
+            [*components, harness_file], metadata, output_name=output_name
+        )
+        path = compiled.write(compiled_path(harness_file, output_dir))
+        typer.echo(
+            f"Compiled {harness_file} -> {path} ({len(compiled.connectors)} "
+            f"connectors, {len(compiled.cables)} cables)"
+        )
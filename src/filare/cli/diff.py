@@ -0,0 +1,77 @@
+"""Typer command comparing two revisions of a harness."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List, Literal, Optional
+
+import typer
+
+from filare.flows import load_harness
+from filare.models.harness_diff import diff_harnesses
+from filare.settings import typer_kwargs
+
+DiffFormat = Literal["table", "json"]
+
+diff_app = typer.Typer(
+    help="Compare connectors, cables, wires, connections and BOM of two harnesses.",
+    context_settings={
+        "help_option_names": ["-h", "--help"],
+        "allow_interspersed_args": True,
+    },
+    **typer_kwargs(),
+)
+
+
+@diff_app.callback(invoke_without_command=True)
+def diff(
+    old: Path = typer.Argument(
+        ..., exists=True, readable=True, dir_okay=False, help="Old harness YAML."
+    ),
+    new: Path = typer.Argument(
+        ..., exists=True, readable=True, dir_okay=False, help="New harness YAML."
+    ),
+    components: List[Path] = typer.Option(
+        [],
+        "-c",
+        "--components",
+        exists=True,
+        readable=True,
+        dir_okay=False,
+        help="Component YAML files merged before both harnesses.",
+    ),
+    metadata: List[Path] = typer.Option(
+        [],
+        "-d",
+        "--metadata",
+        exists=True,
+        readable=True,
+        dir_okay=False,
+        help="Metadata YAML files merged with both harnesses.",
+    ),
+    fmt: DiffFormat = typer.Option("table", "-f", "--format", help="Output format."),
+    output: Optional[Path] = typer.Option(
+        None, "-o", "--output", help="Output file (default: stdout)."
+    ),
+    exit_code: bool = typer.Option(
+        False, "--exit-code", help="Exit with status 1 when the harnesses differ."
+    ),
+) -> None:
+    """Report added, removed and changed items and BOM quantity deltas."""
+    harness_diff = diff_harnesses(
+        load_harness([*components, old], metadata),
+        load_harness([*components, new], metadata),
+    )
+    if fmt == "json":
+        text = json.dumps(harness_diff.record(), ensure_ascii=False, indent=2)
+    elif harness_diff:
+        text = harness_diff.as_table()
+    else:
+        text = "No differences."
+    if output is None:
+        typer.echo(text)
+    else:
+        output.write_text(text + "\n", encoding="utf-8")
+    if exit_code and harness_diff:
+        raise typer.Exit(code=1)
@@ -10,7 +10,7 @@ import typer
 from filare.tools import build_examples
 
 _DEFAULT_GROUPS = list(build_examples.groups.keys())
-_ACTIONS = {"build", "clean", "compare", "diff", "restore"}
+_ACTIONS = {"build", "clean", "snapshot", "compare", "diff", "restore"}
 
 examples_app = typer.Typer(
     add_completion=True,
@@ -48,7 +48,8 @@ def examples(
         "build",
         "-a",
         "--action",
-        help="Action to perform (build, clean; other values are reserved).",
+        help="Action to perform (build, clean, snapshot, compare, diff; "
+        "restore is reserved).",
         show_default=True,
     ),
     groups: List[str] = typer.Option(
@@ -69,14 +70,34 @@ def examples(
         resolve_path=True,
         help="Optional base directory for generated outputs (defaults to in-place).",
     ),
+    jobs: int = typer.Option(
+        0,
+        "-j",
+        "--jobs",
+        min=0,
+        help="Groups built in parallel (0: one per CPU).",
+        show_default=True,
+    ),
 ) -> None:
     """Invoke the example builder with the same semantics as the tooling script."""
     validated_action = _validate_action(action)
     selected_groups = _validate_groups(groups or _DEFAULT_GROUPS)
 
     if validated_action == "build":
-        build_examples.build_generated(selected_groups, output_base=output_dir)
+        build_examples.build_generated(
+            selected_groups, output_base=output_dir, jobs=jobs
+        )
     elif validated_action == "clean":
         build_examples.clean_generated(selected_groups)
-    # The other actions (compare/diff/restore) are accepted for compatibility
-    # but intentionally perform no work to mirror the legacy script behavior.
+    elif validated_action == "snapshot":
+        build_examples.snapshot_generated(selected_groups, output_base=output_dir)
+    elif validated_action in ("compare", "diff"):
+        changes = build_examples.compare_generated(
+            selected_groups,
+            output_base=output_dir,
+            verbose=validated_action == "diff",
+        )
+        if any(changes.values()):
+            raise typer.Exit(code=1)
+    # restore is accepted for compatibility but intentionally performs no work
+    # to mirror the legacy script behavior.
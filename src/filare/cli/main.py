@@ -7,11 +7,16 @@ from typing import Optional
 
 import typer
 
+import filare.cli.cache as cache_module
+import filare.cli.compile_harness as compile_module
+import filare.cli.diff as diff_module
 import filare.cli.drawio as drawio_module
 import filare.cli.examples as examples_module
 import filare.cli.interface as interface_module
 import filare.cli.interface_config as interface_config_module
+import filare.cli.merge_shards as merge_shards_module
 import filare.cli.metadata as metadata_module
+import filare.cli.netlist as netlist_module
 import filare.cli.overlap as overlap_module
 import filare.cli.qty as qty_module
 import filare.cli.render as render
@@ -65,6 +70,11 @@ app.add_typer(examples_module.examples_app, name="ex")
 app.add_typer(interface_module.interface_app, name="interface")
 app.add_typer(interface_config_module.interface_config_app, name="interface-config")
 app.add_typer(overlap_module.overlap_app, name="overlap")
+app.add_typer(cache_module.cache_app, name="cache")
+app.add_typer(netlist_module.netlist_app, name="netlist")
+app.add_typer(diff_module.diff_app, name="diff")
+app.add_typer(merge_shards_module.merge_shards_app, name="merge-shards")
+app.add_typer(compile_module.compile_app, name="compile")
 
 cli = app
 render_callback = render.render_callback
@@ -77,6 +87,12 @@ ex = examples_module.examples_app
 interface = interface_module.interface_app
 interface_config = interface_config_module.interface_config_app
 overlap = overlap_module.overlap_app
+cache = cache_module.cache_app
+netlist = netlist_module.netlist_app
+diff = diff_module.diff_app
+merge_shards = merge_shards_module.merge_shards_app
+# not named `compile` to keep the builtin usable in this module
+compile_harness = compile_module.compile_app
 harness = render.harness_app
 document = render.document_app
 page = render.page_app
@@ -0,0 +1,84 @@
+"""Typer command combining the shards of a `filare run --shard` document build."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from filare.cli.render import build_document_pages
+from filare.errors import ShardManifestError
+from filare.flows.shards import (
+    ShardManifest,
+    merge_shared_bom,
+    merged_sheets,
+    missing_outputs,
+)
+from filare.settings import typer_kwargs
+
+merge_shards_app = typer.Typer(
+    help="Combine shard manifests into the shared BOM, title page and PDF bundle.",
+    context_settings={
+        "help_option_names": ["-h", "--help"],
+        "allow_interspersed_args": True,
+    },
+    **typer_kwargs(),
+)
+
+
+@merge_shards_app.callback(invoke_without_command=True)
+def merge_shards(
+    manifests: List[Path] = typer.Argument(
+        ...,
+        exists=True,
+        readable=True,
+        dir_okay=False,
+        help="Shard manifests (shard-I-of-N.json) of every shard.",
+    ),
+    output_dir: Optional[Path] = typer.Option(
+        None,
+        "-o",
+        "--output-dir",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Directory holding the outputs of all shards "
+        "(default: directory of the first manifest).",
+    ),
+) -> None:
+    """Write the document pages that need every sheet, like a single run does."""
+    try:
+        loaded = [ShardManifest.load(path) for path in manifests]
+        sheets = merged_sheets(loaded)
+    except ShardManifestError as exc:
+        raise typer.BadParameter(str(exc), param_hint="MANIFESTS") from exc
+    resolved_output_dir = manifests[0].parent if output_dir is None else output_dir
+    missing = missing_outputs(sheets, resolved_output_dir)
+    if missing:
+        raise typer.BadParameter(
+            f"Shard outputs missing from {resolved_output_dir}: {', '.join(missing)}",
+            param_hint="--output-dir",
+        )
+
+    document = loaded[0].document
+    extra_metadata = loaded[0].extra_metadata(resolved_output_dir)
+    typer.echo(
+        f"Merging {len(loaded)} shards ({len(sheets)} sheets) "
+        f"into {resolved_output_dir}"
+    )
+    build_document_pages(
+        output_dir=resolved_output_dir,
+        output_formats=set(document["output_formats"]),
+        shared_bom=merge_shared_bom(sheets),
+        files=extra_metadata["files"],
+        use_qty_multipliers=document["use_qty_multipliers"],
+        multiplier_file_name=document["multiplier_file_name"],
+        titlepage_metadata_files=[
+            Path(path) for path in document["titlepage_metadata_files"]
+        ],
+        extra_metadata=extra_metadata,
+        create_titlepage=document["create_titlepage"],
+        single_page=document["single_page"],
+    )
+    typer.echo()  # blank line after execution
@@ -0,0 +1,112 @@
+"""Typer command group to query and export the nets of a harness."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import List, Literal, Optional
+
+import typer
+
+from filare.errors import PinResolutionError
+from filare.flows import load_harness
+from filare.models.netlist import (
+    Net,
+    Netlist,
+    write_netlist_csv,
+    write_netlist_json,
+)
+from filare.settings import typer_kwargs
+
+ExportFormat = Literal["csv", "json"]
+
+netlist_app = typer.Typer(
+    help="Query and export the electrical nets of a harness.",
+    context_settings={"help_option_names": ["-h", "--help"]},
+    **typer_kwargs(),
+)
+
+FILES_ARGUMENT = typer.Argument(
+    ...,
+    exists=True,
+    readable=True,
+    dir_okay=False,
+    help="Harness YAML file, optionally preceded by component files to merge.",
+)
+METADATA_OPTION = typer.Option(
+    [],
+    "-d",
+    "--metadata",
+    exists=True,
+    readable=True,
+    dir_okay=False,
+    help="Metadata YAML files merged with the harness.",
+)
+
+
+def _netlist(files: List[Path], metadata: List[Path]) -> Netlist:
+    return load_harness(files, metadata).netlist
+
+
+def _describe(net: Net) -> str:
+    return ", ".join(str(member) for member in net.members)
+
+
+@netlist_app.command("export")
+def export_command(
+    files: List[Path] = FILES_ARGUMENT,
+    metadata: List[Path] = METADATA_OPTION,
+    fmt: ExportFormat = typer.Option("csv", "-f", "--format", help="Export format."),
+    output: Optional[Path] = typer.Option(
+        None, "-o", "--output", help="Output file (default: stdout)."
+    ),
+) -> None:
+    """Write every net and its pins, wires and shields as CSV or JSON."""
+    netlist = _netlist(files, metadata)
+    writer = write_netlist_csv if fmt == "csv" else write_netlist_json
+    if output is None:
+        writer(sys.stdout, netlist)
+        return
+    with output.open("w", encoding="utf-8", newline="") as stream:
+        count = writer(stream, netlist)
+    typer.echo(f"Wrote {count} {'rows' if fmt == 'csv' else 'nets'} to {output}")
+
+
+@netlist_app.command("pin")
+def pin_command(
+    files: List[Path] = FILES_ARGUMENT,
+    metadata: List[Path] = METADATA_OPTION,
+    pins: List[str] = typer.Option(
+        ..., "-p", "--pin", help="Pin to look up, as DESIGNATOR:PIN (repeatable)."
+    ),
+) -> None:
+    """Show the net each pin belongs to."""
+    netlist = _netlist(files, metadata)
+    for pin in pins:
+        designator, _, pin_id = pin.partition(":")
+        try:
+            net = netlist.net_of(designator, pin_id)
+        except PinResolutionError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--pin") from exc
+        if net is None:
+            typer.echo(f"{pin}: not connected")
+        else:
+            typer.echo(f"{pin}: {net.name} ({_describe(net)})")
+
+
+@netlist_app.command("net")
+def net_command(
+    files: List[Path] = FILES_ARGUMENT,
+    metadata: List[Path] = METADATA_OPTION,
+    names: List[str] = typer.Option(
+        [], "-n", "--net", help="Only show these nets (default: all)."
+    ),
+) -> None:
+    """List the members of the harness nets."""
+    netlist = _netlist(files, metadata)
+    for name in names or [net.name for net in netlist]:
+        try:
+            net = netlist.net(name)
+        except KeyError:
+            raise typer.BadParameter(f"Unknown net {name}", param_hint="--net")
+        typer.echo(f"{net.name}: {_describe(net)}")
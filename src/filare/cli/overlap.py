@@ -88,6 +88,19 @@ def overlap(
         help="Path to overlap ignore config (YAML).",
         resolve_path=True,
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Number of parallel browser workers.",
+        show_default=True,
+    ),
+    cache: Optional[Path] = typer.Option(
+        None,
+        "--cache",
+        help="JSON cache of previous results; unchanged files are not re-checked.",
+        resolve_path=True,
+    ),
 ) -> None:
     """Proxy to the text overlap checker while reusing its parsing/formatting."""
     _ensure_playwright_ready()
@@ -103,6 +116,10 @@ def overlap(
         argv.extend(["--ignore-text", pattern])
     if config != Path(text_overlap.DEFAULT_IGNORE_CONFIG):
         argv.extend(["--config", str(config)])
+    if workers != 1:
+        argv.extend(["--workers", str(workers)])
+    if cache:
+        argv.extend(["--cache", str(cache)])
 
     exit_code = text_overlap.main(argv)
     if exit_code != 0:
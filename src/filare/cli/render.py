@@ -2,19 +2,26 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import List, Optional, Sequence, Set
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 import typer
 import yaml
 
 import filare.filare as wv
 from filare import APP_NAME, __version__
+from filare.errors import InvalidShardSpec
+from filare.flows import load_hash_registry
 from filare.flows.index_pages import build_pdf_bundle, build_titlepage
+from filare.flows.pipeline import Pipeline, Stage
+from filare.flows.shards import ShardManifest, ShardSheet, ShardSpec
 from filare.flows.shared_bom import build_shared_bom
 from filare.models.document import DocumentRepresentation
 from filare.models.page import PageBase, PageType
+from filare.render.layout_batch import DEFAULT_CHUNK_SIZE, LayoutBatch
 from filare.render.templates import get_template
+from filare.settings import resolve_settings
 
 format_codes = {
     "c": "csv",
@@ -24,6 +31,7 @@ format_codes = {
     "P": "pdf",
     "s": "svg",
     "t": "tsv",
+    "j": "jsonl",
     "b": "shared_bom",
 }
 format_name_to_code = {v: k for k, v in format_codes.items()}
@@ -121,6 +129,69 @@ def document_callback(ctx: typer.Context) -> None:
     ctx.obj["document_config"] = document_config
 
 
+def _layout_sheet(sheet_layout: Optional[LayoutBatch]) -> Optional[LayoutBatch]:
+    if sheet_layout is not None:
+        sheet_layout.layout_pending()
+    return sheet_layout
+
+
+def _write_sheet(sheet_layout: Optional[LayoutBatch]) -> None:
+    if sheet_layout is not None:
+        sheet_layout.write_pending()
+
+
+def _sheet_chunks(
+    files: Sequence[Path], workers: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> List[List[Tuple[int, Path]]]:
+    """Split the numbered sheets into at most ``workers`` consecutive chunks.
+
+    Each chunk shares one :class:`LayoutBatch`, so a layout worker lays out a
+    whole chunk with one ``dot`` run; chunks are capped at ``chunk_size``.
+    """
+    sheets = list(enumerate(files))
+    size = max(1, min(chunk_size, -(-len(sheets) // max(1, workers))))
+    return [sheets[start : start + size] for start in range(0, len(sheets), size)]
+
+
+def build_document_pages(
+    *,
+    output_dir: Path,
+    output_formats: Set[str],
+    shared_bom: Dict,
+    files: Sequence[Path],
+    use_qty_multipliers: bool,
+    multiplier_file_name: str,
+    titlepage_metadata_files: Sequence[Path],
+    extra_metadata: Dict,
+    create_titlepage: bool,
+    single_page: bool,
+) -> None:
+    """Write the shared BOM, title page and PDF bundle once all sheets exist."""
+    if "shared_bom" in output_formats:
+        build_shared_bom(
+            output_dir=output_dir,
+            shared_bom=shared_bom,
+            use_qty_multipliers=use_qty_multipliers,
+            files=tuple(files),
+            multiplier_file_name=multiplier_file_name,
+            formats=["tsv"] + [f for f in ("csv", "jsonl") if f in output_formats],
+        )
+
+    if ("html" in output_formats) and create_titlepage and not single_page:
+        build_titlepage(titlepage_metadata_files, extra_metadata, shared_bom)
+
+        if "pdf" in output_formats:
+            extra_metadata["titlepage"] = extra_metadata["titlepage"].with_stem(
+                f"{extra_metadata['titlepage'].stem}_for_pdf"
+            )
+            build_titlepage(
+                titlepage_metadata_files, extra_metadata, shared_bom, for_pdf=True
+            )
+
+    if "pdf" in output_formats and not single_page:
+        build_pdf_bundle([output_dir / p for p in extra_metadata["output_names"]])
+
+
 def _render_cli(
     files: Sequence[Path],
     formats: str,
@@ -135,6 +206,8 @@ def _render_cli(
     create_titlepage: bool = True,
     allowed_format_codes: Optional[set[str]] = None,
     single_page: bool = False,
+    draft: bool = False,
+    shard: Optional[ShardSpec] = None,
 ) -> None:
     if version:
         typer.echo(f"{APP_NAME} {__version__}")
@@ -148,6 +221,12 @@ def _render_cli(
     if allowed_format_codes is not None:
         selected_codes &= allowed_format_codes
     output_formats = {format_codes[f] for f in selected_codes if f in format_codes}
+    resolved = resolve_settings()
+    draft = draft or resolved.draft
+    if draft:
+        # drafts skip PNG, the title page and PDF bundling
+        output_formats -= {"png", "pdf"}
+        create_titlepage = False
     harness_output_formats = output_formats.copy()
     shared_bom = {}
     titlepage_metadata_files = tuple(metadata) if metadata else tuple(files_list)
@@ -171,56 +250,113 @@ def _render_cli(
     if "pdf" in harness_output_formats:
         harness_output_formats.remove("pdf")
 
-    for harness_file in files_list:
+    # one registry for all sheets, saved once at the end of the run
+    hash_registry = load_hash_registry(resolved_output_dir)
+
+    # with a shard, every sheet is parsed (for sheet numbers and BOM ids) but
+    # only the shard's own sheets are laid out and written
+    shard_sheets: List[Tuple[int, Path, Any, str]] = []
+
+    def parse_sheet(sheet: int, harness_file: Path, layout: LayoutBatch) -> None:
+        nonlocal shared_bom
         effective_output_name = output_name or harness_file.stem
+        owned = shard is None or shard.owns(sheet)
 
         typer.echo(f"Input file:   {harness_file}")
-        typer.echo(
-            "Output file:  "
-            f"{resolved_output_dir / effective_output_name}.[{'|'.join(output_formats)}]"
-        )
+        if owned:
+            typer.echo(
+                "Output file:  "
+                f"{resolved_output_dir / effective_output_name}.[{'|'.join(output_formats)}]"
+            )
 
         extra_metadata["sheet_name"] = effective_output_name.upper()
 
+        # the outputs are queued in the chunk's batch and laid out and written
+        # by the next pipeline stages; sheets of other shards are dropped
         ret = wv.parse(
             tuple(components_list) + (harness_file,),
             metadata_files=tuple(metadata),
-            return_types=("shared_bom"),
-            output_formats=list(harness_output_formats),
+            return_types=("shared_bom", "harness"),
+            output_formats=sorted(harness_output_formats),
             output_dir=resolved_output_dir,
             extra_metadata=extra_metadata,
             shared_bom=shared_bom,
             output_name_override=output_name,
             metadata_output_name=effective_output_name,
+            layout_batch=layout if owned else LayoutBatch(),
+            draft=draft,
+            hash_registry=hash_registry,
         )
         shared_bom = ret["shared_bom"]
         extra_metadata["sheet_current"] += 1
-
-    shared_bom_base = None
-    if "shared_bom" in output_formats:
-        shared_bom_base = build_shared_bom(
-            output_dir=resolved_output_dir,
-            shared_bom=shared_bom,
-            use_qty_multipliers=use_qty_multipliers,
-            files=tuple(files_list),
-            multiplier_file_name=multiplier_file_name,
-        )
-
-    if ("html" in output_formats) and create_titlepage and not single_page:
-        build_titlepage(titlepage_metadata_files, extra_metadata, shared_bom)
-
-        if "pdf" in output_formats:
-            extra_metadata["titlepage"] = extra_metadata["titlepage"].with_stem(
-                f"{extra_metadata['titlepage'].stem}_for_pdf"
-            )
-            build_titlepage(
-                titlepage_metadata_files, extra_metadata, shared_bom, for_pdf=True
+        if owned and shard is not None:
+            shard_sheets.append(
+                (sheet, harness_file, ret["harness"], effective_output_name)
             )
 
-    if "pdf" in output_formats and not single_page:
-        build_pdf_bundle(
-            [resolved_output_dir / p for p in extra_metadata["output_names"]]
+    def parse_chunk(chunk: List[Tuple[int, Path]]) -> Optional[LayoutBatch]:
+        chunk_layout = LayoutBatch()
+        for sheet, harness_file in chunk:
+            parse_sheet(sheet, harness_file, chunk_layout)
+        return chunk_layout if chunk_layout.pending else None
+
+    layout_workers = max(1, resolved.pipeline_layout_workers or os.cpu_count() or 1)
+    try:
+        Pipeline(
+            [
+                # sheets are parsed in order: they share the BOM and sheet counters
+                Stage("parse", parse_chunk),
+                Stage("layout", _layout_sheet, workers=layout_workers),
+                Stage(
+                    "write",
+                    _write_sheet,
+                    workers=max(1, resolved.pipeline_write_workers),
+                ),
+            ],
+            queue_size=resolved.pipeline_queue_size,
+        ).run(_sheet_chunks(files_list, layout_workers))
+    finally:
+        hash_registry.save()
+
+    if shard is not None:
+        # the shared BOM, title page and PDF are written by `filare merge-shards`
+        manifest = ShardManifest(
+            shard,
+            document={
+                "output_formats": sorted(output_formats),
+                "create_titlepage": create_titlepage,
+                "single_page": single_page,
+                "use_qty_multipliers": use_qty_multipliers,
+                "multiplier_file_name": multiplier_file_name,
+                "titlepage_metadata_files": list(titlepage_metadata_files),
+                "extra_metadata": {
+                    key: value
+                    for key, value in extra_metadata.items()
+                    if key != "output_dir"
+                },
+            },
+            sheets=[
+                ShardSheet.from_harness(*sheet, output_dir=resolved_output_dir)
+                for sheet in shard_sheets
+            ],
         )
+        path = manifest.write(resolved_output_dir / shard.manifest_name)
+        typer.echo(f"Shard {shard} manifest: {path}")
+        typer.echo()
+        return
+
+    build_document_pages(
+        output_dir=resolved_output_dir,
+        output_formats=output_formats,
+        shared_bom=shared_bom,
+        files=files_list,
+        use_qty_multipliers=use_qty_multipliers,
+        multiplier_file_name=multiplier_file_name,
+        titlepage_metadata_files=titlepage_metadata_files,
+        extra_metadata=extra_metadata,
+        create_titlepage=create_titlepage,
+        single_page=single_page,
+    )
 
     typer.echo()  # blank line after execution
 
@@ -238,6 +374,8 @@ def render_callback(
     multiplier_file_name: str = "quantity_multipliers.txt",
     create_titlepage: bool = True,
     allowed_format_codes: Optional[set[str]] = None,
+    draft: bool = False,
+    shard: Optional[ShardSpec] = None,
 ) -> None:
     """Direct entrypoint used by tests and internal tooling."""
     _render_cli(
@@ -252,6 +390,8 @@ def render_callback(
         multiplier_file_name=multiplier_file_name,
         create_titlepage=create_titlepage,
         allowed_format_codes=allowed_format_codes,
+        draft=draft,
+        shard=shard,
     )
 
 
@@ -325,8 +465,23 @@ def run(
         "--multiplier-file-name",
         help="Name of file used to fetch the qty_multipliers.",
     ),
+    draft: bool = typer.Option(
+        False,
+        "--draft",
+        help="Fast preview: no PNG, image embedding, title page or PDF; simplified diagram.",
+    ),
+    shard: Optional[str] = typer.Option(
+        None,
+        "--shard",
+        help="Render only sheets i, i+N, ... as shard i/N and write a shard manifest; "
+        "combine the shards with `filare merge-shards`.",
+    ),
 ) -> None:
     """Parse provided harness files and generate the specified outputs."""
+    try:
+        shard_spec = ShardSpec.parse(shard) if shard else None
+    except InvalidShardSpec as exc:
+        raise typer.BadParameter(str(exc), param_hint="--shard") from exc
     _render_cli(
         files=files,
         formats=formats,
@@ -337,6 +492,8 @@ def run(
         version=version,
         use_qty_multipliers=use_qty_multipliers,
         multiplier_file_name=multiplier_file_name,
+        draft=draft,
+        shard=shard_spec,
     )
 
 
@@ -404,6 +561,11 @@ def harness_render(
         "--multiplier-file-name",
         help="Name of file used to fetch the qty_multipliers.",
     ),
+    draft: bool = typer.Option(
+        False,
+        "--draft",
+        help="Fast preview: no PNG, image embedding, title page or PDF; simplified diagram.",
+    ),
 ) -> None:
     """Render harness-only outputs without title pages or PDF bundles."""
     allowed = {
@@ -413,8 +575,9 @@ def harness_render(
         "p",
         "s",
         "t",
+        "j",
         "b",
-    }  # csv, gv, html, png, svg, tsv, shared_bom
+    }  # csv, gv, html, png, svg, tsv, jsonl, shared_bom
     render_callback(
         files=files,
         formats=formats,
@@ -426,6 +589,7 @@ def harness_render(
         multiplier_file_name=multiplier_file_name,
         create_titlepage=False,
         allowed_format_codes=allowed,
+        draft=draft,
     )
 
 
@@ -494,6 +658,11 @@ def document_render(
         "--multiplier-file-name",
         help="Name of file used to fetch the qty_multipliers.",
     ),
+    draft: bool = typer.Option(
+        False,
+        "--draft",
+        help="Fast preview: no PNG, image embedding, title page or PDF; simplified diagram.",
+    ),
 ) -> None:
     """Render full documents including title page and optional PDF bundle."""
     formats_arg = formats
@@ -522,6 +691,7 @@ def document_render(
         use_qty_multipliers=use_qty_multipliers,
         multiplier_file_name=multiplier_file_name,
         create_titlepage=create_titlepage,
+        draft=draft,
     )
 
 
@@ -594,6 +764,11 @@ def page_render(
         dir_okay=False,
         help="Optional Page model YAML (type/formats) to drive rendering.",
     ),
+    draft: bool = typer.Option(
+        False,
+        "--draft",
+        help="Fast preview: no PNG, image embedding, title page or PDF; simplified diagram.",
+    ),
 ) -> None:
     """Render a single harness page without title page or PDF bundle."""
     page_model: Optional[PageBase] = None
@@ -634,6 +809,7 @@ def page_render(
         version=False,
         use_qty_multipliers=False,
         multiplier_file_name="quantity_multipliers.txt",
+        draft=draft,
     )
 
 
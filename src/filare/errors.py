@@ -102,6 +102,32 @@ class UnknownTemplateDesignator(FilareFlowException):
         super().__init__(f"Unknown template/designator '{template}'{suffix}")
 
 
+class InvalidShardSpec(FilareFlowException):
+    """Raised when a shard is not given as ``INDEX/COUNT``."""
+
+    def __init__(self, value: str):
+        self.value = value
+        super().__init__(
+            f"Invalid shard '{value}': expected INDEX/COUNT with 1 <= INDEX <= COUNT"
+        )
+
+
+class ShardManifestError(FilareFlowException):
+    """Raised when shard manifests cannot be merged into one document."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class CompiledHarnessError(FilareFlowException):
+    """Raised when a compiled harness artifact cannot be used."""
+
+    def __init__(self, path, reason: str):
+        self.path = path
+        self.reason = reason
+        super().__init__(f"Compiled harness {path}: {reason}")
+
+
 class InvalidNumberFormat(FilareModelException):
     """Raised when a number/unit string cannot be parsed."""
 
@@ -224,3 +250,10 @@ class UnsupportedModelOperation(FilareModelException):
 
     def __init__(self, operation: str):
         super().__init__(operation)
+
+
+class UnsupportedBomExportFormat(FilareRenderException):
+    """Raised when a BOM table export format is not known."""
+
+    def __init__(self, fmt: str):
+        super().__init__(f"Unsupported BOM export format: {fmt}")
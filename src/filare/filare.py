@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from filare.flows import build_harness_from_files
-from filare.models.document import DocumentRepresentation
+from filare.models.document import DocumentHashRegistry, DocumentRepresentation
 from filare.models.page import (
     BOMPage,
     CutPage,
@@ -16,6 +16,7 @@ from filare.models.page import (
     TerminationPage,
     TitlePage,
 )
+from filare.render.layout_batch import LayoutBatch
 
 
 def parse(
@@ -30,6 +31,9 @@ def parse(
     connector_view: str = "detailed",
     metadata_output_name: Optional[str] = None,
     update_shared_bom: bool = True,
+    layout_batch: Optional[LayoutBatch] = None,
+    draft: bool = False,
+    hash_registry: Optional[DocumentHashRegistry] = None,
 ) -> Any:
     """
     Wrapper to build and optionally render a Harness from YAML inputs.
@@ -47,6 +51,9 @@ def parse(
         connector_view=connector_view,
         metadata_output_name=metadata_output_name,
         update_shared_bom=update_shared_bom,
+        layout_batch=layout_batch,
+        draft=draft,
+        hash_registry=hash_registry,
     )
 
     if return_types and ("document" in return_types or "doc" in return_types):
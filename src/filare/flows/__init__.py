@@ -2,7 +2,13 @@
 
 from typing import Any
 
-__all__ = ["build_harness_from_files", "render_harness_outputs"]
+__all__ = [
+    "build_harness_from_files",
+    "compile_harness",
+    "load_harness",
+    "load_hash_registry",
+    "render_harness_outputs",
+]
 
 
 def build_harness_from_files(*args: Any, **kwargs: Any):
@@ -11,6 +17,24 @@ def build_harness_from_files(*args: Any, **kwargs: Any):
     return _impl(*args, **kwargs)
 
 
+def compile_harness(*args: Any, **kwargs: Any):
+    from filare.flows.build_harness import compile_harness as _impl
+
+    return _impl(*args, **kwargs)
+
+
+def load_harness(*args: Any, **kwargs: Any):
+    from filare.flows.build_harness import load_harness as _impl
+
+    return _impl(*args, **kwargs)
+
+
+def load_hash_registry(*args: Any, **kwargs: Any):
+    from filare.flows.build_harness import load_hash_registry as _impl
+
+    return _impl(*args, **kwargs)
+
+
 def render_harness_outputs(*args: Any, **kwargs: Any):
     from filare.flows.render_outputs import render_harness_outputs as _impl
 
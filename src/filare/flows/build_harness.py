@@ -3,6 +3,7 @@
 import logging
 from enum import Enum
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 from filare.errors import (
@@ -35,7 +36,10 @@ from filare.models.page import (
 from filare.models.types import AUTOGENERATED_PREFIX
 from filare.models.utils import expand, get_single_key_and_value, smart_file_resolve
 from filare.parser import parse_concat_merge_files
+from filare.render.layout_batch import LayoutBatch
+from filare.settings import settings
 
+from .compiled_harness import CompiledHarness, find_compiled_harness
 from .render_outputs import render_harness_outputs
 
 
@@ -51,14 +55,25 @@ def _make_jsonable(value):
     return value
 
 
+def _document_suffix() -> str:
+    return "json" if settings.document_format == "json" else "yaml"
+
+
+def load_hash_registry(output_dir: Path) -> DocumentHashRegistry:
+    """Load the document hash registry of ``output_dir``."""
+    registry = DocumentHashRegistry(
+        output_dir / f"document_hashes.{_document_suffix()}"
+    )
+    registry.load()
+    return registry
+
+
 def _maybe_write_document(
     doc_path: Path,
-    hash_registry_path: Path,
+    registry: DocumentHashRegistry,
     document: DocumentRepresentation,
     doc_hash: str,
 ) -> DocumentRepresentation:
-    registry = DocumentHashRegistry(hash_registry_path)
-    registry.load()
     allow_override = registry.allow_override(doc_path.name)
 
     if doc_path.exists():
@@ -85,7 +100,6 @@ def _maybe_write_document(
     if allow_override or not registry.contains(doc_path.name, doc_hash):
         document.to_yaml(doc_path)
         registry.add(doc_path.name, doc_hash, allow_override=allow_override)
-        registry.save()
     return document
 
 
@@ -344,55 +358,8 @@ def _normalize_connection_set(
     return connection_set, connectioncount
 
 
-def build_harness_from_files(
-    inp: Sequence[Path],
-    metadata_files: Sequence[Path],
-    return_types: Union[None, str, Sequence[str]] = None,
-    output_formats: Union[None, str, Sequence[str]] = None,
-    output_dir: Optional[Path] = None,
-    extra_metadata: Dict = {},
-    shared_bom: Dict = {},
-    output_name_override: Optional[str] = None,
-    connector_view: str = "detailed",
-    metadata_output_name: Optional[str] = None,
-    update_shared_bom: bool = True,
-) -> Any:
-    if not output_formats and not return_types:
-        raise MissingOutputSpecification()
-
-    yaml_file = inp[-1]
-    concatenated_files: List[Path] = list(inp)
-    metadata_file_list: List[Path] = list(metadata_files)
-    yaml_data = parse_concat_merge_files(concatenated_files, metadata_file_list)
-
-    image_paths = {f.parent for f in inp if f.parent.is_dir()}
-
-    output_dir = yaml_file.parent if not output_dir else output_dir
-    if output_dir is None:
-        raise FilareFlowException("Output directory could not be resolved")
-    output_name = output_name_override if output_name_override else yaml_file.stem
-    metadata_output_name = metadata_output_name or output_name
-    doc_yaml_path: Path = output_dir / f"{output_name}.document.yaml"
-    hash_registry_path: Path = output_dir / "document_hashes.yaml"
-
-    try:
-        metadata = _build_metadata(
-            yaml_file, yaml_data, extra_metadata, metadata_output_name
-        )
-    except TypeError as exc:
-        if output_formats:
-            raise FilareFlowException(
-                "Metadata definition is missing an argument, refer to trace for which one; see src/filare/metadata.py for field definitions"
-            ) from exc
-        raise
-
-    harness = Harness(
-        metadata=metadata,
-        options=get_page_options(yaml_data, output_name),
-        notes=get_page_notes(yaml_data, output_name),
-        shared_bom=shared_bom,
-    )
-    _resolve_diagram_svg(harness.options, list(image_paths))
+def _populate_harness(harness: Harness, yaml_data: Dict, image_paths) -> None:
+    """Add the components and connections described by ``yaml_data``."""
     designators_and_templates = {}
     autogenerated_designators = {}
 
@@ -500,6 +467,89 @@ def build_harness_from_files(
                 logging.error(f"Failed to add line {line} as an additional bom item")
                 raise
 
+
+def build_harness_from_files(
+    inp: Sequence[Path],
+    metadata_files: Sequence[Path],
+    return_types: Union[None, str, Sequence[str]] = None,
+    output_formats: Union[None, str, Sequence[str]] = None,
+    output_dir: Optional[Path] = None,
+    extra_metadata: Dict = {},
+    shared_bom: Dict = {},
+    output_name_override: Optional[str] = None,
+    connector_view: str = "detailed",
+    metadata_output_name: Optional[str] = None,
+    update_shared_bom: bool = True,
+    layout_batch: Optional[LayoutBatch] = None,
+    draft: bool = False,
+    hash_registry: Optional[DocumentHashRegistry] = None,
+) -> Any:
+    """Build a harness from files and render/return the requested outputs.
+
+    ``hash_registry`` is the loaded registry of the output directory when the
+    caller builds several sheets in one run; the caller then saves it once at
+    the end. Without it, the registry is loaded and saved for this sheet.
+    """
+    if not output_formats and not return_types:
+        raise MissingOutputSpecification()
+
+    yaml_file = inp[-1]
+    concatenated_files: List[Path] = list(inp)
+    metadata_file_list: List[Path] = list(metadata_files)
+
+    image_paths = {f.parent for f in inp if f.parent.is_dir()}
+
+    output_dir = yaml_file.parent if not output_dir else output_dir
+    if output_dir is None:
+        raise FilareFlowException("Output directory could not be resolved")
+    output_name = output_name_override if output_name_override else yaml_file.stem
+    metadata_output_name = metadata_output_name or output_name
+    doc_yaml_path: Path = output_dir / f"{output_name}.document.{_document_suffix()}"
+
+    compiled = None
+    if settings.compiled_harness:
+        compiled = find_compiled_harness(
+            concatenated_files,
+            metadata_file_list,
+            output_name,
+            [output_dir, yaml_file.parent],
+        )
+    if compiled is not None:
+        yaml_data: Dict[str, Any] = {"metadata": compiled.metadata}
+    else:
+        yaml_data = parse_concat_merge_files(concatenated_files, metadata_file_list)
+
+    try:
+        metadata = _build_metadata(
+            yaml_file, yaml_data, extra_metadata, metadata_output_name
+        )
+    except TypeError as exc:
+        if output_formats:
+            raise FilareFlowException(
+                "Metadata definition is missing an argument, refer to trace for which one; see src/filare/metadata.py for field definitions"
+            ) from exc
+        raise
+
+    if compiled is not None:
+        harness = Harness(
+            metadata=metadata,
+            options=compiled.options,
+            notes=compiled.notes,
+            shared_bom=shared_bom,
+            draft=draft,
+        )
+        compiled.apply(harness)
+    else:
+        harness = Harness(
+            metadata=metadata,
+            options=get_page_options(yaml_data, output_name),
+            notes=get_page_notes(yaml_data, output_name),
+            shared_bom=shared_bom,
+            draft=draft,
+        )
+        _resolve_diagram_svg(harness.options, list(image_paths))
+        _populate_harness(harness, yaml_data, image_paths)
+
     if connector_view == "overview":
         harness.orient_connectors_overview()
 
@@ -513,8 +563,7 @@ def build_harness_from_files(
     harness.populate_bom()
 
     document_representation: Optional[DocumentRepresentation] = None
-    registry = DocumentHashRegistry(hash_registry_path)
-    registry.load()
+    registry = hash_registry or load_hash_registry(output_dir)
 
     generate_document = bool(doc_yaml_path)
     if doc_yaml_path and doc_yaml_path.exists():
@@ -564,9 +613,11 @@ def build_harness_from_files(
         )
         doc_hash = document_representation.compute_hash()
         document_representation = _maybe_write_document(
-            doc_yaml_path, hash_registry_path, document_representation, doc_hash
+            doc_yaml_path, registry, document_representation, doc_hash
         )
         harness.document = document_representation
+    if hash_registry is None:
+        registry.save()
 
     effective_output_formats: Tuple[str, ...] = tuple(output_formats or ())
     doc_formats = _collect_formats_from_document(document_representation)
@@ -583,7 +634,11 @@ def build_harness_from_files(
 
     if effective_output_formats:
         render_harness_outputs(
-            harness, output_dir, output_name, effective_output_formats
+            harness,
+            output_dir,
+            output_name,
+            effective_output_formats,
+            layout_batch=layout_batch,
         )
 
     if return_types:
@@ -608,3 +663,74 @@ def build_harness_from_files(
                 )
 
         return returns
+
+
+def _standalone_metadata(files: Sequence[Path], output_dir: Path) -> Dict[str, Any]:
+    """Document metadata for building one sheet on its own."""
+    return {
+        "output_dir": output_dir,
+        "files": files[-1:],
+        "output_names": [files[-1].stem],
+        "sheet_total": 1,
+        "sheet_current": 1,
+        "sheet_name": files[-1].stem.upper(),
+        "titlepage": Path("titlepage"),
+        "use_qty_multipliers": False,
+        "multiplier_file_name": "quantity_multipliers.txt",
+    }
+
+
+def load_harness(
+    inp: Sequence[Path],
+    metadata_files: Sequence[Path] = (),
+) -> Harness:
+    """Build a Harness for inspection (netlist, diff, ...) without rendering.
+
+    The document representation written while building goes to a temporary
+    directory, so nothing is left next to the inputs.
+    """
+    files = [Path(f) for f in inp]
+    with TemporaryDirectory(prefix="filare-load-") as tmp:
+        returns = build_harness_from_files(
+            files,
+            metadata_files,
+            return_types="harness",
+            output_dir=Path(tmp),
+            extra_metadata=_standalone_metadata(files, Path(tmp)),
+        )
+    return returns["harness"]
+
+
+def compile_harness(
+    inp: Sequence[Path],
+    metadata_files: Sequence[Path] = (),
+    output_name: Optional[str] = None,
+) -> CompiledHarness:
+    """Build the harness of ``inp`` from YAML into a compiled artifact.
+
+    Existing artifacts are never used here; document metadata that depends
+    on the run (sheet numbers, output directory, ...) is not stored.
+    """
+    files = [Path(f) for f in inp]
+    metadata_file_list = [Path(f) for f in metadata_files]
+    yaml_file = files[-1]
+    output_name = output_name or yaml_file.stem
+    yaml_data = parse_concat_merge_files(files, metadata_file_list)
+    image_paths = {f.parent for f in files if f.parent.is_dir()}
+    yaml_metadata = dict(yaml_data.get("metadata", {}))
+    harness = Harness(
+        metadata=_build_metadata(
+            yaml_file,
+            yaml_data,
+            _standalone_metadata(files, yaml_file.parent),
+            output_name,
+        ),
+        options=get_page_options(yaml_data, output_name),
+        notes=get_page_notes(yaml_data, output_name),
+    )
+    _resolve_diagram_svg(harness.options, list(image_paths))
+    _populate_harness(harness, yaml_data, image_paths)
+    harness.populate_bom()
+    return CompiledHarness.from_harness(
+        harness, files, metadata_file_list, output_name, yaml_metadata
+    )
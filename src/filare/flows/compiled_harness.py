@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""Versioned binary artifacts of built harnesses (``filare compile``).
+
+Building a harness from YAML parses and merges the inputs, expands the
+connector/cable templates of every connection set and validates all
+components. A compiled artifact stores the result (connectors, cables with
+their connections, additional BOM items, options, notes and the metadata
+read from YAML) so that later builds of the same inputs skip all of that.
+
+An artifact is a magic line, a JSON header line and a pickle payload. The
+header holds the schema version, the Filare version and a digest of the
+Filare sources that wrote it and the size and modification time of every
+input; the payload is a mapping with exactly the keys of
+:data:`COMPILED_FIELDS`. An artifact is only used when all of these still
+match, anything else silently falls back to YAML.
+
+Unpickling a payload can run arbitrary code, so builds only load artifacts
+when the ``compiled_harness`` setting is enabled; only enable it for
+directories whose artifacts you compiled yourself.
+
+BOM keys are hashes that differ between processes, so the harness BOM index
+is rebuilt from the components when an artifact is loaded.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from filare import __version__
+from filare.errors import CompiledHarnessError
+from filare.models.harness import Harness
+from filare.models.notes import Notes
+from filare.models.options import PageOptions
+
+COMPILED_MAGIC = b"FILARE-COMPILED-HARNESS\n"
+COMPILED_SCHEMA_VERSION = 2
+COMPILED_SUFFIX = ".harness.bin"
+COMPILED_FIELDS = (
+    "output_name",
+    "metadata",
+    "options",
+    "notes",
+    "connectors",
+    "cables",
+    "additional_bom_items",
+)
+
+
+def compiled_path(yaml_file: Path, output_dir: Optional[Path] = None) -> Path:
+    """Artifact path of the harness built from ``yaml_file``."""
+    yaml_file = Path(yaml_file)
+    directory = yaml_file.parent if output_dir is None else Path(output_dir)
+    return directory / f"{yaml_file.stem}{COMPILED_SUFFIX}"
+
+
+@lru_cache(maxsize=None)
+def code_digest() -> str:
+    """SHA-256 of the Filare sources; the payload classes and build depend on them."""
+    package = Path(__file__).resolve().parents[1]
+    digest = hashlib.sha256()
+    for path in sorted(package.rglob("*.py")):
+        digest.update(path.relative_to(package).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def input_fingerprints(files: Iterable[Path]) -> List[List[Any]]:
+    """Resolved path, size and modification time of every input file."""
+    fingerprints = []
+    for path in files:
+        stat = Path(path).stat()
+        fingerprints.append([str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns])
+    return fingerprints
+
+
+@dataclass
+class CompiledHarness:
+    inputs: List[List[Any]]  # input_fingerprints() of the YAML files
+    metadata_files: List[List[Any]]  # input_fingerprints() of metadata files
+    output_name: str
+    metadata: Dict[str, Any]  # metadata section of the merged YAML
+    options: PageOptions
+    notes: Notes
+    connectors: Dict[str, Any] = field(default_factory=dict)
+    cables: Dict[str, Any] = field(default_factory=dict)
+    additional_bom_items: List[Any] = field(default_factory=list)
+
+    @classmethod
+    def from_harness(
+        cls,
+        harness: Harness,
+        inputs: Sequence[Path],
+        metadata_files: Sequence[Path],
+        output_name: str,
+        metadata: Dict[str, Any],
+    ) -> "CompiledHarness":
+        return cls(
+            inputs=input_fingerprints(inputs),
+            metadata_files=input_fingerprints(metadata_files),
+            output_name=output_name,
+            metadata=metadata,
+            options=harness.options,
+            notes=harness.notes,
+            connectors=harness.connectors,
+            cables=harness.cables,
+            additional_bom_items=harness.additional_bom_items,
+        )
+
+    def header(self) -> Dict[str, Any]:
+        return {
+            "schema": COMPILED_SCHEMA_VERSION,
+            "filare": __version__,
+            "code": code_digest(),
+            "python": list(sys.version_info[:2]),
+            "inputs": self.inputs,
+            "metadata_files": self.metadata_files,
+        }
+
+    def write(self, path: Path) -> Path:
+        """Write the artifact atomically (readers never see partial files)."""
+        path = Path(path)
+        payload = {name: getattr(self, name) for name in COMPILED_FIELDS}
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as out:
+            out.write(COMPILED_MAGIC)
+            out.write(json.dumps(self.header()).encode("utf-8") + b"\n")
+            pickle.dump(payload, out, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        return path
+
+    @staticmethod
+    def read_header(path: Path) -> Dict[str, Any]:
+        """Header of an artifact; raises CompiledHarnessError if unusable."""
+        with Path(path).open("rb") as inp:
+            return CompiledHarness._read_header(inp, path)
+
+    @staticmethod
+    def _read_header(inp: Any, path: Path) -> Dict[str, Any]:
+        if inp.readline() != COMPILED_MAGIC:
+            raise CompiledHarnessError(path, "not a compiled harness")
+        try:
+            header = json.loads(inp.readline())
+        except ValueError:
+            raise CompiledHarnessError(path, "damaged header")
+        if header.get("schema") != COMPILED_SCHEMA_VERSION:
+            raise CompiledHarnessError(
+                path, f"schema {header.get('schema')} != {COMPILED_SCHEMA_VERSION}"
+            )
+        if header.get("filare") != __version__:
+            raise CompiledHarnessError(
+                path, f"written by Filare {header.get('filare')}, not {__version__}"
+            )
+        if header.get("code") != code_digest():
+            raise CompiledHarnessError(path, "written by different Filare sources")
+        if header.get("python") != list(sys.version_info[:2]):
+            raise CompiledHarnessError(path, "written by another Python version")
+        return header
+
+    @classmethod
+    def load(cls, path: Path) -> "CompiledHarness":
+        with Path(path).open("rb") as inp:
+            header = cls._read_header(inp, path)
+            try:
+                payload = pickle.load(inp)
+            except Exception as exc:  # unpickling can raise almost anything
+                raise CompiledHarnessError(path, f"damaged payload ({exc})")
+        if not isinstance(payload, dict) or set(payload) != set(COMPILED_FIELDS):
+            raise CompiledHarnessError(path, "unexpected payload fields")
+        return cls(
+            inputs=header["inputs"],
+            metadata_files=header["metadata_files"],
+            **payload,
+        )
+
+    def apply(self, harness: Harness) -> None:
+        """Add the stored components to a new harness and index their BOM."""
+        for designator, connector in self.connectors.items():
+            harness.connectors[designator] = connector
+            harness._register_bom_source("connector", designator, connector)
+        for designator, cable in self.cables.items():
+            harness.cables[designator] = cable
+            harness._register_bom_source("cable", designator, cable)
+        for index, item in enumerate(self.additional_bom_items):
+            harness.additional_bom_items.append(item)
+            harness._register_bom_source("additional", index, item)
+
+
+def find_compiled_harness(
+    inputs: Sequence[Path],
+    metadata_files: Sequence[Path],
+    output_name: str,
+    directories: Iterable[Path],
+) -> Optional[CompiledHarness]:
+    """Load the artifact of these inputs if one is up to date, else None.
+
+    The artifact is looked up in each of ``directories`` in turn; it is used
+    only when it was compiled from the same files, none of which changed
+    since, for the same output name and by these Filare sources and Python
+    version. Callers only use this when ``settings.compiled_harness`` is set.
+    """
+    try:
+        current = input_fingerprints(inputs)
+        current_metadata = input_fingerprints(metadata_files)
+    except OSError:
+        return None
+    seen = set()
+    for directory in directories:
+        path = compiled_path(Path(inputs[-1]), directory)
+        if path in seen or not path.is_file():
+            continue
+        seen.add(path)
+        try:
+            header = CompiledHarness.read_header(path)
+            if (
+                header["inputs"] != current
+                or header["metadata_files"] != current_metadata
+            ):
+                logging.debug(f"Compiled harness {path} is out of date")
+                continue
+            compiled = CompiledHarness.load(path)
+        except (CompiledHarnessError, OSError) as exc:
+            logging.debug(f"Ignoring compiled harness: {exc}")
+            continue
+        if compiled.output_name != output_name:
+            continue
+        logging.debug(f"Using compiled harness {path}")
+        return compiled
+    return None
+
+
+__all__ = [
+    "COMPILED_FIELDS",
+    "COMPILED_MAGIC",
+    "COMPILED_SCHEMA_VERSION",
+    "COMPILED_SUFFIX",
+    "CompiledHarness",
+    "code_digest",
+    "compiled_path",
+    "find_compiled_harness",
+    "input_fingerprints",
+]
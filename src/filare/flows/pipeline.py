@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Run items through a chain of concurrent stages connected by bounded queues.
+
+Document builds alternate between CPU-bound Python work (parsing, building
+the harness, writing HTML) and subprocess-bound work (Graphviz layout). A
+:class:`Pipeline` runs each :class:`Stage` in its own worker threads, so
+while one sheet is laid out by Graphviz the next one is already parsed.
+
+Results are returned in input order whatever the stage concurrency, and the
+first failing item (in input order) re-raises its exception once every
+worker has stopped. Per-stage item counts, busy and idle time and the
+largest input queue depth are logged at debug level after each run.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+from filare.errors import FilareFlowException
+
+DEFAULT_QUEUE_SIZE = 4
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+
+
+@dataclass
+class StageStats:
+    name: str
+    workers: int
+    items: int = 0
+    busy: float = 0.0
+    idle: float = 0.0
+    max_depth: int = 0
+
+
+class Pipeline:
+    """Ordered stages run concurrently, connected by bounded queues."""
+
+    def __init__(
+        self, stages: Sequence[Stage], queue_size: int = DEFAULT_QUEUE_SIZE
+    ) -> None:
+        if not stages:
+            raise FilareFlowException("A pipeline needs at least one stage")
+        for stage in stages:
+            if stage.workers < 1:
+                raise FilareFlowException(
+                    f"Pipeline stage {stage.name} needs at least one worker"
+                )
+        self.stages = list(stages)
+        self.queue_size = max(1, queue_size)
+        self.stats: List[StageStats] = []
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """Pass every item through all stages; return the outputs in order."""
+        stages = self.stages
+        queues: List["queue.Queue[Any]"] = [
+            queue.Queue(self.queue_size) for _ in stages
+        ]
+        stats = [StageStats(stage.name, stage.workers) for stage in stages]
+        remaining = [stage.workers for stage in stages]
+        results: Dict[int, Any] = {}
+        errors: List[Tuple[int, BaseException]] = []
+        failed = threading.Event()
+        lock = threading.Lock()
+
+        def feed() -> None:
+            try:
+                for item in enumerate(items):
+                    if failed.is_set():
+                        break
+                    queues[0].put(item)
+            except BaseException as exc:  # error raised by the item iterable
+                with lock:
+                    errors.append((-1, exc))
+                failed.set()
+            for _ in range(stages[0].workers):
+                queues[0].put(_DONE)
+
+        def work(idx: int) -> None:
+            stage, inbox, stat = stages[idx], queues[idx], stats[idx]
+            outbox = queues[idx + 1] if idx + 1 < len(stages) else None
+            idle = busy = 0.0
+            count = depth = 0
+            while True:
+                depth = max(depth, inbox.qsize())
+                start = time.perf_counter()
+                entry = inbox.get()
+                idle += time.perf_counter() - start
+                if entry is _DONE:
+                    break
+                index, value = entry
+                if failed.is_set():
+                    continue  # drain so that upstream stages never block
+                start = time.perf_counter()
+                try:
+                    value = stage.func(value)
+                except BaseException as exc:
+                    with lock:
+                        errors.append((index, exc))
+                    failed.set()
+                    continue
+                finally:
+                    busy += time.perf_counter() - start
+                count += 1
+                if outbox is not None:
+                    outbox.put((index, value))
+                else:
+                    with lock:
+                        results[index] = value
+            with lock:
+                stat.items += count
+                stat.busy += busy
+                stat.idle += idle
+                stat.max_depth = max(stat.max_depth, depth)
+                remaining[idx] -= 1
+                last = remaining[idx] == 0
+            if last and outbox is not None:
+                for _ in range(stages[idx + 1].workers):
+                    outbox.put(_DONE)
+
+        threads = [threading.Thread(target=feed, name="pipeline-feed", daemon=True)]
+        for idx, stage in enumerate(stages):
+            threads.extend(
+                threading.Thread(
+                    target=work, args=(idx,), name=f"pipeline-{stage.name}-{n}"
+                )
+                for n in range(stage.workers)
+            )
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.stats = stats
+        for stat in stats:
+            logging.debug(
+                "Pipeline stage %s: %d items, %d workers, busy %.3fs, idle %.3fs, "
+                "max queue depth %d",
+                stat.name,
+                stat.items,
+                stat.workers,
+                stat.busy,
+                stat.idle,
+                stat.max_depth,
+            )
+        if errors:
+            raise min(errors, key=lambda error: error[0])[1]
+        return [results[index] for index in sorted(results)]
+
+
+__all__ = ["DEFAULT_QUEUE_SIZE", "Pipeline", "Stage", "StageStats"]
@@ -2,9 +2,10 @@
 
 import logging
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
 
 from filare.models.harness import Harness
+from filare.render.layout_batch import LayoutBatch
 
 
 def render_harness_outputs(
@@ -12,14 +13,22 @@ def render_harness_outputs(
     output_dir: Path,
     output_name: str,
     output_formats: Iterable[str],
+    layout_batch: Optional[LayoutBatch] = None,
 ) -> None:
-    """Render harness outputs using the harness model."""
+    """Render harness outputs using the harness model.
+
+    With ``layout_batch``, the outputs are queued and written when the batch
+    is flushed, after the graphs of all queued sheets were laid out together.
+    """
     logging.debug(
         "Rendering harness outputs for %s to %s (formats=%s)",
         getattr(harness, "name", output_name),
         output_dir,
         list(output_formats),
     )
+    if layout_batch is not None:
+        layout_batch.defer(harness, output_dir / output_name, tuple(output_formats))
+        return
     harness.output(
         filename=output_dir / output_name, fmt=tuple(output_formats), view=False
     )
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""Split a document build over several runners and merge the results.
+
+``filare run --shard i/N`` still parses every sheet, so sheet numbers, BOM
+ids and the per-harness quantities listed in sheet BOM tables are the same
+as in a single run, but only lays out and writes sheets ``i``, ``i + N``,
+``i + 2N``, ... It then writes a :class:`ShardManifest` with, for each of its
+sheets, the BOM entries the sheet contributes and the files it wrote, plus
+the document settings needed for the final pages. ``filare merge-shards``
+rebuilds the shared BOM from the manifests of all shards, in sheet order and
+the same way ``Harness.populate_bom`` does, so the shared BOM, title page
+and PDF bundle are identical to those of a single run.
+"""
+
+import json
+from dataclasses import dataclass, field
+from glob import escape
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from filare.errors import InvalidShardSpec, ShardManifestError
+from filare.models.bom import BomEntry, bom_key
+from filare.models.numbers import NumberAndUnit
+from filare.models.partnumber import PARTNUMBER_FIELDS, PartNumberInfo
+
+SHARD_MANIFEST_VERSION = 1
+
+# extra_metadata entries holding paths, restored as Path when loading
+_PATH_KEYS = ("titlepage",)
+_PATH_LIST_KEYS = ("files",)
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    index: int  # 1-based
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> "ShardSpec":
+        try:
+            index, count = (int(part) for part in value.split("/"))
+        except ValueError:
+            raise InvalidShardSpec(value)
+        if not 1 <= index <= count:
+            raise InvalidShardSpec(value)
+        return cls(index, count)
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def owns(self, sheet: int) -> bool:
+        """Whether the (0-based) harness sheet is rendered by this shard."""
+        return sheet % self.count == self.index - 1
+
+    @property
+    def manifest_name(self) -> str:
+        return f"shard-{self.index}-of-{self.count}.json"
+
+
+def bom_entry_record(entry: BomEntry) -> Dict[str, Any]:
+    """JSON-serializable copy of a sheet BOM entry (without id and per_harness)."""
+    return {
+        "description": entry.description,
+        "partnumbers": [getattr(entry.partnumbers, name) for name in PARTNUMBER_FIELDS],
+        "qty": entry.qty.as_dict(),
+        "amount": None if entry.amount is None else entry.amount.as_dict(),
+        "qty_multiplier": entry.qty_multiplier,
+        "category": entry.category,
+        "ignore_in_bom": entry.ignore_in_bom,
+        "designators": list(entry.designators),
+        "restrict_printed_lengths": entry.restrict_printed_lengths,
+    }
+
+
+def bom_entry_from_record(record: Dict[str, Any]) -> BomEntry:
+    """Rebuild a BOM entry; quantities are already scaled, so skip validation."""
+    amount = record["amount"]
+    return BomEntry.model_construct(
+        description=record["description"],
+        partnumbers=PartNumberInfo.model_construct(
+            **dict(zip(PARTNUMBER_FIELDS, record["partnumbers"]))
+        ),
+        qty=NumberAndUnit(**record["qty"]),
+        amount=None if amount is None else NumberAndUnit(**amount),
+        qty_multiplier=record["qty_multiplier"],
+        category=record["category"],
+        ignore_in_bom=record["ignore_in_bom"],
+        designators=list(record["designators"]),
+        restrict_printed_lengths=record["restrict_printed_lengths"],
+        per_harness={},
+        scaled_per_harness=False,
+        id="",
+    )
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+@dataclass
+class ShardSheet:
+    sheet: int  # 0-based position among the harness files
+    file: str
+    harness: str  # name used for the per_harness BOM quantities
+    outputs: List[str] = field(default_factory=list)
+    bom: List[Dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_harness(
+        cls, sheet: int, file: Path, harness: Any, output_name: str, output_dir: Path
+    ) -> "ShardSheet":
+        return cls(
+            sheet=sheet,
+            file=str(file),
+            harness=harness.name,
+            outputs=sorted(
+                path.name for path in output_dir.glob(f"{escape(output_name)}.*")
+            ),
+            bom=[bom_entry_record(entry) for entry in harness.bom.values()],
+        )
+
+
+@dataclass
+class ShardManifest:
+    shard: ShardSpec
+    # settings and metadata of the run (without output_dir), identical for
+    # every shard of a document
+    document: Dict[str, Any]
+    sheets: List[ShardSheet] = field(default_factory=list)
+
+    def record(self) -> Dict[str, Any]:
+        return {
+            "version": SHARD_MANIFEST_VERSION,
+            "shard": str(self.shard),
+            "document": _jsonable(self.document),
+            "sheets": [vars(sheet) for sheet in self.sheets],
+        }
+
+    def write(self, path: Path) -> Path:
+        path.write_text(
+            json.dumps(self.record(), ensure_ascii=False, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "ShardManifest":
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise ShardManifestError(f"Cannot read shard manifest {path}: {exc}")
+        if data.get("version") != SHARD_MANIFEST_VERSION:
+            raise ShardManifestError(
+                f"{path}: unsupported shard manifest version {data.get('version')}"
+            )
+        return cls(
+            shard=ShardSpec.parse(data["shard"]),
+            document=data["document"],
+            sheets=[ShardSheet(**sheet) for sheet in data["sheets"]],
+        )
+
+    def extra_metadata(self, output_dir: Path) -> Dict[str, Any]:
+        """Document metadata of the run, with paths restored."""
+        extra_metadata = dict(self.document["extra_metadata"], output_dir=output_dir)
+        for key in _PATH_KEYS:
+            if extra_metadata.get(key) is not None:
+                extra_metadata[key] = Path(extra_metadata[key])
+        for key in _PATH_LIST_KEYS:
+            extra_metadata[key] = [Path(item) for item in extra_metadata[key]]
+        return extra_metadata
+
+
+def merged_sheets(manifests: Sequence[ShardManifest]) -> List[ShardSheet]:
+    """Sheets of all shards in document order; every shard must be present once."""
+    if not manifests:
+        raise ShardManifestError("No shard manifests given")
+    first = manifests[0]
+    count = first.shard.count
+    seen: Dict[int, ShardManifest] = {}
+    for manifest in manifests:
+        if manifest.shard.count != count:
+            raise ShardManifestError(
+                f"Shard {manifest.shard} does not belong to a {count}-shard run"
+            )
+        if manifest.document != first.document:
+            raise ShardManifestError(
+                f"Shard {manifest.shard} was run with other inputs or options "
+                f"than shard {first.shard}"
+            )
+        if manifest.shard.index in seen:
+            raise ShardManifestError(f"Shard {manifest.shard} given twice")
+        seen[manifest.shard.index] = manifest
+    missing = [str(index) for index in range(1, count + 1) if index not in seen]
+    if missing:
+        raise ShardManifestError(
+            f"Missing shard manifests for shards {', '.join(missing)} of {count}"
+        )
+    sheets = sorted(
+        (sheet for manifest in manifests for sheet in manifest.sheets),
+        key=lambda sheet: sheet.sheet,
+    )
+    sheet_count = len(first.document["extra_metadata"]["files"])
+    if [sheet.sheet for sheet in sheets] != list(range(sheet_count)):
+        raise ShardManifestError("Shard manifests do not cover every sheet once")
+    return sheets
+
+
+def merge_shared_bom(sheets: Sequence[ShardSheet]) -> Dict[int, BomEntry]:
+    """Shared BOM of the sheets, merged like ``Harness.populate_bom`` does."""
+    shared_bom: Dict[int, BomEntry] = {}
+    for sheet in sheets:
+        for record in sheet.bom:
+            entry = bom_entry_from_record(record)
+            key = bom_key(entry.partnumbers, entry.description)
+            existing = shared_bom.get(key)
+            if existing is None:
+                entry.id = len(shared_bom) + 1
+                existing = entry.model_copy(update={"per_harness": {}})
+                shared_bom[key] = existing
+            else:
+                existing.qty += entry.qty
+            existing.per_harness[sheet.harness] = {"qty": entry.qty}
+    return shared_bom
+
+
+def missing_outputs(sheets: Sequence[ShardSheet], output_dir: Path) -> List[str]:
+    """Files written by the shards that are not (yet) in ``output_dir``."""
+    return [
+        name
+        for sheet in sheets
+        for name in sheet.outputs
+        if not (output_dir / name).exists()
+    ]
+
+
+__all__ = [
+    "SHARD_MANIFEST_VERSION",
+    "ShardManifest",
+    "ShardSheet",
+    "ShardSpec",
+    "bom_entry_from_record",
+    "bom_entry_record",
+    "merge_shared_bom",
+    "merged_sheets",
+    "missing_outputs",
+]
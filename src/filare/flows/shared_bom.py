@@ -1,7 +1,7 @@
 """Flow helpers for shared BOM generation."""
 
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, Iterable, Optional, Sequence, Tuple
 
 from filare.render.html import generate_shared_bom
 
@@ -12,6 +12,7 @@ def build_shared_bom(
     use_qty_multipliers: bool = False,
     files: Optional[Iterable[Path]] = None,
     multiplier_file_name: Optional[str] = None,
+    formats: Sequence[str] = ("tsv",),
 ):
     """Generate a shared BOM using the rendering helper."""
     return generate_shared_bom(
@@ -20,4 +21,5 @@ def build_shared_bom(
         use_qty_multipliers=use_qty_multipliers,
         files=files,
         multiplier_file_name=multiplier_file_name,
+        formats=formats,
     )
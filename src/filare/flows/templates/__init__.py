@@ -1,6 +1,10 @@
 """Explicit template model builders."""
 
-from filare.flows.templates.aux_table import build_aux_table_model
+from filare.flows.templates.aux_table import (
+    build_aux_page_frame,
+    build_aux_table_html,
+    build_aux_table_model,
+)
 from filare.flows.templates.bom import build_bom_model
 from filare.flows.templates.cable import build_cable_model
 from filare.flows.templates.connector import build_connector_model
@@ -9,7 +13,11 @@ from filare.flows.templates.index_table import build_index_table_model
 from filare.flows.templates.notes import build_notes_model
 from filare.flows.templates.page import build_page_model
 from filare.flows.templates.termination_table import build_termination_table_model
-from filare.flows.templates.titleblock import build_titleblock_model
+from filare.flows.templates.titleblock import (
+    build_titleblock_model,
+    render_titleblock,
+    titleblock_frame,
+)
 
 __all__ = [
     "build_bom_model",
@@ -20,6 +28,10 @@ __all__ = [
     "build_connector_model",
     "build_cable_model",
     "build_aux_table_model",
+    "build_aux_table_html",
+    "build_aux_page_frame",
     "build_titleblock_model",
+    "render_titleblock",
+    "titleblock_frame",
     "build_page_model",
 ]
@@ -6,7 +6,7 @@ from typing import Mapping, Optional, Sequence, Union
 
 from filare.flows.templates.cut_table import build_cut_table_model
 from filare.flows.templates.termination_table import build_termination_table_model
-from filare.flows.templates.titleblock import build_titleblock_model
+from filare.flows.templates.titleblock import render_titleblock
 from filare.models.colors import SingleColor
 from filare.models.metadata import Metadata, PageTemplateConfig, PageTemplateTypes
 from filare.models.options import PageOptions
@@ -15,6 +15,7 @@ from filare.models.templates.page_template_model import (
     TemplatePageMetadata,
     TemplatePageOptions,
 )
+from filare.models.templates.template_model import TemplateFrame, frame_marker
 from filare.models.templates.termination_template_model import TerminationTemplateModel
 
 
@@ -32,28 +33,31 @@ def _bgcolor_from_options(options: PageOptions) -> SingleColor:
     return SingleColor("#FFFFFF")
 
 
-def build_aux_table_model(
+def build_aux_table_html(
     suffix: str,
     rows: Optional[Sequence[Mapping[str, object]]],
     default_html: str,
-    metadata: Metadata,
+) -> str:
+    """Render the cut/termination table of a page, or ``default_html`` without rows."""
+    if not rows:
+        return default_html
+    if suffix == "cut":
+        return build_cut_table_model(rows).render()
+    return build_termination_table_model(rows).render()
+
+
+def _aux_page_model(
+    suffix: str,
     options: PageOptions,
     *,
-    page_suffix: str = "",
-    generator: str = "Filare",
-    partno: str = "",
-    title: str = "",
-    titleblock_html: Optional[str] = None,
+    generator: str,
+    title: str,
+    titleblock_html: str,
+    table_html: Optional[str],
 ) -> Union[CutTemplateModel, TerminationTemplateModel]:
-    """Construct a cut/termination TemplateModel for auxiliary pages."""
-    page_metadata = (
-        metadata.model_copy(update={"sheet_suffix": page_suffix})
-        if hasattr(metadata, "model_copy")
-        else metadata
-    )
     template_metadata = TemplatePageMetadata(
         generator=generator,
-        title=title or getattr(page_metadata, "title", "") or suffix.title(),
+        title=title,
         template=PageTemplateConfig(name=PageTemplateTypes.simple),
     )
     template_options = TemplatePageOptions(
@@ -62,18 +66,6 @@ def build_aux_table_model(
         titleblock_rows=getattr(options, "titleblock_rows", 3),
         titleblock_row_height=getattr(options, "titleblock_row_height", 5.0),
     )
-    table_html = default_html
-    if rows:
-        if suffix == "cut":
-            table_html = build_cut_table_model(rows).render()
-        else:
-            table_html = build_termination_table_model(rows).render()
-
-    if titleblock_html is None:
-        titleblock_html = build_titleblock_model(
-            page_metadata, options, partno
-        ).render()
-
     if suffix == "cut":
         return CutTemplateModel(
             metadata=template_metadata,
@@ -87,3 +79,59 @@ def build_aux_table_model(
         titleblock=titleblock_html,
         termination_table=table_html,
     )
+
+
+def build_aux_table_model(
+    suffix: str,
+    rows: Optional[Sequence[Mapping[str, object]]],
+    default_html: str,
+    metadata: Metadata,
+    options: PageOptions,
+    *,
+    page_suffix: str = "",
+    generator: str = "Filare",
+    partno: str = "",
+    title: str = "",
+    titleblock_html: Optional[str] = None,
+) -> Union[CutTemplateModel, TerminationTemplateModel]:
+    """Construct a cut/termination TemplateModel for auxiliary pages."""
+    if titleblock_html is None:
+        page_metadata = metadata
+        if page_suffix != getattr(metadata, "sheet_suffix", "") and hasattr(
+            metadata, "model_copy"
+        ):
+            page_metadata = metadata.model_copy(update={"sheet_suffix": page_suffix})
+        titleblock_html = render_titleblock(page_metadata, options, partno)
+    return _aux_page_model(
+        suffix,
+        options,
+        generator=generator,
+        title=title or getattr(metadata, "title", "") or suffix.title(),
+        titleblock_html=titleblock_html,
+        table_html=build_aux_table_html(suffix, rows, default_html),
+    )
+
+
+def build_aux_page_frame(
+    suffix: str,
+    options: PageOptions,
+    *,
+    generator: str = "Filare",
+    title: str = "",
+    with_table: bool = True,
+) -> TemplateFrame:
+    """Cut/termination page with stand-ins for ``titleblock`` and ``table``.
+
+    The pages of a paginated table fill in their titleblock and table HTML;
+    pages without table HTML need a frame built ``with_table=False``.
+    """
+    return TemplateFrame(
+        _aux_page_model(
+            suffix,
+            options,
+            generator=generator,
+            title=title or suffix.title(),
+            titleblock_html=frame_marker("titleblock"),
+            table_html=frame_marker("table") if with_table else None,
+        ).render()
+    )
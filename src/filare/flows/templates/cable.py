@@ -80,7 +80,7 @@ def _build_wires(wires: Mapping[str, Any]) -> Dict[str, TemplateWire]:
     return built
 
 
-def build_cable_model(cable: Any) -> CableTemplateModel:
+def build_cable_model(cable: Any, wire_padding: int = 1) -> CableTemplateModel:
     """Construct a CableTemplateModel from cable data."""
     wire_objects = getattr(cable, "wire_objects", None) or getattr(cable, "wires", {})
     partnumbers_val = _to_partnumber_list(getattr(cable, "partnumbers", None))
@@ -102,5 +102,6 @@ def build_cable_model(cable: Any) -> CableTemplateModel:
         image=getattr(cable, "image", None),
         additional_components=getattr(cable, "additional_components", []),
         notes=MultilineHypertext.to(getattr(cable, "notes", None)),
+        wire_padding=wire_padding,
     )
     return CableTemplateModel(component=component)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from typing import Any, Iterable, List, Optional, Sequence, Union
 
 from filare.models.colors import MultiColor, SingleColor
@@ -24,11 +25,11 @@ def _to_multicolor(value: Any) -> Optional[TemplateMultiColor]:
     if isinstance(value, TemplateMultiColor):
         return value
     if isinstance(value, MultiColor):
-        return TemplateMultiColor(colors=value.colors)
+        return TemplateMultiColor(value.colors)
     if isinstance(value, str):
-        return TemplateMultiColor(colors=[SingleColor(value)])
+        return TemplateMultiColor([SingleColor(value)])
     try:
-        return TemplateMultiColor(colors=[SingleColor(v) for v in value])  # type: ignore[arg-type]
+        return TemplateMultiColor([SingleColor(v) for v in value])  # type: ignore[arg-type]
     except Exception:
         return None
 
@@ -57,7 +58,12 @@ def build_connector_model(
     # Normalize to ConnectorModel for consistent field access when possible.
     if not isinstance(connector, ConnectorModel):
         try:
-            connector = ConnectorModel(**getattr(connector, "__dict__", {}))  # type: ignore[assignment]
+            attributes = dict(getattr(connector, "__dict__", {}))
+            if dataclasses.is_dataclass(connector):
+                # fields inherited from slotted base classes are not in __dict__
+                for item in dataclasses.fields(connector):
+                    attributes[item.name] = getattr(connector, item.name)
+            connector = ConnectorModel(**attributes)  # type: ignore[assignment]
         except Exception:
             # Fallback: minimal mapping from attributes.
             connector = ConnectorModel(
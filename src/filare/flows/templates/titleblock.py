@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Iterable, List, Optional
 
 from filare.models.metadata import Metadata
 from filare.models.options import PageOptions
+from filare.models.templates.template_model import TemplateFrame, frame_marker
 from filare.models.templates.titleblock_template_model import (
     TemplateAuthorEntry,
     TemplateRevisionEntry,
@@ -14,6 +16,9 @@ from filare.models.templates.titleblock_template_model import (
     TitleblockTemplateModel,
 )
 
+# titleblock fields that differ between the sheets and pages of a document
+_PER_PAGE_FIELDS = {"partno": True, "metadata": {"sheet_current", "sheet_suffix"}}
+
 
 def _coerce_authors(source: Any) -> List[TemplateAuthorEntry]:
     if not source:
@@ -67,3 +72,41 @@ def build_titleblock_model(
     return TitleblockTemplateModel(
         metadata=tb_metadata, options=tb_options, partno=partno
     )
+
+
+@lru_cache(maxsize=64)
+def _titleblock_frame(static_json: str) -> TemplateFrame:
+    model = TitleblockTemplateModel.model_validate_json(static_json)
+    marked = model.model_copy(
+        update={
+            "partno": frame_marker("partno"),
+            "metadata": model.metadata.model_copy(
+                update={
+                    "sheet_current": frame_marker("sheet_current"),
+                    "sheet_suffix": frame_marker("sheet_suffix"),
+                }
+            ),
+        }
+    )
+    return TemplateFrame(marked.render())
+
+
+def titleblock_frame(metadata: Metadata, options: PageOptions) -> TemplateFrame:
+    """Titleblock with stand-ins for sheet number, sheet suffix and part number.
+
+    Frames are cached by the rest of the titleblock content, so the sheets of
+    a document render the titleblock template once.
+    """
+    model = build_titleblock_model(metadata, options, partno="")
+    return _titleblock_frame(model.model_dump_json(exclude=_PER_PAGE_FIELDS))
+
+
+def render_titleblock(metadata: Metadata, options: PageOptions, partno: str) -> str:
+    """Same output as ``build_titleblock_model(...).render()``, from a cached frame."""
+    model = build_titleblock_model(metadata, options, partno)
+    frame = _titleblock_frame(model.model_dump_json(exclude=_PER_PAGE_FIELDS))
+    return frame.fill(
+        sheet_current=model.metadata.sheet_current,
+        sheet_suffix=model.metadata.sheet_suffix,
+        partno=partno,
+    )
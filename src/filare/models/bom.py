@@ -1,5 +1,17 @@
 import logging
-from typing import ClassVar, Dict, List, SupportsFloat, Union
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    SupportsFloat,
+    Tuple,
+    Union,
+)
 
 import factory  # type: ignore[reportPrivateImportUsage]
 import tabulate as tabulate_module
@@ -15,7 +27,7 @@ from filare.errors import UnsupportedModelOperation
 from filare.models.numbers import NumberAndUnit
 from filare.models.partnumber import FakePartNumberInfoFactory, PartNumberInfo
 from filare.models.table_models import (
-    TableCell,
+    TableData,
     TablePage,
     TablePaginationOptions,
     TableRow,
@@ -27,6 +39,11 @@ from filare.models.utils import remove_links
 faker = Faker()
 
 
+def bom_key(partnumbers, description: str) -> int:
+    """Key under which BOM entries with the same part and description are merged."""
+    return hash((partnumbers, description))
+
+
 class BomEntryBase(BaseModel):
     """Base BOM entry with quantities, identifiers, and formatting helpers."""
 
@@ -69,7 +86,7 @@ class BomEntryBase(BaseModel):
         return self
 
     def __hash__(self):
-        return hash((self.partnumbers, self.description))
+        return bom_key(self.partnumbers, self.description)
 
     def __eq__(self, other):
         if isinstance(other, list):
@@ -164,6 +181,163 @@ class BomEntry(BomEntryBase):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+def as_bom_entry(entry) -> BomEntry:
+    """Coerce a component ``bom_entry`` (BomEntryBase, model or mapping) to a BomEntry."""
+    if isinstance(entry, BomEntry):
+        return entry
+    if isinstance(entry, BomEntryBase):
+        base = entry
+    elif hasattr(entry, "model_dump"):
+        base = BomEntryBase(**entry.model_dump())
+    elif hasattr(entry, "dict"):
+        base = BomEntryBase(**entry.dict())
+    else:
+        base = BomEntryBase(**entry)
+    return BomEntry(
+        qty=base.qty,
+        partnumbers=base.partnumbers,
+        amount=base.amount,
+        qty_multiplier=base.qty_multiplier,
+        description=base.description,
+        category=base.category,
+        designators=list(base.designators),
+        per_harness=dict(base.per_harness),
+        ignore_in_bom=base.ignore_in_bom,
+        id=base.id,
+    )
+
+
+class BomSlot:
+    """A BOM-relevant item registered in a BomIndex.
+
+    ``keys`` holds one merge key per entry the item contributes; bundles
+    contribute one entry per wire.
+    """
+
+    __slots__ = ("rank", "item", "keys")
+
+    def __init__(self, rank: Tuple, item: Any, keys: Tuple[int, ...]):
+        self.rank = rank
+        self.item = item
+        self.keys = keys
+
+
+class BomIndex:
+    """Incrementally maintained BOM grouping for a harness.
+
+    Items are registered per source (a component together with its additional
+    components) as soon as they are added to the harness. Each item gets its
+    merge keys once, at registration, and lands in the groups for those keys.
+    Merged entries are cached per group and only rebuilt for groups touched
+    since the last query, e.g. when a source is replaced or its connections
+    change. An item whose keys changed in the meantime is moved accordingly.
+
+    ``rank`` orders items the way the harness is walked for the BOM; it decides
+    which entry of a group is merged first and breaks ties when sorting.
+    """
+
+    def __init__(self):
+        self._sources: Dict[Hashable, List[BomSlot]] = {}
+        self._groups: Dict[int, List[BomSlot]] = {}
+        self._entries: Dict[int, BomEntry] = {}
+        self._first_rank: Dict[int, Tuple] = {}
+        self._dirty: Set[int] = set()
+        self._order: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def set_source(self, source: Hashable, slots: List[BomSlot]) -> None:
+        """Register (or replace) the items contributed by ``source``."""
+        self.remove_source(source)
+        self._sources[source] = slots
+        for slot in slots:
+            self._link(slot)
+
+    def remove_source(self, source: Hashable) -> None:
+        for slot in self._sources.pop(source, []):
+            self._unlink(slot)
+
+    def invalidate(self, source: Optional[Hashable] = None) -> None:
+        """Mark the groups of ``source`` (or every group) for recomputation."""
+        if source is None:
+            self._dirty.update(self._groups)
+        else:
+            for slot in self._sources.get(source, []):
+                self._dirty.update(slot.keys)
+
+    def slots(self) -> Iterator[BomSlot]:
+        """Yield every registered slot in rank order."""
+        all_slots = [slot for slots in self._sources.values() for slot in slots]
+        return iter(sorted(all_slots, key=lambda slot: slot.rank))
+
+    def _link(self, slot: BomSlot) -> None:
+        for key in set(slot.keys):
+            self._groups.setdefault(key, []).append(slot)
+            self._dirty.add(key)
+
+    def _unlink(self, slot: BomSlot) -> None:
+        for key in set(slot.keys):
+            group = self._groups.get(key, [])
+            group[:] = [s for s in group if s is not slot]
+            if not group:
+                self._groups.pop(key, None)
+            self._dirty.add(key)
+
+    def _refresh(self) -> None:
+        if not self._dirty:
+            return
+        while self._dirty:
+            dirty, self._dirty = self._dirty, set()
+            dirty_slots = {
+                id(slot): slot for key in dirty for slot in self._groups.get(key, [])
+            }
+            for key in dirty:
+                self._entries.pop(key, None)
+                self._first_rank.pop(key, None)
+            # Walk in rank order so parents compute their qty multipliers (as part
+            # of their own bom_entry) before their additional components are read.
+            for slot in sorted(dirty_slots.values(), key=lambda slot: slot.rank):
+                if slot.item.ignore_in_bom:
+                    continue
+                bom_entry = slot.item.bom_entry
+                if not isinstance(bom_entry, list):
+                    bom_entry = [bom_entry]
+                entries = [as_bom_entry(entry) for entry in bom_entry]
+                keys = tuple(hash(entry) for entry in entries)
+                if keys != slot.keys:
+                    # the item was edited since it was registered: regroup it
+                    self._unlink(slot)
+                    slot.keys = keys
+                    self._link(slot)
+                    # groups outside this pass are rebuilt as a whole in the next
+                    self._dirty.difference_update(dirty)
+                for index, (key, entry) in enumerate(zip(keys, entries)):
+                    if key not in dirty:
+                        continue
+                    merged = self._entries.get(key)
+                    if merged is None:
+                        self._entries[key] = entry
+                        self._first_rank[key] = (slot.rank, index)
+                    else:
+                        merged += entry
+        self._order = None
+
+    def entries(self) -> Dict[int, BomEntry]:
+        """Merged entries sorted by category, then description."""
+        self._refresh()
+        if self._order is None:
+            self._order = sorted(
+                self._entries,
+                key=lambda key: (
+                    self._entries[key].category,
+                    self._entries[key].description,
+                    self._first_rank[key],
+                ),
+            )
+        return {key: self._entries[key] for key in self._order}
+
+
 class BomRender:
     def __init__(self, header, rows, strip_empty_columns=False, columns_class=None):
         """Lightweight BOM table renderer using Jinja templates."""
@@ -192,7 +366,16 @@ class BomRender:
             page_options = {}
         if bom_options is None:
             bom_options = BomRenderOptions()
+        self.options = bom_options
+        return self._render_rows(self.table(), None, page_options, bom_options)
+
+    def table(self) -> TableData:
+        """Header, classes and rows as a TableData, without empty columns if set."""
+        table = TableData(self.header, self.rows, self.columns_class)
+        return table.strip_empty_columns() if self.strip_empty_columns else table
 
+    @staticmethod
+    def _render_rows(table: TableData, rows, page_options, bom_options) -> str:
         def _from_opts(obj, attr: str, default):
             if obj is None:
                 return default
@@ -201,23 +384,6 @@ class BomRender:
             value = getattr(obj, attr, None)
             return default if value is None else value
 
-        if self.strip_empty_columns:
-            # remove empty columns in header and rows
-            index_to_remove = [i for i, v in enumerate(self.header) if v == ""]
-            stripped_rows = self.rows.copy()
-            stripped_header = self.header.copy()
-            for i in index_to_remove[::-1]:
-                stripped_header.pop(i)
-                for row in stripped_rows:
-                    row.pop(i)
-
-            header = stripped_header
-            rows = stripped_rows
-        else:
-            header = self.header
-            rows = self.rows
-
-        self.options = bom_options
         from filare.flows.templates import build_bom_model
 
         template_options = TemplateBomOptions(
@@ -230,25 +396,16 @@ class BomRender:
             reverse=getattr(bom_options, "reverse", False),
         )
         model = build_bom_model(
-            headers=header,
-            columns_class=self.columns_class,
-            content=rows,
+            headers=table.header,
+            columns_class=table.columns_class,
+            content=table.rows if rows is None else rows,
             options=template_options,
         )
         return model.render()
 
     def to_table_rows(self) -> List[TableRow]:
         """Return rows as TableRow objects with css classes preserved."""
-        table_rows: List[TableRow] = []
-        for row in self.rows:
-            cells = []
-            for idx, value in enumerate(row):
-                css_class = (
-                    self.columns_class[idx] if idx < len(self.columns_class) else None
-                )
-                cells.append(TableCell(value=str(value), css_class=css_class))
-            table_rows.append(TableRow(cells=cells))
-        return table_rows
+        return TableData(self.header, self.rows, self.columns_class).to_table_rows()
 
     def paginate(
         self,
@@ -257,18 +414,17 @@ class BomRender:
         bom_options=None,
     ) -> List[TablePage]:
         """Split the BOM into paginated HTML chunks."""
-        pages = paginate_rows(self.to_table_rows(), pagination)
-        results: List[TablePage] = []
-        for page in pages:
-            subset = [row.values for row in page.rows]
-            rendered_page = BomRender(
-                self.header,
-                subset,
-                strip_empty_columns=self.strip_empty_columns,
-                columns_class=self.columns_class,
-            ).render(page_options=page_options, bom_options=bom_options)
-            results.append(page.with_html(rendered_page))
-        return results
+        if page_options is None:
+            page_options = {}
+        if bom_options is None:
+            bom_options = BomRenderOptions()
+        table = self.table()
+        return [
+            page.with_html(
+                self._render_rows(table, page.rows, page_options, bom_options)
+            )
+            for page in paginate_rows(table.rows, pagination)
+        ]
 
 
 class BomRenderOptions:
@@ -386,6 +542,10 @@ class FakeBomEntryFactory(Factory):
 __all__ = [
     "BomEntryBase",
     "BomEntry",
+    "BomIndex",
+    "BomSlot",
+    "as_bom_entry",
+    "bom_key",
     "BomRender",
     "FakeBomEntryFactory",
     "print_bom_table",
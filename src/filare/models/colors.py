@@ -2,11 +2,13 @@
 
 from collections import namedtuple
 from enum import Enum
-from typing import Any, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from faker import Faker
 from pydantic import BaseModel, ConfigDict, Field
 
+# default for the html_padded properties; harnesses pass their own padding
 padding_amount = 1
 faker = Faker()
 
@@ -52,13 +54,65 @@ def convert_case(inp):
         return inp
 
 
+# Colors are immutable, so equal inputs share one instance. Harnesses only use
+# a few dozen distinct colors; the bound guards against generated inputs.
+MAX_INTERNED_COLORS = 4096
+_interned_colors: Dict[Tuple[Any, ...], BaseModel] = {}
+
+
+def _intern_item(item: Any) -> Tuple[Any, ...]:
+    if item is None or isinstance(item, (str, int)):
+        return (type(item), item)
+    if isinstance(item, SingleColor):
+        return (type(item), item.code_en, item.html)
+    raise TypeError(item)
+
+
+def _intern_key(cls: type, inp: Any) -> Optional[Tuple[Any, ...]]:
+    try:
+        if isinstance(inp, (list, tuple)):
+            return (cls, tuple, tuple(_intern_item(item) for item in inp))
+        return (cls, *_intern_item(inp))
+    except TypeError:
+        return None
+
+
+class InternedColorMeta(type(BaseModel)):  # type: ignore[misc]
+    """Return a shared instance when a color is built again from the same input."""
+
+    def __call__(cls, inp=None, **data):
+        if data:
+            return super().__call__(inp, **data)
+        if type(inp) is cls:
+            return inp
+        key = _intern_key(cls, inp)
+        if key is None:
+            return super().__call__(inp)
+        color = _interned_colors.get(key)
+        if color is None:
+            color = super().__call__(inp)
+            if len(_interned_colors) < MAX_INTERNED_COLORS:
+                _interned_colors[key] = color
+        return color
+
+
+@lru_cache(maxsize=None)
+def _code_de(code_en: str, mode: ColorOutputMode) -> str:
+    return convert_case(known_colors[code_en.upper()].code_de)
+
+
+@lru_cache(maxsize=None)
+def _padded(html: str, amount: int) -> str:
+    return ":".join([html] * amount)
+
+
 def get_color_by_colorcode_index(color_code: str, index: int) -> str:
     num_colors_in_code = len(COLOR_CODES[color_code])
     actual_index = index % num_colors_in_code  # wrap around if index is out of bounds
     return COLOR_CODES[color_code][actual_index]
 
 
-class SingleColor(BaseModel):
+class SingleColor(BaseModel, metaclass=InternedColorMeta):
     code_en: Optional[str] = None
     html: Optional[str] = None
 
@@ -83,13 +137,13 @@ class SingleColor(BaseModel):
             values = {"code_en": str(inp), "html": str(inp)}
         super().__init__(**values, **data)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
     @property
     def code_de(self):
         if not self.code_en:
             return None
-        return convert_case(known_colors[self.code_en.upper()].code_de)
+        return _code_de(self.code_en, color_output_mode)
 
     @property
     def known(self):
@@ -97,8 +151,10 @@ class SingleColor(BaseModel):
 
     @property
     def html_padded(self):
-        html = self.html if self.html else "#000000"
-        return ":".join([html] * padding_amount)
+        return self.padded_html(padding_amount)
+
+    def padded_html(self, amount: int) -> str:
+        return _padded(self.html or "#000000", amount)
 
     def __len__(self):
         return 1
@@ -132,10 +188,10 @@ class FakeSingleColorFactory:
         return SingleColor(code)
 
 
-class MultiColor(BaseModel):
+class MultiColor(BaseModel, metaclass=InternedColorMeta):
     colors: List[SingleColor] = Field(default_factory=list)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
     def __init__(self, inp=None, **data):
         if "colors" in data:
@@ -178,8 +234,11 @@ class MultiColor(BaseModel):
 
     @property
     def html_padded_list(self):
-        # padding only properly works for padding_amount 1 or 3
-        if padding_amount == 1:
+        return self.padded_html_list(padding_amount)
+
+    def padded_html_list(self, amount: int) -> List[str]:
+        # padding only properly works for amount 1 or 3
+        if amount == 1:
             out = [color.html for color in self.colors]
         elif len(self) == 0:
             out = []
@@ -201,9 +260,13 @@ class MultiColor(BaseModel):
 
     @property
     def html_padded(self):
-        if len(self.html_padded_list) == 0:
+        return self.padded_html(padding_amount)
+
+    def padded_html(self, amount: int) -> str:
+        padded = self.padded_html_list(amount)
+        if len(padded) == 0:
             return "#FFFFFF"
-        return ":".join(self.html_padded_list)
+        return ":".join(padded)
 
     @classmethod
     def _normalize_colors(cls, inp):
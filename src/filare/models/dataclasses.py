@@ -39,6 +39,44 @@ from filare.models.primitives import (
 from filare.models.utils import awg_equiv, mm2_equiv, remove_links
 
 
+def _slotted(cls):
+    """Recreate a dataclass with ``__slots__`` for its own fields.
+
+    Pins, wires and connections exist by the ten thousands in large harnesses,
+    and a per-instance ``__dict__`` dominates their size. ``dataclass(slots=True)``
+    needs Python 3.10, so the slotted class is built here; defaults stay in the
+    generated ``__init__``.
+    """
+    inherited = {
+        name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())
+    }
+    names = [f.name for f in fields(cls)]
+    slots = tuple(name for name in names if name not in inherited)
+    namespace = dict(cls.__dict__)
+    for name in names:  # class-level defaults would shadow the slots
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = slots
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    # point zero-argument super() of the methods at the new class
+    for member in namespace.values():
+        if isinstance(member, (classmethod, staticmethod)):
+            member = member.__func__
+        functions = (
+            (member.fget, member.fset, member.fdel)
+            if isinstance(member, property)
+            else (member,)
+        )
+        for function in functions:
+            for cell in getattr(function, "__closure__", None) or ():
+                if cell.cell_contents is cls:
+                    cell.cell_contents = slotted
+    return slotted
+
+
+@_slotted
 @dataclass
 class PinClass:
     index: Optional[int] = None
@@ -46,9 +84,10 @@ class PinClass:
     label: Optional[str] = ""
     color: Optional[MultiColor] = None
     parent: Optional[str] = None  # designator of parent connector
-    _num_connections = 0  # incremented in Connector.connect()
     _anonymous: bool = False  # true for pins on autogenerated connectors
     _simple: bool = False  # true for simple connector
+    # incremented in Connector.connect()
+    _num_connections: int = field(default=0, repr=False, compare=False)
 
     # TODO: support a "crimp" defined by parent
 
@@ -78,6 +117,7 @@ class PinClass:
         return BomCategory.PIN
 
 
+@_slotted
 @dataclass
 class Component:
     category: Optional[Union[str, BomCategory]] = (
@@ -116,6 +156,7 @@ class Component:
         str,
     ] = 1
     _qty_multiplier_computed: Union[int, float] = 1
+    _qty_unit_inherited: bool = False
 
     # style
     bgcolor: Optional[SingleColor] = None
@@ -200,7 +241,7 @@ class Component:
 
     @property
     def partnumbers(self):
-        return PartNumberInfo(
+        return PartNumberInfo.intern(
             pn=self.pn,
             manufacturer=self.manufacturer,
             mpn=self.mpn,
@@ -209,6 +250,7 @@ class Component:
         )
 
 
+@_slotted
 @dataclass
 class GraphicalComponent(Component):  # abstract class
     # component properties
@@ -503,6 +545,7 @@ class Connector(GraphicalComponent):
             subitem._qty_multiplier_computed = computed_factor
 
 
+@_slotted
 @dataclass
 class WireClass(GraphicalComponent):
     parent: Optional[str] = None  # designator of parent cable/bundle
@@ -558,7 +601,7 @@ class WireClass(GraphicalComponent):
     def partnumbers(self):
         _partnumbers = super().partnumbers
         if not _partnumbers.mpn and self.color is not None:
-            _partnumbers.mpn = self.get_mpn_if_belden()
+            _partnumbers = _partnumbers.replace(mpn=self.get_mpn_if_belden())
         return _partnumbers
 
     @property
@@ -722,6 +765,7 @@ class WireClass(GraphicalComponent):
         return self.mpn if self.mpn else ""
 
 
+@_slotted
 @dataclass
 class ShieldClass(WireClass):
     is_shield = True
@@ -731,6 +775,7 @@ class ShieldClass(WireClass):
         return hash(self.partnumbers)
 
 
+@_slotted
 @dataclass
 class Connection:
     from_: Optional[PinClass] = None
@@ -1022,7 +1067,7 @@ class Cable(WireClass):
                         raise ComponentValidationError(
                             f"Qty must be defined when using {subitem.qty_multiplier}"
                         )
-                    if subitem.qty.unit is not None:
+                    if subitem.qty.unit is not None and not subitem._qty_unit_inherited:
                         raise ComponentValidationError(
                             f"No unit may be specified when using"
                             f"{subitem.qty_multiplier} as a multiplier"
@@ -1031,6 +1076,7 @@ class Cable(WireClass):
                     subitem.qty = NumberAndUnit(
                         number=subitem.qty.number, unit=length_unit
                     )
+                    subitem._qty_unit_inherited = True
 
             elif isinstance(subitem.qty_multiplier, QtyMultiplierConnector):
                 raise ComponentValidationError(
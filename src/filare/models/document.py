@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import os
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Iterator, List, Optional, Type
 
 import factory  # type: ignore[reportPrivateImportUsage]
 import yaml
@@ -18,6 +21,11 @@ from factory.declarations import SubFactory
 from faker import Faker  # type: ignore[reportPrivateImportUsage]
 from pydantic import BaseModel, Field
 
+try:
+    import fcntl
+except ImportError:  # Windows: registry writes are not locked between processes
+    fcntl = None  # type: ignore[assignment]
+
 from filare.models.page import (
     BOMPage,
     CutPage,
@@ -32,12 +40,34 @@ from filare.models.page import (
     TerminationPage,
     TitlePage,
 )
+from filare.parser.yaml_loader import is_json_file
 
 
 def _yaml_dumps(data: Any) -> str:
     return yaml.safe_dump(data, sort_keys=True)
 
 
+def _json_dumps(data: Any) -> str:
+    # dates (e.g. revision dates in the metadata) are written as ISO strings
+    return json.dumps(data, sort_keys=True, default=str) + "\n"
+
+
+def _canonical_json(data: Any) -> bytes:
+    return json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
+def _dumps(path: Path, data: Any) -> str:
+    """Serialize ``data`` for ``path``: JSON for ``.json`` files, else YAML."""
+    return _json_dumps(data) if is_json_file(path) else _yaml_dumps(data)
+
+
+def _loads(path: Path) -> Any:
+    text = Path(path).read_text(encoding="utf-8")
+    return json.loads(text) if is_json_file(path) else yaml.safe_load(text)
+
+
 faker = Faker()
 
 
@@ -64,16 +94,28 @@ class DocumentRepresentation:
         }
 
     def compute_hash(self) -> str:
-        serialized = _yaml_dumps(self.as_dict()).encode("utf-8")
-        return hashlib.sha256(serialized).hexdigest()
+        return hashlib.sha256(_canonical_json(self.as_dict())).hexdigest()
 
     def to_yaml(self, path: Path) -> None:
+        """Write the document; as JSON if ``path`` ends in ``.json``."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(_dumps(path, self.as_dict()), encoding="utf-8")
+
+    def to_json(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(_yaml_dumps(self.as_dict()), encoding="utf-8")
+        path.write_text(_json_dumps(self.as_dict()), encoding="utf-8")
 
     @classmethod
     def from_yaml(cls, path: Path) -> "DocumentRepresentation":
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        """Read a document; as JSON if ``path`` ends in ``.json``."""
+        return cls.from_dict(_loads(path) or {})
+
+    @classmethod
+    def from_json(cls, path: Path) -> "DocumentRepresentation":
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")) or {})
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DocumentRepresentation":
         page_models: List[PageBase] = []
         for page in data.get("pages", []):
             page_type = page.get("type") if isinstance(page, dict) else None
@@ -100,17 +142,26 @@ class DocumentRepresentation:
 
 
 class DocumentHashRegistry:
-    """Tracks hashes of generated documents to detect user edits."""
+    """Tracks hashes of generated documents to detect user edits.
+
+    A run loads the registry once, records the documents it writes with
+    :meth:`add` and writes them back with a single :meth:`save`. The registry
+    is stored as JSON when ``path`` ends in ``.json``.
+    """
 
     def __init__(self, path: Path):
         self.path = path
         self._entries: Dict[str, Dict[str, Any]] = {}
+        self._changed: Dict[str, Dict[str, Any]] = {}
 
     def load(self) -> None:
+        self._entries = self._read()
+        self._changed = {}
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
         if not self.path.exists():
-            self._entries = {}
-            return
-        data = yaml.safe_load(self.path.read_text(encoding="utf-8")) or {}
+            return {}
+        data = _loads(self.path) or {}
         entries: Dict[str, Dict[str, Any]] = {}
         for fname, payload in data.items():
             if isinstance(payload, dict):
@@ -120,7 +171,7 @@ class DocumentHashRegistry:
                 }
             else:
                 entries[fname] = {"hash": payload, "allow_override": True}
-        self._entries = entries
+        return entries
 
     def contains(self, filename: str, value: str) -> bool:
         entry = self._entries.get(filename)
@@ -137,11 +188,62 @@ class DocumentHashRegistry:
         return bool(entry.get("allow_override"))
 
     def add(self, filename: str, value: str, allow_override: bool = True) -> None:
-        self._entries[filename] = {"hash": value, "allow_override": allow_override}
+        entry = {"hash": value, "allow_override": allow_override}
+        if self._entries.get(filename) != entry:
+            self._entries[filename] = entry
+            self._changed[filename] = entry
 
     def save(self) -> None:
+        """Write the entries added since :meth:`load` (nothing if unchanged).
+
+        They are merged into the file as it is on disk, under a lock and
+        replacing the file atomically, so processes sharing an output
+        directory (e.g. shards) keep each other's entries.
+        """
+        if not self._changed:
+            return
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(_yaml_dumps(self._entries), encoding="utf-8")
+        with _locked(self.path):
+            entries = self._read()
+            entries.update(self._changed)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(_dumps(self.path, entries), encoding="utf-8")
+            os.replace(tmp, self.path)
+        self._entries = entries
+        self._changed = {}
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``<path>.lock`` while writing ``path``.
+
+    The lock file is removed again before it is released, so it does not
+    stay in the output directory; a writer that locked the removed file
+    retries with the current one.
+    """
+    if fcntl is None:
+        yield
+        return
+    lock_path = path.with_name(f"{path.name}.lock")
+    while True:
+        lock = lock_path.open("a")
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            current = os.stat(lock_path)
+        except FileNotFoundError:
+            current = None
+        locked = os.fstat(lock.fileno())
+        if current is not None and (current.st_dev, current.st_ino) == (
+            locked.st_dev,
+            locked.st_ino,
+        ):
+            break
+        lock.close()
+    try:
+        yield
+    finally:
+        lock_path.unlink()
+        lock.close()  # releases the lock
 
 
 def _coerce_for_yaml(value: Any) -> Any:
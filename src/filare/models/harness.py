@@ -4,23 +4,36 @@ import logging
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from graphviz import Graph
+from graphviz import view as graphviz_view
 
 from filare import APP_NAME, APP_URL, __version__
-from filare.errors import BomEntryHashError
-from filare.models import colors
-from filare.models.bom import BomContent, BomEntry, BomEntryBase, BomRenderOptions
+from filare.models.bom import BomIndex, BomSlot, bom_key
 from filare.models.cable import CableModel
 from filare.models.component import ComponentModel
 from filare.models.connector import ConnectorModel
 from filare.models.document import DocumentRepresentation
 from filare.models.metadata import Metadata
+from filare.models.netlist import Netlist
 from filare.models.notes import Notes
 from filare.models.options import PageOptions
 from filare.models.types import BomCategory, Side
 from filare.render.assets import embed_svg_images, embed_svg_images_file
+from filare.render.bom_export import BOM_EXPORT_SUFFIXES, export_bom
+from filare.render.graph_pack import pack_svgs
 from filare.render.graphviz import (
     gv_connector_loops,
     gv_edge_wire,
@@ -30,7 +43,10 @@ from filare.render.graphviz import (
 )
 from filare.render.html import generate_html_output
 from filare.render.imported_svg import prepare_imported_svg
+from filare.render.layout_batch import LayoutBatch
+from filare.render.layout_cache import pipe_graph, pipe_graphs
 from filare.render.pdf import generate_pdf_output
+from filare.render.pdf_diagram import PRINT_LAYOUT_FORMAT, write_print_png
 from filare.render.templates import get_template  # for compatibility with tests
 from filare.settings import settings
 
@@ -60,17 +76,49 @@ class Harness:
     additional_bom_items: List[Component] = field(default_factory=list)
     shared_bom: Dict = field(default_factory=dict)
     document: Optional[DocumentRepresentation] = None
+    draft: bool = False
 
     def __post_init__(self):
         self.connectors = {}
         self.cables = {}
         self.bom = {}
         self.additional_bom_items = []
+        self._bom_index = BomIndex()
+        self._bom_positions: Dict[Any, int] = {}
+        self._shared_bom_contributions: Dict[int, Any] = {}
+        self._shared_bom_created: Set[int] = set()
 
     @property
     def name(self) -> str:
         return self.metadata.name
 
+    def _register_bom_source(self, kind: str, designator: Any, item: Any) -> None:
+        """(Re)register ``item`` and its additional components in the BOM index.
+
+        Ranks reproduce the order in which the harness is walked for the BOM:
+        connectors, cables, additional items, then the additional components of
+        every top-level item.
+        """
+        source = (kind, designator)
+        position = self._bom_positions.setdefault(source, len(self._bom_positions))
+        group = {"connector": 0, "cable": 1, "additional": 2}[kind]
+        slots = [_bom_slot((0, group, position, 0), item)]
+        for index, subitem in enumerate(item.additional_components):
+            slots.append(_bom_slot((1, group, position, index), subitem))
+        self._bom_index.set_source(source, slots)
+
+    def invalidate_bom(self, designator: Optional[str] = None) -> None:
+        """Mark the BOM entries of a connector/cable (or of everything) as stale.
+
+        Call this after editing a component in place; the next populate_bom()
+        only recomputes the affected entries.
+        """
+        if designator is None:
+            self._bom_index.invalidate()
+            return
+        self._bom_index.invalidate(("connector", designator))
+        self._bom_index.invalidate(("cable", designator))
+
     def add_connector(
         self, designator: Union[str, ConnectorModel, Dict[str, Any]], *args, **kwargs
     ) -> None:
@@ -91,6 +139,8 @@ class Harness:
             conn = Connector(designator=designator)
             key = designator
         self.connectors[key] = conn
+        self._register_bom_source("connector", key, conn)
+        self._netlist = None
 
     def add_connector_model(
         self, connector_model: Union[ConnectorModel, Dict[str, Any]]
@@ -103,6 +153,8 @@ class Harness:
         else:
             raise TypeError("connector_model must be ConnectorModel or dict")
         self.connectors[conn.designator] = conn
+        self._register_bom_source("connector", conn.designator, conn)
+        self._netlist = None
 
     def add_cable(
         self, designator: Union[str, CableModel, Dict[str, Any]], *args, **kwargs
@@ -124,6 +176,8 @@ class Harness:
             cbl = Cable(designator=designator)
             key = designator
         self.cables[key] = cbl
+        self._register_bom_source("cable", key, cbl)
+        self._netlist = None
 
     def add_cable_model(self, cable_model: Union[CableModel, Dict[str, Any]]) -> None:
         """Accept a CableModel (or similar with to_cable()) and store the dataclass."""
@@ -134,6 +188,8 @@ class Harness:
         else:
             raise TypeError("cable_model must be CableModel or dict")
         self.cables[cable.designator] = cable
+        self._register_bom_source("cable", cable.designator, cable)
+        self._netlist = None
 
     def add_additional_bom_item(self, item: Union[dict, ComponentModel]) -> None:
         if ComponentDC is None:  # pragma: no cover
@@ -143,6 +199,9 @@ class Harness:
         else:
             new_item = Component(**item, category=BomCategory.ADDITIONAL)
         self.additional_bom_items.append(new_item)
+        self._register_bom_source(
+            "additional", len(self.additional_bom_items) - 1, new_item
+        )
 
     def orient_connectors_overview(self):
         """Set connector port orientation based on connection direction for overview mode."""
@@ -168,119 +227,51 @@ class Harness:
             connector.ports_left = on_right
 
     def populate_bom(self):
-        # helper lists
-        all_toplevel_items = (
-            list(self.connectors.values())
-            + list(self.cables.values())
-            + self.additional_bom_items
-        )
-        all_subitems = [
-            subitem
-            for item in all_toplevel_items
-            for subitem in item.additional_components
-        ]
-        all_bom_relevant_items = (
-            list(self.connectors.values())
-            + [cable for cable in self.cables.values() if cable.category != "bundle"]
-            + [
-                wire
-                for cable in self.cables.values()
-                if cable.category == "bundle"
-                for wire in cable.wire_objects.values()
-            ]
-            + self.additional_bom_items
-            + all_subitems
-        )
-
-        def add_to_bom(entry):
-            if isinstance(entry, list):
-                for e in entry:
-                    add_to_bom(e)
-                return
-
-            def _as_dict(obj):
-                if hasattr(obj, "model_dump"):
-                    return obj.model_dump()
-                if hasattr(obj, "dict"):
-                    return obj.dict()
-                return obj
-
-            if not isinstance(entry, BomEntry):
-                base = entry
-                if isinstance(entry, BomEntryBase):
-                    base = entry
-                else:
-                    maybe_dict = _as_dict(entry)
-                    base = BomEntryBase(**maybe_dict)
-                entry = BomEntry(
-                    qty=base.qty,
-                    partnumbers=base.partnumbers,
-                    amount=base.amount,
-                    qty_multiplier=base.qty_multiplier,
-                    description=base.description,
-                    category=base.category,
-                    designators=list(base.designators),
-                    per_harness=dict(base.per_harness),
-                    ignore_in_bom=base.ignore_in_bom,
-                    id=base.id,
-                )
-
-            if isinstance(entry, list):
-                for e in entry:
-                    add_to_bom(e)
-                return
-
-            if hash(entry) in self.bom:
-                self.bom[hash(entry)] += entry
-            else:
-                self.bom[hash(entry)] = entry
-
-            try:
-                self.bom[hash(entry)]
-            except KeyError:
-                raise BomEntryHashError(entry)
-
-        # add items to BOM
-        for item in all_bom_relevant_items:
-            if item.ignore_in_bom:
-                continue
-            add_to_bom(item.bom_entry)
-
-        # sort BOM by category first, then alphabetically by description within category
-        self.bom = dict(
-            sorted(
-                self.bom.items(),
-                key=lambda x: (
-                    x[1].category,
-                    x[1].description,
-                ),  # x[0] = key, x[1] = value
-            )
-        )
-
-        next_id = len(self.shared_bom) + 1
-
-        def get_per_harness(v):
-            d = {
-                "qty": v["qty"],
-            }
-            return (self.name, d)
+        # merged entries, sorted by category, then description; only entries of
+        # components added or invalidated since the last call are recomputed
+        self.bom = self._bom_index.entries()
+
+        # populate_bom() called again: drop this harness' share of entries
+        # whose components were regrouped or removed since the last call
+        for key in [k for k in self._shared_bom_contributions if k not in self.bom]:
+            previous = self._shared_bom_contributions.pop(key)
+            existing = self.shared_bom[key]
+            existing.qty += previous * -1
+            existing.per_harness.pop(self.name, None)
+            self._shared_bom_created.discard(key)
+            if not existing.per_harness:
+                del self.shared_bom[key]
+
+        next_id = max((int(e.id) for e in self.shared_bom.values()), default=0) + 1
 
         for key, values in self.bom.items():
             if key in self.shared_bom:
                 existing = self.shared_bom[key]
+                previous = self._shared_bom_contributions.get(key)
+                if previous is not None:
+                    # populate_bom() called again: replace this harness' share
+                    existing.qty += previous * -1
                 existing.qty += values.qty
                 values.id = existing.id
             else:
                 values.id = next_id
-                self.shared_bom[key] = values
-                existing = values
+                existing = values.model_copy(update={"per_harness": {}})
+                self.shared_bom[key] = existing
+                self._shared_bom_created.add(key)
                 next_id += 1
+            self._shared_bom_contributions[key] = values.qty
 
-            k, v = get_per_harness({"qty": values.qty})
-            existing.per_harness[k] = v
+            per_harness = {"qty": values.qty}
+            existing.per_harness[self.name] = per_harness
+            if key in self._shared_bom_created:
+                # the sheet BOM lists this harness only, in a dict of its own:
+                # later sheets add their quantities to the shared entry, and
+                # the sheet may be written after they are parsed
+                values.per_harness = {self.name: dict(per_harness)}
 
         # set BOM IDs within components (for BOM bubbles)
-        for item in all_bom_relevant_items:
+        for slot in self._bom_index.slots():
+            item = slot.item
             if item.ignore_in_bom:
                 continue
             if hash(item) not in self.bom:
@@ -451,10 +442,14 @@ class Harness:
                 f"fail to connect cable {via_name}, from_pin: {from_pin}, via_wire: {via_wire}, to_pin: {to_pin}\n\texception:{e}"
             )
             raise
+        self._netlist = None
         if from_name in self.connectors:
             self.connectors[from_name].activate_pin(from_pin, Side.RIGHT)
+            # qty multipliers (populated pins, connections) depend on connections
+            self._bom_index.invalidate(("connector", from_name))
         if to_name in self.connectors:
             self.connectors[to_name].activate_pin(to_pin, Side.LEFT)
+            self._bom_index.invalidate(("connector", to_name))
 
     def connect_model(self, connection) -> None:
         """Accept a ConnectionModel (or dict) and route through connect()."""
@@ -493,12 +488,57 @@ class Harness:
             str(to_pin or ""),
         )
 
-    def create_graph(self) -> Graph:
+    _netlist = None
+
+    @property
+    def netlist(self) -> Netlist:
+        """Connectivity index of the harness, rebuilt after it is modified."""
+        if self._netlist is None:
+            self._netlist = Netlist.from_harness(self)
+        return self._netlist
+
+    def graph_components(self) -> List[List[str]]:
+        """Designators grouped by connected sub-graph, in creation order."""
+        parent = {designator: designator for designator in self.connectors}
+        parent.update((designator, designator) for designator in self.cables)
+
+        def find(designator: str) -> str:
+            while parent[designator] != designator:
+                parent[designator] = parent[parent[designator]]
+                designator = parent[designator]
+            return designator
+
+        for cable in self.cables.values():
+            for connection in cable._connections:
+                for pin in (connection.from_, connection.to):
+                    designator = getattr(pin, "parent", None)
+                    if designator in parent:
+                        parent[find(designator)] = find(cable.designator)
+
+        groups: Dict[str, List[str]] = {}
+        for designator in parent:
+            groups.setdefault(find(designator), []).append(designator)
+        return list(groups.values())
+
+    @property
+    def wire_padding(self) -> int:
+        """Stripes per wire color: 3 when any wire of the harness is multicolor."""
+        multicolor = any(
+            len(wire.color) > 1
+            for cable in self.cables.values()
+            for wire in cable.wire_objects.values()
+        )
+        return 3 if multicolor else 1
+
+    def create_graph(self, designators: Optional[Collection[str]] = None) -> Graph:
+        """Build the Graphviz graph, optionally restricted to ``designators``."""
         dot = Graph(engine=settings.graphviz_engine or "dot")
-        set_dot_basics(dot, self.options)
+        set_dot_basics(dot, self.options, draft=self.draft)
 
         for connector in self.connectors.values():
-            template_html = gv_node_connector(connector)
+            if designators is not None and connector.designator not in designators:
+                continue
+            template_html = gv_node_connector(connector, draft=self.draft)
             dot.node(
                 connector.designator,
                 label=f"<\n{template_html}\n>",
@@ -510,18 +550,16 @@ class Harness:
                 for loop, head, tail in loops:
                     dot.edge(head, tail, xlabel=loop.label, color=loop.html_color())
 
-        wire_is_multicolor = [
-            len(wire.color) > 1
-            for cable in self.cables.values()
-            for wire in cable.wire_objects.values()
-        ]
-        if any(wire_is_multicolor):
-            colors.padding_amount = 3
-        else:
-            colors.padding_amount = 1
+        # passed down rather than set on the colors module: sheets are laid
+        # out concurrently
+        wire_padding = self.wire_padding
 
         for cable in self.cables.values():
-            template_html = gv_node_cable(cable)
+            if designators is not None and cable.designator not in designators:
+                continue
+            template_html = gv_node_cable(
+                cable, draft=self.draft, wire_padding=wire_padding
+            )
             style = "filled,dashed" if cable.category == "bundle" else "filled"
             dot.node(
                 cable.designator,
@@ -531,7 +569,9 @@ class Harness:
             )
 
             for connection in cable._connections:
-                color, l1, l2, r1, r2 = gv_edge_wire(self, cable, connection)
+                color, l1, l2, r1, r2 = gv_edge_wire(
+                    self, cable, connection, wire_padding
+                )
                 dot.attr("edge", color=color)
                 if l1 is not None and l2 is not None:
                     dot.edge(l1, l2)
@@ -548,13 +588,44 @@ class Harness:
             self._graph = self.create_graph()
         return self._graph
 
+    def component_graphs(self) -> List[Graph]:
+        """One graph per connected sub-graph when splitting is enabled."""
+        if not settings.graphviz_split_components:
+            return []
+        components = self.graph_components()
+        if len(components) < 2:
+            return []
+        return [self.create_graph(set(component)) for component in components]
+
+    def layout_jobs(self, fmt: Sequence[str]) -> List[Tuple[Any, List[str]]]:
+        """Graphs and the Graphviz formats ``output(fmt=fmt)`` renders them to."""
+        formats = self.graph_formats(fmt)
+        # the raster PDF diagram is drawn from the layout of the SVG
+        print_formats = [PRINT_LAYOUT_FORMAT] if self._print_png_wanted(fmt) else []
+        components = self.component_graphs() if "svg" in formats else []
+        if not components:
+            return [(self.graph, formats + print_formats)] if formats else []
+        jobs: List[Tuple[Any, List[str]]] = [
+            (graph, ["svg", *print_formats]) for graph in components
+        ]
+        if "png" in formats:
+            jobs.append((self.graph, ["png"]))
+        return jobs
+
+    def render_graph(self, fmt: str, layout_cache: Any = None) -> bytes:
+        """Render the diagram, packing separately laid out sub-graphs for SVG."""
+        components = self.component_graphs() if fmt == "svg" else []
+        if components:
+            svgs = pipe_graphs(components, fmt, layout_cache)
+            return pack_svgs([svg.decode("utf-8") for svg in svgs]).encode("utf-8")
+        return pipe_graph(self.graph, fmt, layout_cache)
+
     @property
     def png(self):
         from io import BytesIO
 
-        graph = self.graph
         data = BytesIO()
-        data.write(graph.pipe(format="png"))
+        data.write(self.render_graph("png"))
         data.seek(0)
         return data.read()
 
@@ -563,8 +634,29 @@ class Harness:
         diagram_svg_options = getattr(self.options, "diagram_svg", None)
         if diagram_svg_options:
             return prepare_imported_svg(diagram_svg_options)
-        graph = self.graph
-        return embed_svg_images(graph.pipe(format="svg").decode("utf-8"), Path.cwd())
+        return embed_svg_images(self.render_graph("svg").decode("utf-8"), Path.cwd())
+
+    def _print_png_wanted(self, fmt: Sequence[str]) -> bool:
+        return (
+            "html" in fmt
+            and settings.pdf_diagram != "vector"
+            and not self.draft
+            and not getattr(self.options, "diagram_svg", None)
+        )
+
+    def graph_formats(self, fmt: Sequence[str]) -> List[str]:
+        """Graphviz output formats needed by ``output(fmt=fmt)``."""
+        if getattr(self.options, "diagram_svg", None):
+            return []  # the imported diagram replaces the generated one
+        formats: List[str] = []
+        for f in fmt:
+            if f == "png" and self.draft:
+                continue
+            if f in ("png", "svg", "html"):
+                render_format = "svg" if f == "html" else f
+                if render_format not in formats:
+                    formats.append(render_format)
+        return formats
 
     def output(
         self,
@@ -572,6 +664,7 @@ class Harness:
         view: bool = False,
         cleanup: bool = True,
         fmt: Sequence[str] = ("html", "png", "svg", "tsv"),
+        layout_cache: Any = None,
     ) -> None:
         fmt_list = list(fmt)
         imported_svg_markup = None
@@ -585,32 +678,33 @@ class Harness:
                 fmt_list = [f for f in fmt_list if f != "png"]
 
         graph = self.graph
-        rendered = set()
         filename_path = Path(filename)
-        for f in fmt_list:
-            if f in ("png", "svg", "html"):
-                render_format = "svg" if f == "html" else f
-                if render_format in rendered:
-                    continue
-                graph.format = render_format
-                graph.render(filename=filename_path, view=view, cleanup=cleanup)
-                rendered.add(render_format)
+        if layout_cache is None and self._print_png_wanted(fmt_list):
+            # one Graphviz run for the SVG and the layout of the raster diagram
+            layout_cache = LayoutBatch()
+            layout_cache.layout(self.layout_jobs(fmt_list))
+        for render_format in self.graph_formats(fmt_list):
+            target = filename_path.with_suffix(f".{render_format}")
+            target.write_bytes(self.render_graph(render_format, layout_cache))
+            if view:
+                graphviz_view(target)
         if "svg" in fmt_list or "html" in fmt_list:
             if imported_svg_markup:
                 filename_path.with_suffix(".svg").write_text(imported_svg_markup)
-            else:
+            elif not self.draft:
                 embed_svg_images_file(filename_path.with_suffix(".svg"))
+                if "html" in fmt_list and settings.pdf_diagram != "vector":
+                    write_print_png(
+                        self.component_graphs() or [graph],
+                        filename_path,
+                        filename_path.with_suffix(".svg").read_text(),
+                        layout_cache,
+                    )
         if "gv" in fmt_list:
             graph.save(filename=filename_path.with_suffix(".gv"))
-        if "tsv" in fmt_list and self.options.include_bom:
-            bom_render = BomContent(self.bom).get_bom_render(
-                options=BomRenderOptions(
-                    restrict_printed_lengths=False,
-                )
-            )
-            filename_path.with_suffix(".tsv").open("w").write(bom_render.as_tsv())
-        if "csv" in fmt_list:
-            print("CSV output is not yet supported")
+        bom_formats = [f for f in BOM_EXPORT_SUFFIXES if f in fmt_list]
+        if bom_formats and self.options.include_bom:
+            export_bom(self.bom, filename_path, bom_formats)
         if "html" in fmt_list:
             bom_for_html = self.bom if self.options.include_bom else {}
             rendered = {}
@@ -632,7 +726,7 @@ class Harness:
                 self.notes,
                 rendered,
             )
-        if "pdf" in fmt_list:
+        if "pdf" in fmt_list and not self.draft:
             generate_pdf_output([filename_path])
         if "html" in fmt_list and "svg" not in fmt_list:
             filename_path.with_suffix(".svg").unlink()
@@ -641,6 +735,14 @@ class Harness:
 __all__ = ["Harness"]
 
 
+def _bom_slot(rank, item) -> BomSlot:
+    # bundles contribute one BOM entry per wire
+    is_bundle = getattr(item, "is_bundle", False)
+    parts = list(item.wire_objects.values()) if is_bundle else [item]
+    keys = tuple(bom_key(part.partnumbers, str(part)) for part in parts)
+    return BomSlot(rank, item, keys)
+
+
 def _build_cut_table(harness):
     """Build cut table rows and HTML from harness wires."""
     rows = []
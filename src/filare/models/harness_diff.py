@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""Structural diff between two revisions of a harness.
+
+Connectors and cables are matched by designator, wires by (cable, wire id)
+and connections by their (from pin, wire, to pin) identity, each through a
+dictionary built in one pass over the harness, so a diff is linear in the
+size of both harnesses. BOM entries are matched by part number and
+description and compared by quantity.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import tabulate as tabulate_module
+
+from filare.models.bom import BomEntryBase
+from filare.models.numbers import NumberAndUnit
+from filare.models.partnumber import PARTNUMBER_FIELDS
+
+DIFF_TABLE_HEADER = ["Kind", "Item", "Change", "Field", "Old", "New"]
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(_text(item) for item in value)
+    return str(value)
+
+
+def _partnumbers(item: Any) -> str:
+    return "; ".join(
+        f"{name}={_text(getattr(item, name))}"
+        for name in PARTNUMBER_FIELDS
+        if getattr(item, name, None)
+    )
+
+
+def _connector_fields(connector: Any) -> Dict[str, str]:
+    return {
+        "description": str(connector),
+        "partnumbers": _partnumbers(connector),
+        "pins": _text(connector.pins),
+        "pinlabels": _text(connector.pinlabels),
+        "loops": _text([f"{loop.first}-{loop.second}" for loop in connector.loops]),
+    }
+
+
+def _cable_fields(cable: Any) -> Dict[str, str]:
+    return {
+        "description": str(cable),
+        "partnumbers": _partnumbers(cable),
+        "wirecount": _text(cable.wirecount),
+        "length": _text(cable.length_str),
+    }
+
+
+def _wire_fields(wire: Any) -> Dict[str, str]:
+    return {
+        "description": str(wire),
+        "label": _text(wire.label),
+        "partnumbers": _partnumbers(wire),
+    }
+
+
+def _pin_node(pin: Any) -> str:
+    return "-" if pin is None else f"{pin.parent}:{pin.id}"
+
+
+def _connections(harness: Any) -> Dict[str, None]:
+    """Connections keyed by ``from -> cable:wire -> to`` (``-`` for open ends)."""
+    connections: Dict[str, None] = {}
+    for designator, cable in harness.cables.items():
+        for connection in cable._connections:
+            via = connection.via
+            wire = f"{designator}:{via.id}" if via is not None else designator
+            key = (
+                f"{_pin_node(connection.from_)} -> {wire} -> {_pin_node(connection.to)}"
+            )
+            connections[key] = None
+    return connections
+
+
+@dataclass
+class FieldChange:
+    field: str
+    old: str
+    new: str
+
+
+@dataclass
+class SectionDiff:
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: Dict[str, List[FieldChange]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def record(self) -> Dict[str, Any]:
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "changed": {
+                item: [vars(change) for change in changes]
+                for item, changes in self.changed.items()
+            },
+        }
+
+
+@dataclass
+class BomDelta:
+    description: str
+    old: float
+    new: float
+    unit: Optional[str] = None
+
+    @property
+    def delta(self) -> float:
+        return self.new - self.old
+
+    def record(self) -> Dict[str, Any]:
+        return {**vars(self), "delta": self.delta}
+
+
+def diff_items(
+    old: Mapping[Any, Any],
+    new: Mapping[Any, Any],
+    fields: Callable[[Any], Dict[str, str]],
+) -> SectionDiff:
+    """Compare two keyed collections; ``fields`` extracts comparable values."""
+    section = SectionDiff()
+    for key, old_item in old.items():
+        if key not in new:
+            section.removed.append(_text(key))
+            continue
+        old_fields, new_fields = fields(old_item), fields(new[key])
+        changes = [
+            FieldChange(name, value, new_fields.get(name, ""))
+            for name, value in old_fields.items()
+            if new_fields.get(name, "") != value
+        ]
+        if changes:
+            section.changed[_text(key)] = changes
+    section.added = [_text(key) for key in new if key not in old]
+    return section
+
+
+def _wires(harness: Any) -> Dict[str, Any]:
+    return {
+        f"{designator}:{wire.id}": wire
+        for designator, cable in harness.cables.items()
+        for wire in cable.wire_objects.values()
+    }
+
+
+def _qty(entry: Optional[BomEntryBase]) -> float:
+    if entry is None:
+        return 0
+    qty = entry.qty
+    return qty.number if isinstance(qty, NumberAndUnit) else float(qty)
+
+
+def diff_bom(
+    old: Mapping[Any, BomEntryBase], new: Mapping[Any, BomEntryBase]
+) -> List[BomDelta]:
+    """Quantity changes of BOM entries, including added (0 → n) and removed ones.
+
+    Both BOMs are keyed by ``bom_key`` (part numbers and description).
+    """
+    deltas = []
+    for key in {**old, **new}:
+        old_entry, new_entry = old.get(key), new.get(key)
+        old_qty, new_qty = _qty(old_entry), _qty(new_entry)
+        if old_qty != new_qty:
+            entry = new_entry or old_entry
+            assert entry is not None
+            deltas.append(BomDelta(entry.description, old_qty, new_qty, entry.unit))
+    return deltas
+
+
+@dataclass
+class HarnessDiff:
+    connectors: SectionDiff
+    cables: SectionDiff
+    wires: SectionDiff
+    connections: SectionDiff
+    bom: List[BomDelta]
+
+    SECTIONS = ("connectors", "cables", "wires", "connections")
+
+    @classmethod
+    def between(cls, old: Any, new: Any) -> "HarnessDiff":
+        return cls(
+            connectors=diff_items(old.connectors, new.connectors, _connector_fields),
+            cables=diff_items(old.cables, new.cables, _cable_fields),
+            wires=diff_items(_wires(old), _wires(new), _wire_fields),
+            connections=diff_items(_connections(old), _connections(new), lambda _: {}),
+            bom=diff_bom(old.bom, new.bom),
+        )
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, name) for name in self.SECTIONS) or bool(self.bom)
+
+    def record(self) -> Dict[str, Any]:
+        """JSON-serializable representation of the diff."""
+        record: Dict[str, Any] = {
+            name: getattr(self, name).record() for name in self.SECTIONS
+        }
+        record["bom"] = [delta.record() for delta in self.bom]
+        return record
+
+    def rows(self) -> List[List[str]]:
+        """One table row per added/removed item, changed field and BOM delta."""
+        rows = []
+        for name in self.SECTIONS:
+            section = getattr(self, name)
+            kind = name[:-1]
+            rows.extend([kind, item, "removed", "", "", ""] for item in section.removed)
+            rows.extend([kind, item, "added", "", "", ""] for item in section.added)
+            for item, changes in section.changed.items():
+                rows.extend(
+                    [kind, item, "changed", change.field, change.old, change.new]
+                    for change in changes
+                )
+        for delta in self.bom:
+            unit = f" {delta.unit}" if delta.unit else ""
+            rows.append(
+                [
+                    "bom",
+                    delta.description,
+                    f"qty {delta.delta:+g}{unit}",
+                    "qty",
+                    f"{delta.old:g}",
+                    f"{delta.new:g}",
+                ]
+            )
+        return rows
+
+    def as_table(self) -> str:
+        return tabulate_module.tabulate(self.rows(), DIFF_TABLE_HEADER)
+
+
+def diff_harnesses(old: Any, new: Any) -> HarnessDiff:
+    """Structural diff of two built harnesses."""
+    return HarnessDiff.between(old, new)
+
+
+__all__ = [
+    "BomDelta",
+    "FieldChange",
+    "HarnessDiff",
+    "SectionDiff",
+    "diff_bom",
+    "diff_harnesses",
+    "diff_items",
+]
@@ -30,3 +30,7 @@ class FilareInterfaceModel(BaseModel):
     def to_yaml(self) -> str:
         """Serialize the model to YAML using its JSON-compatible representation."""
         return yaml.safe_dump(json.loads(self.model_dump_json()), sort_keys=False)
+
+    def to_json(self) -> str:
+        """Serialize the model to JSON (the same content as :meth:`to_yaml`)."""
+        return self.model_dump_json(indent=2)
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""Electrical connectivity (nets) of a harness.
+
+Cables only store their own ``Connection(from_, via, to)`` lists, so finding
+every pin that is joined to another one across cables, bundles, shields and
+connector loops requires walking all of them. A :class:`Netlist` does that
+walk once with a union-find over pins and wires; afterwards pin to net
+lookups and continuity checks are single dictionary lookups.
+"""
+
+import csv
+import json
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from filare.errors import PinResolutionError
+
+# (designator, pin or wire id); designators are unique across a harness
+Node = Tuple[str, str]
+
+NETLIST_EXPORT_HEADER = ["Net", "Designator", "Pin/Wire", "Kind", "Label"]
+
+
+def _node(item: Any, designator: Optional[str] = None) -> Node:
+    return (str(designator or item.parent), str(item.id))
+
+
+@dataclass
+class NetMember:
+    designator: str
+    id: str
+    kind: str  # "pin", "wire" or "shield"
+    label: str = ""
+
+    def __str__(self) -> str:
+        return f"{self.designator}:{self.id}"
+
+
+@dataclass
+class Net:
+    name: str
+    members: List[NetMember] = field(default_factory=list)
+
+    @property
+    def pins(self) -> List[NetMember]:
+        return [member for member in self.members if member.kind == "pin"]
+
+    @property
+    def wires(self) -> List[NetMember]:
+        return [member for member in self.members if member.kind != "pin"]
+
+    def record(self) -> Dict[str, Any]:
+        """JSON-serializable representation of the net."""
+        return {
+            "name": self.name,
+            "pins": [str(member) for member in self.pins],
+            "wires": [str(member) for member in self.wires],
+        }
+
+
+class Netlist:
+    """Nets of a harness, indexed by pin and by name."""
+
+    def __init__(self, nets: List[Net], pins: Dict[Node, Optional[int]]):
+        self.nets = nets
+        self._pins = pins
+        self._by_name = {net.name: index for index, net in enumerate(nets)}
+
+    @classmethod
+    def from_harness(cls, harness: Any) -> "Netlist":
+        members: Dict[Node, NetMember] = {}
+        parent: Dict[Node, Node] = {}
+
+        def find(node: Node) -> Node:
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        def union(a: Node, b: Node) -> None:
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_b] = root_a
+
+        def add(node: Node, kind: str, label: Any) -> None:
+            if node not in parent:
+                parent[node] = node
+                members[node] = NetMember(node[0], node[1], kind, str(label or ""))
+
+        for designator, connector in harness.connectors.items():
+            for pin in connector.pin_objects.values():
+                add(_node(pin, designator), "pin", pin.label)
+        for designator, cable in harness.cables.items():
+            for wire in cable.wire_objects.values():
+                kind = "shield" if wire.is_shield else "wire"
+                add(_node(wire, designator), kind, wire.label)
+
+        for designator, connector in harness.connectors.items():
+            for loop in connector.loops:
+                if loop.first is not None and loop.second is not None:
+                    union(_node(loop.first, designator), _node(loop.second, designator))
+        for designator, cable in harness.cables.items():
+            for connection in cable._connections:
+                via = connection.via
+                if via is None:
+                    continue
+                via_node = _node(via, via.parent or designator)
+                if hasattr(via, "is_shield"):
+                    add(via_node, "shield" if via.is_shield else "wire", via.label)
+                else:
+                    add(via_node, "pin", via.label)
+                for end in (connection.from_, connection.to):
+                    if end is not None:
+                        end_node = _node(end)
+                        add(end_node, "pin", end.label)
+                        union(via_node, end_node)
+
+        # only nodes joined to something else form a net; nets are numbered in
+        # the order of their first member (connectors first, then cables)
+        groups: Dict[Node, List[Node]] = {}
+        for node in parent:
+            groups.setdefault(find(node), []).append(node)
+        nets: List[Net] = []
+        net_of_root: Dict[Node, int] = {}
+        for root, nodes in groups.items():
+            if len(nodes) > 1:
+                net_of_root[root] = len(nets)
+                nets.append(Net(str(members[nodes[0]]), [members[n] for n in nodes]))
+        pins = {
+            node: net_of_root.get(find(node))
+            for node, member in members.items()
+            if member.kind == "pin"
+        }
+        return cls(nets, pins)
+
+    def __len__(self) -> int:
+        return len(self.nets)
+
+    def __iter__(self) -> Iterator[Net]:
+        return iter(self.nets)
+
+    def net(self, name: str) -> Net:
+        """Net by name (the first pin or wire of the net, e.g. ``X1:1``)."""
+        return self.nets[self._by_name[name]]
+
+    def _net_index(self, designator: str, pin: Union[int, str]) -> Optional[int]:
+        node = (str(designator), str(pin))
+        if node not in self._pins:
+            raise PinResolutionError(str(designator), f"Pin {pin} does not exist")
+        return self._pins[node]
+
+    def net_of(self, designator: str, pin: Union[int, str]) -> Optional[Net]:
+        """Net containing a connector pin, or None when the pin is unconnected."""
+        index = self._net_index(designator, pin)
+        return None if index is None else self.nets[index]
+
+    def connected(
+        self, a: Tuple[str, Union[int, str]], b: Tuple[str, Union[int, str]]
+    ) -> bool:
+        """Whether two ``(designator, pin)`` pins are electrically joined."""
+        if tuple(map(str, a)) == tuple(map(str, b)):
+            return True
+        index = self._net_index(*a)
+        return index is not None and index == self._net_index(*b)
+
+
+def iter_netlist_rows(netlist: Netlist) -> Iterator[List[str]]:
+    """Yield one row per net member."""
+    for net in netlist:
+        for member in net.members:
+            yield [net.name, member.designator, member.id, member.kind, member.label]
+
+
+def write_netlist_csv(stream: IO[str], netlist: Netlist) -> int:
+    """Write one CSV row per net member; ``stream`` should use newline=""."""
+    writer = csv.writer(stream, lineterminator="\r\n")
+    writer.writerow(NETLIST_EXPORT_HEADER)
+    count = 0
+    for row in iter_netlist_rows(netlist):
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_netlist_json(stream: IO[str], netlist: Netlist) -> int:
+    """Write the nets as a JSON list of ``{name, pins, wires}`` records."""
+    json.dump([net.record() for net in netlist], stream, ensure_ascii=False, indent=2)
+    stream.write("\n")
+    return len(netlist)
+
+
+__all__ = [
+    "NETLIST_EXPORT_HEADER",
+    "Net",
+    "NetMember",
+    "Netlist",
+    "iter_netlist_rows",
+    "write_netlist_csv",
+    "write_netlist_json",
+]
@@ -1,23 +1,90 @@
+from functools import lru_cache
 from math import modf
-from typing import Any, Union
+from typing import Any, Dict, Mapping, Union
 
 import factory  # type: ignore[reportPrivateImportUsage]
 from factory import Factory  # type: ignore[reportPrivateImportUsage]
 from factory.declarations import LazyAttribute  # type: ignore[reportPrivateImportUsage]
 from faker import Faker  # type: ignore[reportPrivateImportUsage]
-from pydantic import BaseModel, ConfigDict
+from pydantic_core import core_schema
 
-from filare.errors import UnitMismatchError
+from filare.errors import UnitMismatchError, UnsupportedModelOperation
 
 faker = Faker()
 
 
-class NumberAndUnit(BaseModel):
+@lru_cache(maxsize=4096)
+def _parse_number_and_unit(inp: str, default_unit: Union[str, None]) -> "NumberAndUnit":
+    if " " in inp:
+        number, unit = inp.split(" ", 1)
+    else:
+        number, unit = inp, default_unit
+    return NumberAndUnit(float(number), unit)
+
+
+class NumberAndUnit:
+    """Immutable, hashable number with an optional unit.
+
+    Quantities are added and scaled many times while BOMs are merged, so this
+    is a plain slotted value type; pydantic models use it as a field type
+    through ``__get_pydantic_core_schema__`` and dump it as
+    ``{"number": ..., "unit": ...}``.
+    """
+
+    __slots__ = ("number", "unit")
+
     number: float
-    unit: Union[str, None] = None
+    unit: Union[str, None]
+
+    def __init__(self, number, unit=None):
+        object.__setattr__(self, "number", float(number))
+        object.__setattr__(self, "unit", unit)
+
+    def __setattr__(self, name, value):
+        raise UnsupportedModelOperation(f"setting {name} on an immutable NumberAndUnit")
+
+    def __delattr__(self, name):
+        raise UnsupportedModelOperation(
+            f"deleting {name} on an immutable NumberAndUnit"
+        )
+
+    def __reduce__(self):
+        return (type(self), (self.number, self.unit))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any):
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(cls.as_dict),
+        )
 
-    def __init__(self, number, unit=None, **data):
-        super().__init__(number=number, unit=unit, **data)
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: Any, handler: Any):
+        return {
+            "type": "object",
+            "properties": {
+                "number": {"type": "number"},
+                "unit": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+            },
+            "required": ["number"],
+        }
+
+    @classmethod
+    def _validate(cls, value: Any) -> "NumberAndUnit":
+        if isinstance(value, NumberAndUnit):
+            return value
+        if isinstance(value, Mapping) and "number" in value:
+            return cls(value["number"], value.get("unit"))
+        raise ValueError(f"Expected a number with unit, got {value!r}")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"number": self.number, "unit": self.unit}
 
     @classmethod
     def to_number_and_unit(
@@ -29,25 +96,20 @@ class NumberAndUnit(BaseModel):
     ):
         if inp is None:
             if default_value is not None:
-                return cls(number=default_value, unit=default_unit)
+                return cls(default_value, default_unit)
             return None
         elif isinstance(inp, NumberAndUnit):
             return inp
         elif isinstance(inp, float) or isinstance(inp, int):
-            return cls(number=float(inp), unit=default_unit)
+            return cls(inp, default_unit)
         elif isinstance(inp, str):
-            if " " in inp:
-                number, unit = inp.split(" ", 1)
-            else:
-                number, unit = inp, default_unit
             try:
-                number = float(number)
+                # equal strings parse to one shared (immutable) instance
+                return _parse_number_and_unit(inp, default_unit)
             except ValueError as err:
                 from filare.errors import InvalidNumberFormat
 
                 raise InvalidNumberFormat(inp, context=context) from err
-            else:
-                return cls(number=number, unit=unit)
 
     def chose_unit(self, other):
         if self.unit is None:
@@ -68,31 +130,33 @@ class NumberAndUnit(BaseModel):
     def __str__(self):
         return " ".join((self.number_str, self.unit_str)).strip()
 
+    def __repr__(self):
+        return f"NumberAndUnit(number={self.number!r}, unit={self.unit!r})"
+
     def __eq__(self, other):
+        if not isinstance(other, NumberAndUnit):
+            return NotImplemented
         return self.number == other.number and self.unit == other.unit
 
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-        populate_by_name=True,
-    )
+    def __hash__(self):
+        return hash((self.number, self.unit))
 
-    def __add__(self, other):
-        other = NumberAndUnit.to_number_and_unit(other, self.unit, 0)
+    def _operand(self, other, default_value):
+        if isinstance(other, NumberAndUnit):
+            return other
+        if isinstance(other, (int, float)):
+            return NumberAndUnit(other, self.unit)
+        other = NumberAndUnit.to_number_and_unit(other, self.unit, default_value)
         assert other is not None
+        return other
 
-        return NumberAndUnit(
-            number=float(self.number) + float(other.number),
-            unit=self.chose_unit(other),
-        )
+    def __add__(self, other):
+        other = self._operand(other, 0)
+        return NumberAndUnit(self.number + other.number, self.chose_unit(other))
 
     def __mul__(self, other):
-        other = NumberAndUnit.to_number_and_unit(other, self.unit, 1)
-        assert other is not None
-
-        return NumberAndUnit(
-            number=float(self.number) * float(other.number),
-            unit=self.chose_unit(other),
-        )
+        other = self._operand(other, 1)
+        return NumberAndUnit(self.number * other.number, self.chose_unit(other))
 
 
 class FakeNumberAndUnitFactory(Factory):
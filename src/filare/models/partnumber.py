@@ -1,4 +1,3 @@
-from functools import reduce
 from typing import (
     Any,
     ClassVar,
@@ -12,7 +11,13 @@ from typing import (
     Union,
 )
 
-from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PrivateAttr,
+    ValidationError,
+    field_validator,
+)
 
 USING_PYDANTIC_V1 = False
 
@@ -24,9 +29,28 @@ from filare.models.utils import awg_equiv, mm2_equiv, remove_links
 
 faker = Faker()
 
+PARTNUMBER_FIELDS = ("pn", "manufacturer", "mpn", "supplier", "spn")
+# past this many entries, new part numbers are still frozen but not shared
+MAX_INTERNED_PARTNUMBERS = 16384
+
+FieldsKey = Tuple[Any, ...]
+
+
+def _shared_fields(keys: Sequence[FieldsKey]) -> FieldsKey:
+    """Keep each field whose value is the same across all ``keys``, clear the rest."""
+    return tuple(
+        column[0] if column.count(column[0]) == len(column) else ""
+        for column in zip(*keys)
+    )
+
 
 class PartNumberInfo(BaseModel):
-    """Container for part-identifying metadata used in BOM output."""
+    """Container for part-identifying metadata used in BOM output.
+
+    Instances created through :meth:`intern` (and the results of the
+    comparison helpers) are shared and immutable; use :meth:`copy` to get an
+    editable instance. The hash is computed once and cached.
+    """
 
     pn: Optional[str] = ""
     manufacturer: Optional[str] = ""
@@ -43,6 +67,65 @@ class PartNumberInfo(BaseModel):
         "spn": "SPN",
     }
 
+    _interned: ClassVar[Dict[FieldsKey, "PartNumberInfo"]] = {}
+    _interned_inputs: ClassVar[Dict[FieldsKey, "PartNumberInfo"]] = {}
+    _hash: Optional[int] = PrivateAttr(default=None)
+    _frozen: bool = PrivateAttr(default=False)
+
+    @classmethod
+    def intern(
+        cls,
+        pn: Any = "",
+        manufacturer: Any = "",
+        mpn: Any = "",
+        supplier: Any = "",
+        spn: Any = "",
+    ) -> "PartNumberInfo":
+        """Return the shared, immutable instance for these fields."""
+        raw = tuple(
+            "" if v is None else v for v in (pn, manufacturer, mpn, supplier, spn)
+        )
+        cacheable = all(isinstance(v, str) for v in raw)
+        if cacheable and raw in cls._interned_inputs:
+            return cls._interned_inputs[raw]
+        part = cls(**dict(zip(PARTNUMBER_FIELDS, raw)))
+        shared = cls._interned.get(part.fields_key)
+        part = cls._remember(part) if shared is None else shared
+        if cacheable and len(cls._interned_inputs) < MAX_INTERNED_PARTNUMBERS:
+            cls._interned_inputs[raw] = part
+        return part
+
+    @classmethod
+    def _from_fields(cls, key: FieldsKey) -> "PartNumberInfo":
+        """Intern already validated field values, skipping validation."""
+        part = cls._interned.get(key)
+        if part is None:
+            part = cls._remember(
+                cls.model_construct(**dict(zip(PARTNUMBER_FIELDS, key)))
+            )
+        return part
+
+    @classmethod
+    def _remember(cls, part: "PartNumberInfo") -> "PartNumberInfo":
+        part._frozen = True
+        if len(cls._interned) < MAX_INTERNED_PARTNUMBERS:
+            cls._interned[part.fields_key] = part
+        return part
+
+    @property
+    def fields_key(self) -> FieldsKey:
+        """Identifying fields as a tuple, in PARTNUMBER_FIELDS order."""
+        return (self.pn, self.manufacturer, self.mpn, self.supplier, self.spn)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in PARTNUMBER_FIELDS:
+            if self._frozen:
+                raise UnsupportedModelOperation(
+                    f"setting {name} on a shared PartNumberInfo, use copy() first"
+                )
+            self._hash = None
+        super().__setattr__(name, value)
+
     def __bool__(self) -> bool:
         """Evaluate truthy if any identifying field is set."""
         return bool(
@@ -50,10 +133,20 @@ class PartNumberInfo(BaseModel):
         )
 
     def __hash__(self):
-        return hash((self.pn, self.manufacturer, self.mpn, self.supplier, self.spn))
+        if self._hash is None:
+            self._hash = hash(self.fields_key)
+        return self._hash
+
+    def __reduce_ex__(self, protocol):
+        # the cached hash is only valid in this process; shared instances are
+        # interned again when unpickled
+        if self._frozen:
+            return (type(self)._from_fields, (self.fields_key,))
+        self._hash = None
+        return super().__reduce_ex__(protocol)
 
     def __eq__(self, other):
-        return hash(self) == hash(other)
+        return self is other or hash(self) == hash(other)
 
     def __getitem__(self, key: str) -> Any:
         return getattr(self, key)
@@ -144,11 +237,9 @@ class PartNumberInfo(BaseModel):
         other: Optional[Union["PartNumberInfo", "PartnumberInfoList"]],
     ) -> Optional["PartNumberInfo"]:
         """Clear matching or non-matching fields based on an operator."""
-        part = self.copy()
-
         if other is None:
             if op == "==":
-                return part
+                return self.copy()
             elif op == "!=":
                 return None
             else:
@@ -156,23 +247,31 @@ class PartNumberInfo(BaseModel):
         assert other is not None
 
         if isinstance(other, PartnumberInfoList):
+            part: Optional[PartNumberInfo] = self.copy()
             for item in other.pn_list:
                 if part is None:
                     break
                 part = part.clear_per_field(op, item)
+            return part
+
+        other_key = (
+            other.fields_key
+            if isinstance(other, PartNumberInfo)
+            else tuple(getattr(other, k) for k in PARTNUMBER_FIELDS)
+        )
+        if op == "==":
+            key = tuple(
+                "" if mine == theirs else mine
+                for mine, theirs in zip(self.fields_key, other_key)
+            )
+        elif op == "!=":
+            key = tuple(
+                mine if mine == theirs else ""
+                for mine, theirs in zip(self.fields_key, other_key)
+            )
         else:
-            for k in ["pn", "manufacturer", "mpn", "supplier", "spn"]:
-                part_value = getattr(part, k)
-                other_value = getattr(other, k)
-                if op == "==":
-                    if part_value == other_value:
-                        setattr(part, k, "")
-                elif op == "!=":
-                    if part_value != other_value:
-                        setattr(part, k, "")
-                else:
-                    raise UnsupportedModelOperation(f"op {op} not supported")
-        return part
+            raise UnsupportedModelOperation(f"op {op} not supported")
+        return PartNumberInfo._from_fields(key)
 
     def keep_only_eq(
         self, other: Optional["PartNumberInfo"]
@@ -182,16 +281,19 @@ class PartNumberInfo(BaseModel):
     def remove_eq(self, other: Optional["PartNumberInfo"]):
         return self.clear_per_field("==", other)
 
+    def replace(self, **changes: Any) -> "PartNumberInfo":
+        """Return the shared instance with some fields replaced."""
+        fields = dict(zip(PARTNUMBER_FIELDS, self.fields_key))
+        fields.update(changes)
+        return PartNumberInfo.intern(**fields)
+
     @staticmethod
     def list_keep_only_eq(
         partnumbers: Sequence["PartNumberInfo"],
     ) -> Optional["PartNumberInfo"]:
-        pn: Optional["PartNumberInfo"] = partnumbers[0]
-        for p in partnumbers:
-            if pn is None:
-                break
-            pn = pn.keep_only_eq(p)
-        return pn
+        return PartNumberInfo._from_fields(
+            _shared_fields([p.fields_key for p in partnumbers])
+        )
 
     def as_list(self, parent_partnumbers=None):
         return partnumbers2list(self, parent_partnumbers)
@@ -207,19 +309,15 @@ class PartnumberInfoList(BaseModel):
     is_list: bool = True
 
     def keep_only_shared(self):
-        uniques = list(set(tuple(self.pn_list)))
+        uniques = self.as_unique_list()
         if not uniques:
             return None
-
-        shared: Optional[PartNumberInfo] = uniques[0]
-        for item in uniques[1:]:
-            if shared is None:
-                break
-            shared = shared.keep_only_eq(item)
-        return shared
+        return PartNumberInfo._from_fields(
+            _shared_fields([pn.fields_key for pn in uniques])
+        )
 
     def as_unique_list(self):
-        return list(set(tuple(self.pn_list)))
+        return list(dict.fromkeys(self.pn_list))
 
     def keep_only_eq(
         self, other: "PartNumberInfo"
@@ -234,15 +332,24 @@ class PartnumberInfoList(BaseModel):
     def keep_unique(
         self, other: Union[List[PartNumberInfo], Iterable[PartNumberInfo]]
     ) -> Iterator[PartNumberInfo]:
-        kept = []
-        for pn_1 in self.pn_list:
-            for pn_2 in self.pn_list:
-                if pn_1 == pn_2:
-                    continue
-                eq = pn_1.keep_only_eq(pn_2)
-                if eq:
-                    kept.append(eq)
-        if not kept:
+        """Yield ``other`` with the fields shared by related parts cleared.
+
+        Two parts are related when they share a non-empty field value; the
+        fields common to all related parts are removed. Without related parts,
+        the fields common to the whole list are removed instead.
+        """
+        uniques = [pn.fields_key for pn in self.as_unique_list()]
+        counts: List[Dict[Any, int]] = [{} for _ in PARTNUMBER_FIELDS]
+        for key in uniques:
+            for count, value in zip(counts, key):
+                if value:
+                    count[value] = count.get(value, 0) + 1
+        related = [
+            key
+            for key in uniques
+            if any(value and count[value] > 1 for count, value in zip(counts, key))
+        ]
+        if not related:
             shared = self.keep_only_shared()
             if shared:
                 for pn in other:
@@ -252,7 +359,7 @@ class PartnumberInfoList(BaseModel):
             else:
                 yield from other
         else:
-            shared = reduce(lambda x, y: x.keep_only_eq(y), kept)
+            shared = PartNumberInfo._from_fields(_shared_fields(related))
             for pn in other:
                 result = pn.remove_eq(shared)
                 if result:
@@ -24,7 +24,9 @@ Side = Enum("Side", "LEFT RIGHT")
 AUTOGENERATED_PREFIX = "AUTOGENERATED_"
 
 BomCategory = IntEnum(  # to enforce ordering in BOM
-    "BomEntry", "CONNECTOR CABLE WIRE PIN ADDITIONAL BUNDLE"
+    "BomEntry",
+    "CONNECTOR CABLE WIRE PIN ADDITIONAL BUNDLE",
+    qualname="BomCategory",  # picklable under the name it is bound to
 )
 QtyMultiplierConnector = Enum(
     "QtyMultiplierConnector", "PINCOUNT POPULATED CONNECTIONS"
@@ -1,10 +1,12 @@
 """Shared table models for BOM, cut, and termination-style tables."""
 
 from string import ascii_lowercase
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+RowT = TypeVar("RowT")
+
 
 class TableCell(BaseModel):
     """Represents a single cell in a rendered table."""
@@ -42,15 +44,60 @@ class TablePage(BaseModel):
 
     index: int
     suffix: str = ""
-    rows: List[TableRow] = Field(default_factory=list)
+    rows: List[Any] = Field(default_factory=list)
     html: str = ""
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     def with_html(self, html: str) -> "TablePage":
-        return TablePage(
-            index=self.index, suffix=self.suffix, rows=self.rows, html=html
+        return self.model_copy(update={"html": html})
+
+
+class TableData:
+    """Header, column classes and rows of a table, stored as plain tuples."""
+
+    __slots__ = ("header", "columns_class", "rows")
+
+    def __init__(
+        self,
+        header: Sequence[Any],
+        rows: Sequence[Sequence[Any]],
+        columns_class: Optional[Sequence[str]] = None,
+    ):
+        self.header = tuple(str(value) for value in header)
+        if columns_class is None:
+            columns_class = [""] * len(self.header)
+        self.columns_class = tuple(columns_class)
+        self.rows = [tuple(str(value) for value in row) for row in rows]
+
+    def strip_empty_columns(self) -> "TableData":
+        """Drop the columns whose header is empty."""
+        keep = [idx for idx, value in enumerate(self.header) if value != ""]
+        if len(keep) == len(self.header):
+            return self
+        stripped = TableData.__new__(TableData)
+        stripped.header = tuple(self.header[idx] for idx in keep)
+        stripped.columns_class = tuple(
+            self.columns_class[idx] for idx in keep if idx < len(self.columns_class)
         )
+        stripped.rows = [tuple(row[idx] for idx in keep) for row in self.rows]
+        return stripped
+
+    def to_table_rows(self) -> List[TableRow]:
+        """Return rows as TableRow objects with css classes preserved."""
+        classes = self.columns_class
+        return [
+            TableRow(
+                cells=[
+                    TableCell(
+                        value=value,
+                        css_class=classes[idx] if idx < len(classes) else None,
+                    )
+                    for idx, value in enumerate(row)
+                ]
+            )
+            for row in self.rows
+        ]
 
 
 def letter_suffix(index: int) -> str:
@@ -68,24 +115,52 @@ def letter_suffix(index: int) -> str:
     return result
 
 
+def paginate_table(
+    rows: Sequence[RowT],
+    rows_per_page: Optional[int] = None,
+    use_letter_suffix: bool = True,
+    max_height: Optional[float] = None,
+    row_height: Optional[Callable[[RowT], float]] = None,
+) -> List[Tuple[str, List[RowT]]]:
+    """Split rows into ``(suffix, rows)`` pages in a single pass.
+
+    A page ends once it holds ``rows_per_page`` rows or when the next row
+    would push its estimated height (``row_height(row)``, 1 per row by
+    default) past ``max_height``. A page always takes at least one row.
+    """
+    if not rows:
+        return []
+    if not rows_per_page and max_height is None:
+        return [("", list(rows))]
+    chunks: List[List[RowT]] = []
+    current: List[RowT] = []
+    height = 0.0
+    for row in rows:
+        this_height = row_height(row) if row_height is not None else 1.0
+        full = bool(rows_per_page) and len(current) >= int(rows_per_page or 0)
+        too_high = max_height is not None and height + this_height > max_height
+        if current and (full or too_high):
+            chunks.append(current)
+            current, height = [], 0.0
+        current.append(row)
+        height += this_height
+    chunks.append(current)
+    if use_letter_suffix and len(chunks) > 1:
+        return [(letter_suffix(idx), chunk) for idx, chunk in enumerate(chunks)]
+    return [("", chunk) for chunk in chunks]
+
+
 def paginate_rows(
-    rows: List[TableRow], pagination: TablePaginationOptions
+    rows: Sequence[Any], pagination: TablePaginationOptions
 ) -> List[TablePage]:
     """Split rows into pages according to the pagination options."""
     if not pagination.enabled or not pagination.rows_per_page:
-        return [TablePage(index=0, suffix="", rows=rows)]
-
-    per_page = int(pagination.rows_per_page)
-    chunks: List[List[TableRow]] = [
-        rows[i : i + per_page] for i in range(0, len(rows), per_page)
-    ]
-    suffixes: List[str] = []
-    if pagination.use_letter_suffix and len(chunks) > 1:
-        suffixes = [letter_suffix(idx) for idx in range(len(chunks))]
-    else:
-        suffixes = ["" for _ in chunks]
+        return [TablePage(index=0, suffix="", rows=list(rows))]
 
+    chunks = paginate_table(
+        rows, pagination.rows_per_page, pagination.use_letter_suffix
+    )
     return [
-        TablePage(index=idx, suffix=suffixes[idx], rows=chunk)
-        for idx, chunk in enumerate(chunks)
+        TablePage(index=idx, suffix=suffix, rows=chunk)
+        for idx, (suffix, chunk) in enumerate(chunks)
     ]
@@ -52,6 +52,8 @@ class TemplateCableComponent(BaseModel):
     image: Optional[str] = None
     additional_components: List[object] = Field(default_factory=list)
     notes: Optional[MultilineHypertext] = None
+    # wire colors are repeated to this many stripes (3 when any wire is multicolor)
+    wire_padding: int = 1
 
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
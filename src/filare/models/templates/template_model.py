@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, ClassVar, Dict, Type
 
 from pydantic import BaseModel, ConfigDict
@@ -27,6 +28,30 @@ class TemplateModel(BaseModel):
         return get_template(f"{self.template_name}.html").render(self.to_render_dict())
 
 
+def frame_marker(name: str) -> str:
+    """Stand-in rendered in place of a per-page value (see TemplateFrame)."""
+    return f"\x00{name}\x00"
+
+
+@dataclass(frozen=True)
+class TemplateFrame:
+    """Template output rendered once with frame_marker() stand-ins.
+
+    Pages that differ only in a few values fill them in with plain string
+    substitution instead of rendering the template again. Only values the
+    template prints as they are (not tested, filtered or formatted) can be
+    stand-ins.
+    """
+
+    html: str
+
+    def fill(self, **values: Any) -> str:
+        html = self.html
+        for name, value in values.items():
+            html = html.replace(frame_marker(name), str(value))
+        return html
+
+
 class TemplateModelFactory:
     """Minimal factory-style helper aligned with factory_boy semantics."""
 
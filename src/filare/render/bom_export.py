@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""Streaming BOM table writers (CSV, TSV, JSON lines).
+
+Rows are produced one entry at a time straight from the BOM entries and
+written as they are produced, so exporting a BOM never builds the full table
+in memory.
+"""
+
+import csv
+import json
+from math import modf
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Mapping
+
+from filare.errors import UnsupportedBomExportFormat
+from filare.models.bom import BomEntry, BomEntryBase
+from filare.models.numbers import NumberAndUnit
+from filare.models.utils import remove_links
+
+BOM_EXPORT_SUFFIXES = {
+    "csv": ".csv",
+    "tsv": ".tsv",
+    "jsonl": ".jsonl",
+}
+
+
+def bom_export_header(include_per_harness: bool = True) -> List[str]:
+    """Column titles, matching the rendered BOM table."""
+    keys = ["id", "qty", "unit", "description", "designators"]
+    if include_per_harness:
+        keys.append("per_harness")
+    return [BomEntry.BOM_KEY_TO_COLUMNS[key] for key in keys]
+
+
+def _number(value: Any) -> Any:
+    if isinstance(value, NumberAndUnit):
+        value = value.number
+    if isinstance(value, float) and not modf(value)[0]:
+        return int(value)
+    return value
+
+
+def _cell(value: Any) -> str:
+    value = _number(value)
+    if isinstance(value, float):
+        return f"{value:.10g}"
+    return str(value)
+
+
+def _per_harness_qty(data: Any) -> Any:
+    return data["qty"] if isinstance(data, Mapping) else data
+
+
+def iter_bom_entries(
+    bom: Mapping[Any, BomEntryBase], filter_entries: bool = True
+) -> Iterator[BomEntryBase]:
+    """Yield BOM entries in order, skipping empty quantities when filtering."""
+    for entry in bom.values():
+        if filter_entries and entry.qty.number <= 0:
+            continue
+        yield entry
+
+
+def iter_bom_rows(
+    bom: Mapping[Any, BomEntryBase],
+    include_per_harness: bool = True,
+    filter_entries: bool = True,
+) -> Iterator[List[str]]:
+    """Yield one row of cell strings per BOM entry (untruncated, links removed)."""
+    for entry in iter_bom_entries(bom, filter_entries):
+        row = [
+            str(entry.id or ""),
+            _cell(entry.qty.number),
+            entry.unit,
+            remove_links(entry.description),
+            ", ".join(str(d) for d in entry.designators),
+        ]
+        if include_per_harness:
+            row.append(
+                "; ".join(
+                    f"{harness}: {_per_harness_qty(data)}"
+                    for harness, data in entry.per_harness.items()
+                )
+            )
+        yield row
+
+
+def bom_entry_record(
+    entry: BomEntryBase, include_per_harness: bool = True
+) -> Dict[str, Any]:
+    """JSON-serializable record of a BOM entry, keyed by internal names."""
+    record: Dict[str, Any] = {
+        "id": entry.id,
+        "qty": _number(entry.qty.number),
+        "unit": entry.qty.unit,
+        "description": remove_links(entry.description),
+        "designators": [str(d) for d in entry.designators],
+        "category": entry.category,
+        "partnumbers": entry.partnumbers.bom_dict,
+    }
+    if include_per_harness:
+        per_harness = {}
+        for harness, data in entry.per_harness.items():
+            qty = _per_harness_qty(data)
+            per_harness[harness] = {
+                "qty": _number(qty),
+                "unit": qty.unit if isinstance(qty, NumberAndUnit) else None,
+            }
+        record["per_harness"] = per_harness
+    return record
+
+
+def write_bom_csv(
+    stream: IO[str],
+    bom: Mapping[Any, BomEntryBase],
+    include_per_harness: bool = True,
+    filter_entries: bool = True,
+) -> int:
+    """Write the BOM as RFC 4180 CSV; ``stream`` should be opened with newline=""."""
+    writer = csv.writer(stream, lineterminator="\r\n")
+    writer.writerow(bom_export_header(include_per_harness))
+    count = 0
+    for row in iter_bom_rows(bom, include_per_harness, filter_entries):
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def _tsv_field(value: str) -> str:
+    return value.replace("\t", " ").replace("\r", " ").replace("\n", " ")
+
+
+def write_bom_tsv(
+    stream: IO[str],
+    bom: Mapping[Any, BomEntryBase],
+    include_per_harness: bool = True,
+    filter_entries: bool = True,
+) -> int:
+    """Write the BOM as tab-separated values (tabs/newlines in cells become spaces)."""
+    stream.write("\t".join(bom_export_header(include_per_harness)) + "\n")
+    count = 0
+    for row in iter_bom_rows(bom, include_per_harness, filter_entries):
+        stream.write("\t".join(_tsv_field(cell) for cell in row) + "\n")
+        count += 1
+    return count
+
+
+def write_bom_jsonl(
+    stream: IO[str],
+    bom: Mapping[Any, BomEntryBase],
+    include_per_harness: bool = True,
+    filter_entries: bool = True,
+) -> int:
+    """Write one JSON object per BOM entry."""
+    count = 0
+    for entry in iter_bom_entries(bom, filter_entries):
+        record = bom_entry_record(entry, include_per_harness)
+        stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+BOM_WRITERS: Dict[str, Callable[..., int]] = {
+    "csv": write_bom_csv,
+    "tsv": write_bom_tsv,
+    "jsonl": write_bom_jsonl,
+}
+
+
+def export_bom(
+    bom: Mapping[Any, BomEntryBase],
+    base: Path,
+    formats: Iterable[str] = ("tsv",),
+    include_per_harness: bool = True,
+    filter_entries: bool = True,
+) -> List[Path]:
+    """Write ``bom`` next to ``base`` in each requested table format."""
+    written = []
+    for fmt in formats:
+        if fmt not in BOM_WRITERS:
+            raise UnsupportedBomExportFormat(fmt)
+        path = Path(base).with_suffix(BOM_EXPORT_SUFFIXES[fmt])
+        with path.open("w", encoding="utf-8", newline="") as stream:
+            BOM_WRITERS[fmt](stream, bom, include_per_harness, filter_entries)
+        written.append(path)
+    return written
+
+
+__all__ = [
+    "BOM_EXPORT_SUFFIXES",
+    "BOM_WRITERS",
+    "bom_entry_record",
+    "bom_export_header",
+    "export_bom",
+    "iter_bom_entries",
+    "iter_bom_rows",
+    "write_bom_csv",
+    "write_bom_jsonl",
+    "write_bom_tsv",
+]
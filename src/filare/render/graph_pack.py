@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Pack separately laid out SVG diagrams into a single SVG.
+
+Used to combine the connected components of a harness graph after they were
+laid out independently (similar to Graphviz ``gvpack``). Components are
+stacked top to bottom in the given order, each one kept as a nested ``<svg>``
+so its own coordinates and viewBox are preserved. :func:`pack_pngs` stacks
+raster renders of the same components the same way.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+from typing import List, Sequence, Tuple
+
+from PIL import Image
+
+from filare.errors import InvalidSVGRoot
+from filare.render.imported_svg import SVG_TAG_PATTERN, strip_svg_declarations
+
+DEFAULT_GAP_PT = 36.0
+
+_LENGTH_PATTERN = re.compile(r'\b(?P<name>width|height)="(?P<value>[\d.]+)(pt)?"')
+_VIEWBOX_PATTERN = re.compile(r'\bviewBox="(?P<value>[^"]*)"')
+_ID_PATTERN = re.compile(r'\bid="(?P<id>[^"]+)"')
+_BACKGROUND_PATTERN = re.compile(
+    r'<polygon fill="(?P<fill>[^"]+)" stroke="(?:none|transparent)"'
+)
+
+
+def _split_svg(svg: str, name: str) -> Tuple[float, float, str, str]:
+    """Return width, height (pt), viewBox and inner markup of an SVG document."""
+    svg = strip_svg_declarations(svg)
+    match = SVG_TAG_PATTERN.search(svg)
+    if match is None:
+        raise InvalidSVGRoot(name)
+    attrs = match["attrs"]
+    lengths = {m["name"]: float(m["value"]) for m in _LENGTH_PATTERN.finditer(attrs)}
+    width, height = lengths.get("width", 0.0), lengths.get("height", 0.0)
+    viewbox_match = _VIEWBOX_PATTERN.search(attrs)
+    viewbox = viewbox_match["value"] if viewbox_match else f"0 0 {width} {height}"
+    inner = svg[match.end() : svg.rindex("</svg>")]
+    return width, height, viewbox, inner
+
+
+def _prefix_ids(markup: str, prefix: str) -> str:
+    ids = set(_ID_PATTERN.findall(markup))
+    if not ids:
+        return markup
+
+    def reference(match: re.Match) -> str:
+        target = match["target"]
+        if target not in ids:
+            return match.group(0)
+        return f"{match['pre']}{prefix}{target}"
+
+    markup = _ID_PATTERN.sub(lambda m: f'id="{prefix}{m["id"]}"', markup)
+    return re.sub(r'(?P<pre>url\(#|href="#)(?P<target>[^)"]+)', reference, markup)
+
+
+def pack_svgs(svgs: Sequence[str], gap: float = DEFAULT_GAP_PT) -> str:
+    """Stack SVG documents vertically into one SVG document."""
+    if len(svgs) == 1:
+        return svgs[0]
+    parts: List[str] = []
+    offset = 0.0
+    width = 0.0
+    background = None
+    for idx, svg in enumerate(svgs):
+        part_width, part_height, viewbox, inner = _split_svg(
+            svg, f"<graph component {idx}>"
+        )
+        if background is None:
+            background_match = _BACKGROUND_PATTERN.search(inner)
+            background = background_match["fill"] if background_match else None
+        parts.append(
+            f'<svg x="0" y="{offset:.2f}" width="{part_width:.2f}" '
+            f'height="{part_height:.2f}" viewBox="{viewbox}">'
+            f"{_prefix_ids(inner, f'c{idx}_')}</svg>"
+        )
+        width = max(width, part_width)
+        offset += part_height + gap
+    height = max(offset - gap, 0.0)
+    fill = (
+        f'<rect width="100%" height="100%" fill="{background}"/>' if background else ""
+    )
+    return (
+        f'<svg width="{width:.0f}pt" height="{height:.0f}pt" '
+        f'viewBox="0.00 0.00 {width:.2f} {height:.2f}" '
+        'xmlns="http://www.w3.org/2000/svg" '
+        'xmlns:xlink="http://www.w3.org/1999/xlink">\n'
+        f"{fill}{''.join(parts)}\n</svg>\n"
+    )
+
+
+def pack_pngs(pngs: Sequence[bytes], dpi: float, gap: float = DEFAULT_GAP_PT) -> bytes:
+    """Stack PNG images rendered at ``dpi`` like :func:`pack_svgs` stacks SVGs."""
+    if len(pngs) == 1:
+        return pngs[0]
+    images = [Image.open(io.BytesIO(png)).convert("RGBA") for png in pngs]
+    gap_px = round(gap * dpi / 72)
+    width = max(image.width for image in images)
+    height = sum(image.height for image in images) + gap_px * (len(images) - 1)
+    # the background of the first component fills the gaps, as in pack_svgs
+    packed = Image.new("RGBA", (width, height), images[0].getpixel((0, 0)))
+    offset = 0
+    for image in images:
+        packed.paste(image, (0, offset))
+        offset += image.height + gap_px
+    data = io.BytesIO()
+    packed.save(data, format="PNG")
+    return data.getvalue()
+
+
+__all__ = ["pack_pngs", "pack_svgs"]
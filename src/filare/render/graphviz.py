@@ -31,27 +31,47 @@ else:  # pragma: no cover
         CableType = ConnectorType = None  # type: ignore
 
 
-def gv_node_connector(connector: Union["ConnectorType", ConnectorModel]) -> str:
-    """Render a connector node as an HTML-like table for Graphviz."""
+DRAFT_COMPONENT_UPDATE = {"image": None, "additional_components": [], "notes": None}
+
+
+def gv_node_connector(
+    connector: Union["ConnectorType", ConnectorModel], draft: bool = False
+) -> str:
+    """Render a connector node as an HTML-like table for Graphviz.
+
+    Draft nodes drop pin color cells, images, notes and additional components.
+    """
     if isinstance(connector, ConnectorModel):
         connector = connector.to_connector()
     # TODO: extend connector style support
     params = {"component": connector, "suppress_images": True}
     is_simple_connector = connector.style == "simple"
     model = build_connector_model(connector)
+    if draft:
+        model.component = model.component.model_copy(
+            update={**DRAFT_COMPONENT_UPDATE, "has_pincolors": False}
+        )
     rendered = model.render()
     cleaned_render = "\n".join([l.rstrip() for l in rendered.split("\n") if l.strip()])
     return cleaned_render
 
 
-def gv_node_cable(cable: Union["CableType", CableModel]) -> str:
-    """Render a cable node as an HTML-like table for Graphviz."""
+def gv_node_cable(
+    cable: Union["CableType", CableModel], draft: bool = False, wire_padding: int = 1
+) -> str:
+    """Render a cable node as an HTML-like table for Graphviz.
+
+    Draft nodes drop images, notes and additional components. Wire colors are
+    repeated to ``wire_padding`` stripes.
+    """
     if isinstance(cable, CableModel):
         cable = cable.to_cable()
     # TODO: support multicolor cables
     # TODO: extend cable style support
     params = {"component": cable, "suppress_images": True}
-    model = build_cable_model(cable)
+    model = build_cable_model(cable, wire_padding=wire_padding)
+    if draft:
+        model.component = model.component.model_copy(update=DRAFT_COMPONENT_UPDATE)
     rendered = model.render()
     cleaned_render = "\n".join([l.rstrip() for l in rendered.split("\n") if l.strip()])
     return cleaned_render
@@ -113,16 +133,16 @@ def gv_connector_loops(connector: Union["ConnectorType", ConnectorModel]) -> Lis
 
 
 def gv_edge_wire(
-    harness, cable, connection
+    harness, cable, connection, wire_padding: int = 1
 ) -> Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str]]:
     """Return Graphviz edge descriptors for a connection through a wire/shield."""
     if isinstance(connection, ConnectionModel):
         connection = connection.to_connection()
     via = getattr(connection, "via", None)
     via_color = getattr(via, "color", None)
-    if via_color and getattr(via_color, "html_padded", None):
+    if via_color and getattr(via_color, "padded_html", None):
         # check if it's an actual wire and not a shield
-        color = f"#000000:{via_color.html_padded}:#000000"
+        color = f"#000000:{via_color.padded_html(wire_padding)}:#000000"
     else:  # it's a shield connection
         color = "#000000"
 
@@ -158,7 +178,7 @@ def gv_edge_wire(
     return color, code_left_1, code_left_2, code_right_1, code_right_2
 
 
-def set_dot_basics(dot, options):
+def set_dot_basics(dot, options, draft: bool = False):
     logging.debug(
         "Configuring Graphviz graph (engine=%s, font=%s, bgcolor=%s)",
         settings.graphviz_engine,
@@ -183,11 +203,13 @@ def set_dot_basics(dot, options):
     dot.attr(
         "graph",
         rankdir="LR",
-        ranksep="3",  # TODO: make conditional on the number of components/connections
+        ranksep=(
+            "1" if draft else "3"
+        ),  # TODO: make conditional on the number of components/connections
         bgcolor=bgcolor.html,
-        nodesep="0.33",
+        nodesep="0.2" if draft else "0.33",
         fontname=options.fontname,
-        splines="polyline",
+        splines="line" if draft else "polyline",
     )
     dot.attr(
         "node",
@@ -10,11 +10,13 @@ from pydantic import BaseModel, ConfigDict
 
 import filare
 from filare.flows.templates import (
-    build_aux_table_model,
+    build_aux_page_frame,
+    build_aux_table_html,
     build_index_table_model,
     build_notes_model,
     build_page_model,
-    build_titleblock_model,
+    render_titleblock,
+    titleblock_frame,
 )
 from filare.index_table import IndexTable
 from filare.models.bom import BomContent, BomRenderOptions
@@ -22,14 +24,28 @@ from filare.models.harness_quantity import HarnessQuantity
 from filare.models.metadata import Metadata
 from filare.models.notes import Notes, get_page_notes
 from filare.models.options import PageOptions, get_page_options
-from filare.models.table_models import TablePage, TablePaginationOptions, letter_suffix
+from filare.models.table_models import (
+    TablePage,
+    TablePaginationOptions,
+    letter_suffix,
+    paginate_table,
+)
 from filare.models.templates.notes_template_model import TemplateNotesOptions
+from filare.models.templates.template_model import TemplateFrame
+from filare.render.bom_export import export_bom
+from filare.render.html_assets import (
+    ASSETS_DIR,
+    externalize_assets,
+    write_html_page,
+)
 from filare.render.imported_svg import (
     build_import_container_style,
     build_import_inner_style,
     prepare_imported_svg,
     strip_svg_declarations,
 )
+from filare.render.pdf_diagram import raster_diagram_html
+from filare.settings import settings
 
 
 def generate_shared_bom(
@@ -38,9 +54,9 @@ def generate_shared_bom(
     use_qty_multipliers=False,
     files=None,
     multiplier_file_name: Optional[str] = None,
+    formats: Sequence[str] = ("tsv",),
 ):
     shared_bom_base = output_dir / "shared_bom"
-    shared_bom_file = shared_bom_base.with_suffix(".tsv")
     print(f"Generating shared bom at {shared_bom_base}")
 
     if use_qty_multipliers:
@@ -51,16 +67,7 @@ def generate_shared_bom(
         for bom_item in shared_bom.values():
             bom_item.scale_per_harness(harnesses.multipliers)
 
-    bom_render = BomContent(shared_bom).get_bom_render(
-        options=BomRenderOptions(
-            restrict_printed_lengths=False,
-            filter_entries=False,
-            no_per_harness=False,
-            reverse=False,
-        )
-    )
-
-    shared_bom_file.open("w").write(bom_render.as_tsv())
+    export_bom(shared_bom, shared_bom_base, formats, filter_entries=False)
 
     return shared_bom_base
 
@@ -136,10 +143,10 @@ def generate_html_output(
     assert metadata and isinstance(metadata, Metadata), "metadata should be defiend"
     template_name = metadata.template.name
 
+    # only top-level fields of the render options are changed below, so a
+    # shallow copy keeps ``options`` intact
     options_for_render = (
-        options.model_copy(deep=True)
-        if hasattr(options, "model_copy")
-        else copy.deepcopy(options)
+        options.model_copy() if hasattr(options, "model_copy") else copy.copy(options)
     )
     rendered = {} if rendered is None else dict(rendered)
 
@@ -268,9 +275,7 @@ def generate_html_output(
     # TODO: all rendering should be done within their respective classes
 
     # prepare titleblock
-    rendered["titleblock"] = build_titleblock_model(
-        metadata, options_for_render, partno
-    ).render()
+    rendered["titleblock"] = render_titleblock(metadata, options_for_render, partno)
 
     notes_candidate = replacements.get("notes")
     if isinstance(notes_candidate, Notes) and notes_candidate.notes:
@@ -297,9 +302,11 @@ def generate_html_output(
         bom_rows=bom_rows,
     )
     page_rendered = page_model.render()
+    if options.for_pdf:
+        page_rendered = raster_diagram_html(page_rendered, filename) or page_rendered
 
     # save generated file
-    filename.with_suffix(".html").open("w").write(page_rendered)
+    _write_page(filename.with_suffix(".html"), page_rendered, options)
     _write_split_sections(filename, metadata, options, rendered, bom_pages=bom_pages)
     _write_aux_pages(
         filename,
@@ -474,7 +481,7 @@ def _write_split_sections(
                 ]
                 title = " - ".join([t for t in title_bits if t])
                 wrapped = _wrap_section_html(title or section, page.html)
-                target.write_text(wrapped, encoding="utf-8")
+                _write_page(target, wrapped, options)
                 logging.info("Wrote paginated %s page to %s", section, target)
             continue
 
@@ -485,10 +492,19 @@ def _write_split_sections(
         title = " - ".join([t for t in title_bits if t])
         page = _wrap_section_html(title or section, content)
         target = filename.with_suffix(f".{section}.html")
-        target.write_text(page, encoding="utf-8")
+        _write_page(target, page, options)
         logging.info("Wrote split %s page to %s", section, target)
 
 
+def _shared_assets(options: PageOptions) -> bool:
+    """Pages rendered for the PDF keep their assets inline."""
+    return settings.html_assets == "shared" and not options.for_pdf
+
+
+def _write_page(target: Path, html: str, options: PageOptions) -> None:
+    write_html_page(target, html, shared_assets=_shared_assets(options))
+
+
 def _wrap_section_html(title: str, body: str) -> str:
     return (
         "<!doctype html>\n"
@@ -510,20 +526,7 @@ def _chunk_rows(
     use_letters: bool,
 ) -> List[Tuple[str, List[Dict[str, str]]]]:
     """Split a list of row dicts into paginated chunks with optional letter suffixes."""
-    if not rows:
-        return []
-    if not rows_per_page:
-        return [("", rows)]
-    per_page = int(rows_per_page)
-    chunks: List[List[Dict[str, str]]] = [
-        rows[i : i + per_page] for i in range(0, len(rows), per_page)
-    ]
-    suffixes: List[str] = (
-        [letter_suffix(idx) for idx in range(len(chunks))]
-        if use_letters and len(chunks) > 1
-        else ["" for _ in chunks]
-    )
-    return list(zip(suffixes, chunks))
+    return paginate_table(rows or [], rows_per_page, use_letters)
 
 
 def _write_aux_pages(
@@ -563,10 +566,27 @@ def _write_aux_pages(
         aux_pages.append(
             ("termination", rendered.get("termination_table", ""), pages or []),
         )
+    if not aux_pages:
+        return
+    # all pages share the sheet's titleblock and part number, only the
+    # titleblock suffix and the table differ between them
+    titleblock = titleblock_frame(metadata, options)
+    # with shared assets, extract them from the frames once instead of per page
+    shared = _shared_assets(options)
+    if shared:
+        titleblock = _externalized_frame(titleblock, filename.parent)
+    sheet_current = getattr(metadata, "sheet_current", 0)
+    page_partno = _build_part_number(
+        getattr(metadata, "pn", ""),
+        getattr(metadata, "revision", ""),
+        sheet_current,
+        getattr(getattr(metadata, "template", None), "name", ""),
+    )
     for suffix, default_html, pages in aux_pages:
         if not pages:
             pages = [("", [])]
         total_pages = len(pages)
+        frames: Dict[bool, TemplateFrame] = {}
         for idx, (page_suffix, rows) in enumerate(pages):
             suffix_for_file = (
                 f".{page_suffix or letter_suffix(idx)}" if total_pages > 1 else ""
@@ -575,33 +595,34 @@ def _write_aux_pages(
             sheet_suffix = (
                 page_suffix if (total_pages > 1 and page_suffix is not None) else ""
             )
-            page_metadata = (
-                metadata.model_copy(update={"sheet_suffix": sheet_suffix})
-                if hasattr(metadata, "model_copy")
-                else metadata
-            )
-            page_partno = _build_part_number(
-                getattr(page_metadata, "pn", ""),
-                getattr(page_metadata, "revision", ""),
-                getattr(page_metadata, "sheet_current", 0),
-                getattr(getattr(page_metadata, "template", None), "name", ""),
-            )
-            page_titleblock = build_titleblock_model(
-                page_metadata, options, page_partno
-            ).render()
-            model = build_aux_table_model(
-                suffix,
-                rows,
-                default_html,
-                page_metadata,
-                options,
-                page_suffix=sheet_suffix,
-                generator=generator_str,
+            table_html = build_aux_table_html(suffix, rows, default_html)
+            with_table = bool(table_html)
+            if with_table not in frames:
+                frame = build_aux_page_frame(
+                    suffix,
+                    options,
+                    generator=generator_str,
+                    title=getattr(metadata, "title", ""),
+                    with_table=with_table,
+                )
+                if shared:
+                    frame = _externalized_frame(frame, filename.parent)
+                frames[with_table] = frame
+            page_titleblock = titleblock.fill(
+                sheet_current=sheet_current,
+                sheet_suffix=sheet_suffix,
                 partno=page_partno,
-                titleblock_html=page_titleblock,
-                title=getattr(page_metadata, "title", "") or suffix.title(),
             )
-            target.write_text(model.render(), encoding="utf-8")
+            write_html_page(
+                target,
+                frames[with_table].fill(titleblock=page_titleblock, table=table_html),
+            )
+
+
+def _externalized_frame(frame: TemplateFrame, output_dir: Path) -> TemplateFrame:
+    return TemplateFrame(
+        externalize_assets(frame.html, output_dir / ASSETS_DIR, f"{ASSETS_DIR}/")
+    )
 
 
 def generate_titlepage(yaml_data, extra_metadata, shared_bom, for_pdf=False):
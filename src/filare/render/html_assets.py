@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Shared stylesheets and images for multi-page HTML output.
+
+By default (``html_assets: inline``) every HTML page carries its own
+``<style>`` blocks and the images of its diagram as base64 data URIs, so a
+page can be opened or converted on its own. With ``html_assets: shared``,
+:func:`write_html_page` moves them into files below ``assets/`` next to the
+page, named after a hash of their content: pages using the same CSS or image
+link one file, which a browser downloads once for the whole document.
+"""
+
+import base64
+import binascii
+import hashlib
+import os
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+ASSETS_DIR = "assets"
+
+_style_pattern = re.compile(
+    r"<style(?P<attrs>[^>]*)>(?P<css>.*?)</style>", re.DOTALL | re.IGNORECASE
+)
+# data URIs, also as written by embed_svg_images (a space after the comma);
+# the pattern starts with a literal and is case sensitive, which keeps scanning
+# pages and their base64 runs fast
+_data_uri_pattern = re.compile(
+    r"data:image/(?P<subtype>[a-z0-9.+-]+);base64,"
+    r"(?P<data>[A-Za-z0-9+/=\s]+)(?=[\"')])"
+)
+
+
+def _asset_name(data: bytes, suffix: str) -> str:
+    return f"{hashlib.sha256(data).hexdigest()[:20]}.{suffix}"
+
+
+@lru_cache(maxsize=32)
+def _decoded_image(encoded: str, suffix: str) -> Tuple[str, bytes]:
+    """Asset name and content of a base64 image, which pages often repeat."""
+    data = base64.b64decode(encoded)
+    return _asset_name(data, suffix), data
+
+
+def write_asset(assets_dir: Path, data: bytes, suffix: str) -> str:
+    """Write ``data`` as ``<sha256>.<suffix>`` unless it exists; return the name."""
+    return _store(assets_dir, _asset_name(data, suffix), data)
+
+
+def _store(assets_dir: Path, name: str, data: bytes) -> str:
+    path = assets_dir / name
+    if path.exists():
+        return name
+    assets_dir.mkdir(parents=True, exist_ok=True)
+    # the name depends on the content only, so concurrent writers of a name
+    # write the same bytes; the rename keeps readers from partial files
+    tmp = path.with_name(f"{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return name
+
+
+def externalize_assets(html: str, assets_dir: Path, href_prefix: str) -> str:
+    """Replace style blocks and data URI images by links to shared asset files."""
+
+    def replace_style(match: re.Match) -> str:
+        name = write_asset(assets_dir, match["css"].encode("utf-8"), "css")
+        return f'<link rel="stylesheet" href="{href_prefix}{name}"{match["attrs"]}>'
+
+    def replace_image(match: re.Match) -> str:
+        if match.string[match.start() - 1 : match.start()] not in ('"', "'", "("):
+            return match.group(0)  # not an attribute or url() value
+        suffix = match["subtype"].split("+")[0]  # svg+xml -> svg
+        try:
+            name, data = _decoded_image(match["data"], suffix)
+        except binascii.Error:
+            return match.group(0)
+        return f"{href_prefix}{_store(assets_dir, name, data)}"
+
+    html = _style_pattern.sub(replace_style, html)
+    return _data_uri_pattern.sub(replace_image, html)
+
+
+def write_html_page(target: Path, html: str, shared_assets: bool = False) -> None:
+    """Write an HTML page, with its CSS and images as shared assets if requested."""
+    if shared_assets:
+        html = externalize_assets(html, target.parent / ASSETS_DIR, f"{ASSETS_DIR}/")
+    target.write_text(html, encoding="utf-8")
+
+
+__all__ = [
+    "ASSETS_DIR",
+    "externalize_assets",
+    "write_asset",
+    "write_html_page",
+]
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Lay out the graphs of many harness sheets in a single Graphviz run.
+
+Starting ``dot`` (and loading its fonts and plugins) usually costs more than
+laying out a small harness sheet. A :class:`LayoutBatch` collects the sheets
+of a document, writes their DOT sources to a temporary directory and renders
+all of them with one ``dot -O`` invocation per engine/format combination;
+each output lands next to its input file, which maps it back to its sheet.
+The sheets are then written with ``Harness.output`` using the batch as their
+layout cache, so any graph the batch could not lay out falls back to the
+regular per-graph render (and reports its own error).
+"""
+
+import logging
+import subprocess
+from collections import defaultdict
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from graphviz.backend import dot_command
+
+from filare.render.layout_cache import (
+    LayoutCache,
+    default_layout_cache,
+    graphviz_version,
+)
+
+DEFAULT_CHUNK_SIZE = 64
+
+
+class LayoutBatch:
+    """Deferred harness outputs whose graphs are laid out together."""
+
+    key = staticmethod(LayoutCache.key)
+
+    def __init__(
+        self,
+        cache: Optional[LayoutCache] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.cache = cache if cache is not None else default_layout_cache()
+        self.chunk_size = chunk_size
+        self._results: Dict[str, bytes] = {}
+        self._pending: List[Tuple[Any, Path, Tuple[str, ...]]] = []
+
+    def get(self, key: str) -> Optional[bytes]:
+        data = self._results.get(key)
+        if data is None and self.cache is not None:
+            data = self.cache.get(key)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        self._results[key] = data
+        if self.cache is not None:
+            self.cache.put(key, data)
+
+    def defer(self, harness: Any, filename: Path, fmt: Sequence[str]) -> None:
+        """Queue ``harness.output(filename, fmt)`` until :meth:`flush`."""
+        self._pending.append((harness, Path(filename), tuple(fmt)))
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> None:
+        """Lay out every queued graph, then write the queued outputs in order."""
+        self.layout_pending()
+        self.write_pending()
+
+    def layout_pending(self) -> None:
+        """Lay out the graphs of the queued outputs without writing them."""
+        self.layout(
+            job for harness, _, fmt in self._pending for job in harness.layout_jobs(fmt)
+        )
+
+    def write_pending(self) -> None:
+        """Write the queued outputs in order, reusing laid out graphs."""
+        pending, self._pending = self._pending, []
+        for harness, filename, fmt in pending:
+            harness.output(filename=filename, fmt=fmt, view=False, layout_cache=self)
+        self._results.clear()
+
+    def layout(self, jobs) -> None:
+        """Render ``(graph, formats)`` jobs not already available in the batch."""
+        version = graphviz_version()
+        if version is None:
+            return
+        groups: Dict[Tuple[str, Tuple[str, ...]], Dict[str, None]] = defaultdict(dict)
+        for graph, formats in jobs:
+            engine = getattr(graph, "engine", None) or "dot"
+            source = getattr(graph, "source", None)
+            if not isinstance(source, str):
+                continue
+            missing = tuple(
+                fmt
+                for fmt in formats
+                if self.get(self.key(source, engine, fmt, version)) is None
+            )
+            if missing:
+                groups[(engine, missing)][source] = None
+        for (engine, formats), sources in groups.items():
+            ordered = list(sources)
+            for start in range(0, len(ordered), self.chunk_size):
+                chunk = ordered[start : start + self.chunk_size]
+                self._run(engine, formats, chunk, version)
+
+    def _run(
+        self, engine: str, formats: Sequence[str], sources: Sequence[str], version: str
+    ) -> None:
+        with TemporaryDirectory(prefix="filare-layout-") as tmp:
+            paths = []
+            for idx, source in enumerate(sources):
+                path = Path(tmp) / f"sheet{idx}.gv"
+                path.write_text(source, encoding="utf-8")
+                paths.append(path)
+            # the same executable as the per-graph render in ``graph.pipe``
+            cmd = [
+                str(dot_command.DOT_BINARY),
+                f"-K{engine}",
+                *(f"-T{fmt}" for fmt in formats),
+                "-O",
+            ]
+            try:
+                subprocess.run(
+                    cmd + [str(path) for path in paths],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
+            except (OSError, subprocess.CalledProcessError) as exc:
+                # leave these graphs to the per-sheet render, which reports the error
+                logging.debug(f"Batched Graphviz layout failed: {exc}")
+                return
+            for source, path in zip(sources, paths):
+                for fmt in formats:
+                    output = path.with_name(f"{path.name}.{fmt}")
+                    if output.exists():
+                        self.put(
+                            self.key(source, engine, fmt, version), output.read_bytes()
+                        )
+
+
+__all__ = ["LayoutBatch"]
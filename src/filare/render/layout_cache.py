@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""On-disk cache of Graphviz output keyed by DOT source.
+
+Laying out a harness graph is by far the slowest step of a render and the
+result only depends on the DOT source, the images it references, the layout
+engine, the output format and the Graphviz version. Rendered bytes are stored
+under a hash of these values so that unchanged diagrams (e.g. revision-only
+re-releases) skip the Graphviz subprocess entirely. The cache is bounded in
+size; the least recently used entries are evicted first, once the bytes
+written since the last scan push the cache over its bound.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import graphviz
+
+from filare.settings import settings
+
+CACHE_SUFFIX = ".layout"
+DEFAULT_MAX_MB = 256
+
+# image attributes and HTML-like label images of a DOT source
+_IMAGE_PATTERN = re.compile(r'(?:\bimage=|<img\b[^>]*?\bsrc=)"([^"]+)"')
+
+
+def default_cache_dir() -> Path:
+    """Cache directory, following XDG_CACHE_HOME when set."""
+    xdg_cache_home = os.getenv("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / "filare" / "layout"
+    return Path.home() / ".cache" / "filare" / "layout"
+
+
+@lru_cache(maxsize=1)
+def graphviz_version() -> Optional[str]:
+    """Installed Graphviz version, or None when the binaries are missing."""
+    try:
+        return ".".join(str(part) for part in graphviz.version())
+    except (graphviz.ExecutableNotFound, RuntimeError, OSError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _file_digest(path: str, size: int, mtime_ns: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as inp:
+        for chunk in iter(lambda: inp.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def image_digests(source: str) -> List[str]:
+    """Digest of every image file ``source`` references, in order.
+
+    Graphviz embeds (PNG) or measures (SVG) the images, so an edited image
+    must not reuse the layout of the old one. Missing files digest as "".
+    """
+    if "image=" not in source and "<img" not in source:
+        return []  # most graphs: skip the slower pattern scan
+    digests = []
+    for src in _IMAGE_PATTERN.findall(source):
+        try:
+            stat = os.stat(src)
+            digests.append(_file_digest(src, stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            digests.append("")
+    return digests
+
+
+@dataclass
+class LayoutCacheStats:
+    directory: Path
+    entries: int
+    total_bytes: int
+    max_bytes: int
+
+
+class LayoutCache:
+    """Size-bounded LRU store of rendered Graphviz output."""
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        # bytes on disk as of the last scan plus the bytes written since
+        self._total: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(source: str, engine: str, fmt: str, version: str) -> str:
+        digest = hashlib.sha256()
+        for part in (version, engine, fmt, source, *image_digests(source)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.path_for(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self.path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(
+                f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logging.debug(f"Could not write layout cache entry {path}: {exc}")
+            return
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._entries())
+            else:
+                self._total += len(data)
+            full = self._total > self.max_bytes
+        if full:
+            self.prune()
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob(f"*/*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def stats(self) -> LayoutCacheStats:
+        entries = self._entries()
+        return LayoutCacheStats(
+            directory=self.directory,
+            entries=len(entries),
+            total_bytes=sum(size for _, size, _ in entries),
+            max_bytes=self.max_bytes,
+        )
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """Evict least recently used entries until the cache fits ``max_bytes``.
+
+        Returns the number of removed entries.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= limit:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        with self._lock:
+            self._total = total
+        return removed
+
+
+def default_layout_cache(resolved: Any = None) -> Optional[LayoutCache]:
+    """Layout cache configured by the settings, or None when disabled."""
+    resolved = resolved or settings
+    if not resolved.layout_cache:
+        return None
+    return _shared_layout_cache(
+        Path(resolved.layout_cache_dir or default_cache_dir()),
+        resolved.layout_cache_max_mb * 1024 * 1024,
+    )
+
+
+@lru_cache(maxsize=None)
+def _shared_layout_cache(directory: Path, max_bytes: int) -> LayoutCache:
+    # one instance per directory, so its size is only scanned once per run
+    return LayoutCache(directory, max_bytes)
+
+
+def pipe_graph(graph: Any, fmt: str, cache: Any = None) -> bytes:
+    """Render ``graph`` to ``fmt``, reusing a cached layout when available.
+
+    ``cache`` is any object with the ``key``/``get``/``put`` methods of
+    :class:`LayoutCache`; the configured on-disk cache is used by default.
+    """
+    if cache is None:
+        cache = default_layout_cache()
+    source = getattr(graph, "source", None)
+    version = graphviz_version() if cache is not None else None
+    if cache is None or not isinstance(source, str) or version is None:
+        return graph.pipe(format=fmt)
+    key = cache.key(source, getattr(graph, "engine", None) or "dot", fmt, version)
+    data = cache.get(key)
+    if data is None:
+        data = graph.pipe(format=fmt)
+        cache.put(key, data)
+    return data
+
+
+def pipe_graphs(
+    graphs: Sequence[Any],
+    fmt: str,
+    cache: Any = None,
+    workers: Optional[int] = None,
+) -> List[bytes]:
+    """Render several graphs concurrently (one Graphviz process per graph)."""
+    if cache is None:
+        cache = default_layout_cache()
+    workers = min(len(graphs), workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [pipe_graph(graph, fmt, cache) for graph in graphs]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda graph: pipe_graph(graph, fmt, cache), graphs))
+
+
+__all__ = [
+    "LayoutCache",
+    "LayoutCacheStats",
+    "default_cache_dir",
+    "default_layout_cache",
+    "graphviz_version",
+    "image_digests",
+    "pipe_graph",
+    "pipe_graphs",
+]
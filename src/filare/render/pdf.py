@@ -1,9 +1,49 @@
 # -*- coding: utf-8 -*-
 
+import os
+import re
+import time
+from collections import Counter
 from pathlib import Path
-from typing import Any, List, Sequence, cast
+from typing import Any, Dict, List, Sequence, Tuple, cast
+from urllib.parse import unquote
 
 from weasyprint import HTML
+from weasyprint.text.fonts import FontConfiguration
+
+from filare.render.pdf_diagram import print_png_path, raster_diagram_html
+from filare.settings import settings
+
+_image_pattern = re.compile(r'<(?:img|image)\b[^>]*?\b(?:src|href)="([^"]+)"')
+
+
+def _page_images(html: str, path: Path) -> Dict[str, int]:
+    """Size in bytes of each image a page shows, by data URI or file path."""
+    images: Dict[str, int] = {}
+    for url in _image_pattern.findall(html):
+        if url.startswith("data:"):
+            header, _, data = url.partition(",")
+            key = url
+            size = (
+                len(data.strip()) * 3 // 4 if header.endswith(";base64") else len(data)
+            )
+        else:
+            image_path = path.parent / unquote(url)
+            key = str(image_path)
+            try:
+                size = image_path.stat().st_size
+            except OSError:
+                continue  # remote or missing image
+        images[key] = size
+    return images
+
+
+def _shared_images(page_images: Sequence[Dict[str, int]]) -> Tuple[int, int]:
+    """Images shown on several pages, and the bytes of their repeated copies."""
+    pages = Counter(key for images in page_images for key in images)
+    sizes = {key: size for images in page_images for key, size in images.items()}
+    shared = [key for key, count in pages.items() if count > 1]
+    return len(shared), sum(sizes[key] * (pages[key] - 1) for key in shared)
 
 
 def generate_pdf_output(filename_list: Sequence[Path]):
@@ -32,7 +72,45 @@ def generate_pdf_output(filename_list: Sequence[Path]):
     filepath_list = [f.with_suffix(".html") for f in files]
 
     print(f"Generating pdf output: {output_path}")
-    files_html = [HTML(path) for path in filepath_list]
-    documents = [f.render() for f in files_html]
+    start = time.perf_counter()
+    # one font configuration and image cache for all pages, so fonts and
+    # images are loaded once and embedded once in the bundle (WeasyPrint
+    # looks images up by URL, a data URI being its own content)
+    font_config = FontConfiguration()
+    cache: Dict[str, Any] = {}
+    documents = []
+    page_images = []
+    for path in filepath_list:
+        html = path.read_text(encoding="utf-8")
+        page_images.append(_page_images(html, path))
+        documents.append(
+            _pdf_page(path, html).render(font_config=font_config, cache=cache)
+        )
     all_pages = [p for doc in documents for p in doc.pages]
-    cast(Any, documents[0]).copy(all_pages).write_pdf(output_path)
+    # written object by object to a temporary file, so readers never see a
+    # partial PDF
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as target:
+            cast(Any, documents[0]).copy(all_pages).write_pdf(
+                target, optimize_images=settings.pdf_optimize_images
+            )
+        os.replace(tmp_path, output_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    # estimated from the pages: separate page renders embed every copy
+    shared, saved = _shared_images(page_images)
+    print(
+        f"Wrote {output_path}: {len(all_pages)} pages, "
+        f"{output_path.stat().st_size / 2**20:.1f} MiB in "
+        f"{time.perf_counter() - start:.1f} s ({shared} images shared by several "
+        f"pages, about {saved / 2**20:.1f} MiB smaller than separate page renders)"
+    )
+
+
+def _pdf_page(path: Path, html: str) -> HTML:
+    """A page of the PDF, with its raster diagram when the sheet has one."""
+    if print_png_path(path).exists():
+        html = raster_diagram_html(html, path) or html
+    return HTML(string=html, base_url=str(path))
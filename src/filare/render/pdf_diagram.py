@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""Raster diagrams for PDF pages.
+
+WeasyPrint spends most of a sheet's PDF time on its inline SVG diagram when
+the diagram has thousands of elements or embedded images. With
+``pdf_diagram: raster`` (or ``auto`` above ``pdf_diagram_raster_elements``
+SVG elements), ``Harness.output`` also has Graphviz render the diagram as a
+PNG at ``pdf_diagram_dpi`` next to the sheet, and the PDF pages show that
+image in place of the SVG. The HTML pages keep the vector diagram.
+
+The PNG is drawn from the layout of the SVG: the same Graphviz run that
+renders the SVG also writes the laid out graph (:data:`PRINT_LAYOUT_FORMAT`),
+which ``neato -n2`` then draws at the print resolution without laying it out
+again. Separately laid out components are drawn one by one and stacked like
+their SVGs.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Optional, Sequence, Tuple
+
+import graphviz
+
+from filare.render.graph_pack import pack_pngs
+from filare.render.layout_cache import pipe_graph
+from filare.settings import settings
+
+PRINT_PNG_SUFFIX = ".print.png"
+PRINT_LAYOUT_FORMAT = "dot"
+
+_svg_tag_pattern = re.compile(r"<(/?)svg\b")
+_element_pattern = re.compile(r"<[A-Za-z]")
+_size_pattern = re.compile(r'\s(width|height)="([^"]+)"')
+
+
+def print_png_path(filename: Path) -> Path:
+    """Raster diagram of the sheet written to ``filename``."""
+    return Path(filename).with_suffix(PRINT_PNG_SUFFIX)
+
+
+def svg_element_count(svg: str) -> int:
+    return sum(1 for _ in _element_pattern.finditer(svg))
+
+
+def use_raster_diagram(svg: str) -> bool:
+    """Whether the PDF shows ``svg`` as a raster image (``pdf_diagram`` setting)."""
+    if settings.pdf_diagram == "raster":
+        return True
+    if settings.pdf_diagram == "auto":
+        return svg_element_count(svg) >= settings.pdf_diagram_raster_elements
+    return False
+
+
+class _LaidOutGraph:
+    """Laid out DOT source, drawn by ``neato -n2`` at its own positions."""
+
+    engine = "neato-n2"  # only part of the layout cache key
+
+    def __init__(self, source: str):
+        self.source = source
+
+    def pipe(self, format: str = "png") -> bytes:
+        graph = graphviz.Source(self.source, engine="neato")
+        return graph.pipe(format=format, neato_no_op=2)
+
+
+def _print_png(graph: Any, layout_cache: Any = None) -> bytes:
+    laid_out = pipe_graph(graph, PRINT_LAYOUT_FORMAT, layout_cache).decode("utf-8")
+    # a graph attribute applies wherever it is set: add it before the last "}"
+    body = laid_out.rstrip()[:-1]
+    source = f"{body}\tdpi={settings.pdf_diagram_dpi};\n}}\n"
+    return pipe_graph(_LaidOutGraph(source), "png", layout_cache)
+
+
+def write_print_png(
+    graphs: Sequence[Any], filename: Path, svg: str, layout_cache: Any = None
+) -> None:
+    """Render the raster diagram of ``svg`` from its graphs, or drop a stale one.
+
+    ``graphs`` are the graphs laid out for ``svg``: the harness graph, or its
+    components when they were laid out separately and packed.
+    """
+    target = print_png_path(filename)
+    if not use_raster_diagram(svg):
+        if target.exists():
+            target.unlink()
+        return
+    pngs = [_print_png(graph, layout_cache) for graph in graphs]
+    target.write_bytes(pack_pngs(pngs, settings.pdf_diagram_dpi))
+
+
+def _diagram_svg_span(html: str) -> Optional[Tuple[int, int]]:
+    """Start and end of the (outermost) SVG in the page's diagram container."""
+    container = html.find('id="diagram"')
+    if container < 0:
+        return None
+    start = None
+    depth = 0
+    for match in _svg_tag_pattern.finditer(html, container):
+        if not match.group(1):
+            if start is None:
+                start = match.start()
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0 and start is not None:
+            return start, html.index(">", match.end()) + 1
+    return None
+
+
+def raster_diagram_html(html: str, filename: Path) -> Optional[str]:
+    """``html`` with its diagram replaced by the raster diagram of ``filename``.
+
+    Returns None when the page keeps its vector diagram: there is no raster
+    diagram for the sheet, or the settings choose the vector one.
+    """
+    png = print_png_path(filename)
+    if not png.exists():
+        return None
+    span = _diagram_svg_span(html)
+    if span is None:
+        return None
+    start, end = span
+    svg = html[start:end]
+    if not use_raster_diagram(svg):
+        return None
+    # the image takes the size of the SVG it replaces, not its pixel size
+    svg_tag = svg[: svg.index(">")]
+    style = "".join(
+        f"{name}:{value};" for name, value in _size_pattern.findall(svg_tag)
+    )
+    style_attr = f' style="{style}"' if style else ""
+    image = f'<img src="{png.name}" alt="diagram"{style_attr}>'
+    return f"{html[:start]}{image}{html[end:]}"
+
+
+__all__ = [
+    "PRINT_LAYOUT_FORMAT",
+    "PRINT_PNG_SUFFIX",
+    "print_png_path",
+    "raster_diagram_html",
+    "svg_element_count",
+    "use_raster_diagram",
+    "write_print_png",
+]
@@ -1,14 +1,21 @@
+from functools import lru_cache
 from pathlib import Path
 
 import jinja2
 
 
-def get_template(template_name, extension=""):
-    """Load a Jinja2 template from the bundled templates directory."""
+@lru_cache(maxsize=1)
+def _jinja_env() -> jinja2.Environment:
+    # one shared environment, so each template is compiled once per process
     templates_root = Path(__file__).resolve().parent.parent / "templates"
     template_file_path = jinja2.FileSystemLoader(templates_root)
-    jinja_env = jinja2.Environment(
-        loader=template_file_path, undefined=jinja2.StrictUndefined
+    return jinja2.Environment(
+        loader=template_file_path,
+        undefined=jinja2.StrictUndefined,
+        auto_reload=False,
     )
 
-    return jinja_env.get_template(template_name + extension)
+
+def get_template(template_name, extension=""):
+    """Load a Jinja2 template from the bundled templates directory."""
+    return _jinja_env().get_template(template_name + extension)
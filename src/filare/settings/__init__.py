@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Literal, Optional
 
 import yaml
 from pydantic import BaseModel, Field
@@ -35,7 +35,67 @@ class FilareSettingsModel(BaseModel):
     graphviz_engine: Optional[str] = Field(
         default=None, description="Graphviz engine name."
     )
+    graphviz_split_components: bool = Field(
+        default=False,
+        description="Lay out disconnected sub-graphs in parallel and pack them.",
+    )
     debug: bool = Field(default=False, description="Enable debug output.")
+    draft: bool = Field(
+        default=False, description="Render fast, lower-fidelity draft outputs."
+    )
+    layout_cache: bool = Field(
+        default=False,
+        description="Reuse Graphviz output of unchanged graphs cached on disk "
+        "(bounded by layout_cache_max_mb).",
+    )
+    layout_cache_dir: Optional[Path] = Field(
+        default=None,
+        description="Layout cache directory (defaults to "
+        "$XDG_CACHE_HOME/filare/layout, or ~/.cache/filare/layout).",
+    )
+    layout_cache_max_mb: int = Field(
+        default=256, description="Size bound of the layout cache in MB."
+    )
+    pipeline_layout_workers: int = Field(
+        default=0,
+        description="Concurrent Graphviz layouts in document builds (0: CPU count).",
+    )
+    pipeline_write_workers: int = Field(
+        default=1, description="Sheets written concurrently in document builds."
+    )
+    pipeline_queue_size: int = Field(
+        default=4, description="Sheets buffered between document build stages."
+    )
+    compiled_harness: bool = Field(
+        default=False,
+        description="Load up-to-date `filare compile` artifacts instead of YAML "
+        "(artifacts are pickles: only enable for artifacts you compiled).",
+    )
+    document_format: Literal["yaml", "json"] = Field(
+        default="yaml",
+        description="Format of document representations and hashes (yaml or json).",
+    )
+    html_assets: Literal["inline", "shared"] = Field(
+        default="inline",
+        description="Embed CSS and images in each HTML page (inline) or write "
+        "them once below assets/ (shared).",
+    )
+    pdf_diagram: Literal["vector", "raster", "auto"] = Field(
+        default="vector",
+        description="Diagrams in PDF pages: vector (SVG), raster (PNG) or auto "
+        "(raster from pdf_diagram_raster_elements SVG elements).",
+    )
+    pdf_diagram_dpi: int = Field(
+        default=150, description="Resolution of raster diagrams in PDF pages."
+    )
+    pdf_diagram_raster_elements: int = Field(
+        default=5000,
+        description="SVG element count from which pdf_diagram: auto rasterizes.",
+    )
+    pdf_optimize_images: bool = Field(
+        default=False,
+        description="Losslessly recompress the images embedded in PDF output.",
+    )
 
     model_config = {"extra": "allow"}
 
@@ -46,7 +106,22 @@ class EnvSettings(BaseSettings):
     graphviz_engine: Optional[str] = Field(
         default=None, validation_alias="WV_GRAPHVIZ_ENGINE"
     )  # e.g., dot, neato
+    graphviz_split_components: bool = False
     debug: bool = False
+    draft: bool = False
+    layout_cache: bool = False
+    layout_cache_dir: Optional[Path] = None
+    layout_cache_max_mb: int = 256
+    pipeline_layout_workers: int = 0
+    pipeline_write_workers: int = 1
+    pipeline_queue_size: int = 4
+    compiled_harness: bool = False
+    document_format: Literal["yaml", "json"] = "yaml"
+    html_assets: Literal["inline", "shared"] = "inline"
+    pdf_diagram: Literal["vector", "raster", "auto"] = "vector"
+    pdf_diagram_dpi: int = 150
+    pdf_diagram_raster_elements: int = 5000
+    pdf_optimize_images: bool = False
 
     model_config = SettingsConfigDict(env_prefix="WV_", case_sensitive=False)
 
@@ -2,10 +2,13 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import hashlib
 import logging
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 import typer
@@ -75,6 +78,45 @@ extensions_containing_graphviz_output = [".png", ".svg", ".html", ".pdf"]
 generated_extensions = (
     extensions_not_containing_graphviz_output + extensions_containing_graphviz_output
 )
+# everything a build writes into a group folder (compared by compare/diff)
+output_suffixes = [
+    ".gv",
+    ".tsv",
+    ".png",
+    ".svg",
+    ".html",
+    ".pdf",
+    ".document.yaml",
+    ".document.json",
+]
+output_prefixes = ["titlepage", "shared_bom"]
+hashes_file = "example_hashes.yaml"
+
+# Parts of the outputs that change between runs or Filare/Graphviz versions
+# without the drawing changing; replaced before hashing.
+_volatile_text = [
+    (
+        re.compile(rb"\b" + re.escape(APP_NAME.encode()) + rb" v?\d+\.\d+[\w.+-]*"),
+        APP_NAME.encode() + b" <version>",
+    ),
+    (
+        re.compile(rb"graphviz version [^\s]+(?: \([^)]*\))?"),
+        b"graphviz version <version>",
+    ),
+    (
+        re.compile(
+            rb"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?"
+            rb"(?:Z|[+-]\d{2}:?\d{2})?"
+        ),
+        b"<timestamp>",
+    ),
+]
+_volatile_pdf = [
+    (re.compile(rb"/(CreationDate|ModDate) ?\(D:[^)]*\)"), rb"/\1 (D:<timestamp>)"),
+    (re.compile(rb"/ID ?\[ ?<[0-9a-fA-F]*> ?<[0-9a-fA-F]*> ?\]"), b"/ID [<id>]"),
+    (re.compile(rb"/Producer ?\([^)]*\)"), b"/Producer (<version>)"),
+]
+_text_suffixes = {".gv", ".tsv", ".svg", ".html", ".yaml", ".json", ".md"}
 
 cli = None
 
@@ -106,78 +148,36 @@ def collect_filenames(description, groupkey, ext_list):
     return sorted([filename for pattern in patterns for filename in path.glob(pattern)])
 
 
-def build_generated(groupkeys, output_base=None):
+def build_generated(groupkeys, output_base=None, jobs=1):
     """Build examples/tutorials for the provided group keys via the CLI.
 
     Args:
         groupkeys: Iterable of keys from `groups` to process.
         output_base: Optional root directory to place generated artifacts.
+        jobs: Number of groups built at the same time, each in its own
+            process (0: one per CPU). Within a group the sheets are laid out
+            concurrently by the staged `filare run` pipeline.
 
     Returns:
         None. Outputs rendered assets and document manifests to disk.
     """
     output_base = Path(output_base) if output_base else None
-    all_dest_paths = []
-    for key in groupkeys:
-        # preparation
-        src_path = groups[key]["path"]
-        dest_path = src_path if output_base is None else output_base / key
-        dest_path.mkdir(parents=True, exist_ok=True)
-        all_dest_paths.append(dest_path)
-        build_readme = readme in groups[key]
-        if build_readme:
-            include_readme = "md" in groups[key][readme]
-            include_source = "yml" in groups[key][readme]
-            with (dest_path / readme).open("w") as out:
-                out.write(f'# {groups[key]["title"]}\n\n')
-        # collect and iterate input YAML files
-        yaml_files = [f for f in collect_filenames("Building", key, input_extensions)]
-        try:
-            metadata_arg = []
-            metadata_file = yaml_files[0].parent / "metadata.yml"
-            # Demo YAMLs already carry full metadata; avoid overriding them.
-            if key != "demos" and metadata_file.exists():
-                metadata_arg = ["--metadata", str(metadata_file)]
-            _get_cli()(
-                [
-                    "run",
-                    "--formats",
-                    "ghpstb",  # no pdf for now
-                    "--output-dir",
-                    str(dest_path),
-                    *metadata_arg,
-                    *[str(f) for f in yaml_files],
-                ]
+    groupkeys = list(groupkeys)
+    workers = min(jobs or os.cpu_count() or 1, len(groupkeys))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            all_dest_paths = list(
+                pool.map(
+                    _build_group,
+                    groupkeys,
+                    [groups[key] for key in groupkeys],
+                    repeat(output_base),
+                )
             )
-        except BaseException as e:
-            if str(e) != "0" and not isinstance(e, (typer.Exit, SystemExit)):
-                raise
-
-        if build_readme:
-            for yaml_file in yaml_files:
-                i = "".join(filter(str.isdigit, yaml_file.stem))
-
-                with (dest_path / readme).open("a") as out:
-                    if include_readme:
-                        with yaml_file.with_suffix(".md").open("r") as info:
-                            for line in info:
-                                out.write(line.replace("## ", f"## {i} - "))
-                            out.write("\n\n")
-                    else:
-                        out.write(f"## Example {i}\n")
-
-                    if include_source:
-                        with yaml_file.open("r") as src:
-                            out.write("```yaml\n")
-                            for line in src:
-                                out.write(line)
-                            out.write("```\n")
-                        out.write("\n")
-
-                    out.write(f"![]({yaml_file.stem}.png)\n\n")
-                    out.write(
-                        f"[Source]({yaml_file.name}) - [Bill of Materials]({yaml_file.stem}.tsv)\n\n\n"
-                    )
+    else:
+        all_dest_paths = [
+            _build_group(key, groups[key], output_base) for key in groupkeys
+        ]
 
     # Write a manifest of all document representations for each destination
     for dest in all_dest_paths:
@@ -185,6 +185,78 @@ def build_generated(groupkeys, output_base=None):
     verify_bom_tables(all_dest_paths)
 
 
+def _dest_path(key, output_base=None):
+    return groups[key]["path"] if output_base is None else Path(output_base) / key
+
+
+def _build_group(key, group, output_base=None):
+    """Render one group through the CLI; returns its destination folder.
+
+    The group settings are passed explicitly so that worker processes do not
+    depend on the state of the parent's `groups`.
+    """
+    groups[key] = group
+    # preparation
+    dest_path = _dest_path(key, output_base)
+    dest_path.mkdir(parents=True, exist_ok=True)
+    build_readme = readme in group
+    if build_readme:
+        include_readme = "md" in group[readme]
+        include_source = "yml" in group[readme]
+        with (dest_path / readme).open("w") as out:
+            out.write(f'# {group["title"]}\n\n')
+    # collect and iterate input YAML files
+    yaml_files = [f for f in collect_filenames("Building", key, input_extensions)]
+    try:
+        metadata_arg = []
+        metadata_file = yaml_files[0].parent / "metadata.yml"
+        # Demo YAMLs already carry full metadata; avoid overriding them.
+        if key != "demos" and metadata_file.exists():
+            metadata_arg = ["--metadata", str(metadata_file)]
+        _get_cli()(
+            [
+                "run",
+                "--formats",
+                "ghpstb",  # no pdf for now
+                "--output-dir",
+                str(dest_path),
+                *metadata_arg,
+                *[str(f) for f in yaml_files],
+            ]
+        )
+    except BaseException as e:
+        if str(e) != "0" and not isinstance(e, (typer.Exit, SystemExit)):
+            raise
+
+    if build_readme:
+        for yaml_file in yaml_files:
+            i = "".join(filter(str.isdigit, yaml_file.stem))
+
+            with (dest_path / readme).open("a") as out:
+                if include_readme:
+                    with yaml_file.with_suffix(".md").open("r") as info:
+                        for line in info:
+                            out.write(line.replace("## ", f"## {i} - "))
+                        out.write("\n\n")
+                else:
+                    out.write(f"## Example {i}\n")
+
+                if include_source:
+                    with yaml_file.open("r") as src:
+                        out.write("```yaml\n")
+                        for line in src:
+                            out.write(line)
+                        out.write("```\n")
+                    out.write("\n")
+
+                out.write(f"![]({yaml_file.stem}.png)\n\n")
+                out.write(
+                    f"[Source]({yaml_file.name}) - [Bill of Materials]({yaml_file.stem}.tsv)\n\n\n"
+                )
+
+    return dest_path
+
+
 def clean_generated(groupkeys):
     """Remove generated artifacts for the provided groups.
 
@@ -206,6 +278,89 @@ def clean_generated(groupkeys):
             manifest.unlink()
 
 
+def normalized_hash(path, output_dir=None):
+    """SHA-256 of a generated file with run-dependent parts masked.
+
+    Version strings of Filare and Graphviz, timestamps and the output
+    directory are replaced in text outputs, as are creation dates, document
+    IDs and the producer in PDFs, so that rebuilding unchanged drawings
+    elsewhere gives the same hash.
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    suffix = path.suffix.lower()
+    if suffix in _text_suffixes:
+        for pattern, replacement in _volatile_text:
+            data = pattern.sub(replacement, data)
+        if output_dir is not None:
+            data = data.replace(str(output_dir).encode(), b"<output_dir>")
+    elif suffix == ".pdf":
+        for pattern, replacement in _volatile_pdf:
+            data = pattern.sub(replacement, data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def output_hashes(groupkey, output_base=None):
+    """Normalized hashes of the generated files of a group, by file name."""
+    dest = _dest_path(groupkey, output_base)
+    prefixes = [groups[groupkey]["prefix"], *output_prefixes]
+    names = [
+        path.name
+        for path in dest.glob("*")
+        if path.is_file()
+        and any(path.name.startswith(prefix) for prefix in prefixes)
+        and any(path.name.endswith(suffix) for suffix in output_suffixes)
+    ]
+    if readme in groups[groupkey] and (dest / readme).is_file():
+        names.append(readme)
+    return {name: normalized_hash(dest / name, dest) for name in sorted(names)}
+
+
+def snapshot_generated(groupkeys, output_base=None):
+    """Store the normalized hashes of the generated files of each group."""
+    for key in groupkeys:
+        hashes = output_hashes(key, output_base)
+        path = _dest_path(key, output_base) / hashes_file
+        path.write_text(yaml.safe_dump(hashes, sort_keys=True), encoding="utf-8")
+        print(f"Stored {len(hashes)} hashes of {key} in {path}")
+
+
+def compare_generated(groupkeys, output_base=None, verbose=False):
+    """Compare generated files against the stored hashes of each group.
+
+    Only files that were added, removed or changed since the last snapshot
+    are reported; ``verbose`` adds the stored and current hashes.
+
+    Returns:
+        Mapping of group key to its list of ``(status, file name)`` changes;
+        groups without stored hashes report every file as added.
+    """
+    changes = {}
+    for key in groupkeys:
+        path = _dest_path(key, output_base) / hashes_file
+        if path.is_file():
+            stored = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        else:
+            print(f"{key}: no stored hashes in {path}; run the snapshot action")
+            stored = {}
+        current = output_hashes(key, output_base)
+        group_changes = []
+        for name in sorted(set(stored) | set(current)):
+            old, new = stored.get(name), current.get(name)
+            if old == new:
+                continue
+            status = "added" if old is None else "removed" if new is None else "changed"
+            group_changes.append((status, name))
+            detail = f" ({old or '-'} -> {new or '-'})" if verbose else ""
+            print(f"  {status:>8} {key}/{name}{detail}")
+        print(
+            f"{key}: {len(group_changes)} of {len(set(stored) | set(current))} "
+            "files differ"
+        )
+        changes[key] = group_changes
+    return changes
+
+
 def _bom_rows_in_html(html_path: Path) -> int:
     """Count BOM table rows inside an HTML file; returns -1 when no BOM exists."""
     try:
@@ -249,7 +404,11 @@ def _write_document_manifest(output_dir: Path) -> None:
     split_bom = False
     split_notes = False
     split_index = False
-    for doc_file in sorted(output_dir.rglob("*.document.yaml")):
+    doc_files = [
+        *output_dir.rglob("*.document.yaml"),
+        *output_dir.rglob("*.document.json"),
+    ]
+    for doc_file in sorted(doc_files):
         rel = doc_file.relative_to(output_dir)
         docs.append(DocumentManifestEntry(path=str(rel), name=doc_file.stem))
         try:
@@ -308,7 +467,7 @@ def parse_args():
         "action",
         nargs="?",
         action="store",
-        choices=["build", "clean", "compare", "diff", "restore"],
+        choices=["build", "clean", "snapshot", "compare", "diff", "restore"],
         default="build",
         help="what to do with the generated files (default: build)",
     )
@@ -327,15 +486,30 @@ def parse_args():
         type=Path,
         help="Optional base directory for generated outputs (defaults to in-place).",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        default=0,
+        type=int,
+        help="number of groups built in parallel (default: one per CPU)",
+    )
     return parser.parse_args()
 
 
 def main():
     args = parse_args()
     if args.action == "build":
-        build_generated(args.groups, output_base=args.output_dir)
+        build_generated(args.groups, output_base=args.output_dir, jobs=args.jobs)
     elif args.action == "clean":
         clean_generated(args.groups)
+    elif args.action == "snapshot":
+        snapshot_generated(args.groups, output_base=args.output_dir)
+    elif args.action in ("compare", "diff"):
+        changes = compare_generated(
+            args.groups, output_base=args.output_dir, verbose=args.action == "diff"
+        )
+        if any(changes.values()):
+            sys.exit(1)
 
 
 if __name__ == "__main__":
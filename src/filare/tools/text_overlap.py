@@ -3,18 +3,25 @@ Tooling CLI to detect overlapping text in rendered HTML using Playwright.
 
 Usage:
   uv run filare-check-overlap outputs/**/*.html --viewport 1280x720
+  uv run filare-check-overlap outputs/**/*.html --workers 4 --cache .overlap-cache.json
 """
 
 from __future__ import annotations
 
 import argparse
 import fnmatch
+import hashlib
 import json
+import logging
+import math
+import queue
 import re
 import sys
+import threading
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import yaml
 from playwright.sync_api import Page, sync_playwright
@@ -25,6 +32,8 @@ DEFAULT_VIEWPORT = (1280, 720)
 DEFAULT_WARN_THRESHOLD = 1.0
 DEFAULT_ERROR_THRESHOLD = 2.0
 DEFAULT_IGNORE_CONFIG = ".filare-overlap-ignore.yml"
+GRID_MAX_CELLS_PER_NODE = 64
+CACHE_VERSION = 1
 
 
 @dataclass
@@ -114,6 +123,17 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default=DEFAULT_IGNORE_CONFIG,
         help="Path to overlap ignore config (YAML). Default: .filare-overlap-ignore.yml",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel browser workers (default: 1).",
+    )
+    parser.add_argument(
+        "--cache",
+        dest="cache_path",
+        help="JSON cache of previous results; unchanged files are not re-checked.",
+    )
     return parser.parse_args(argv)
 
 
@@ -234,27 +254,109 @@ def filter_nodes_by_text(
     return filtered
 
 
-def compute_overlaps(
+def _classify_overlap(
+    a: Node, b: Node, warn_threshold: float, error_threshold: float
+) -> Optional[Overlap]:
+    dx = min(a.rect.right, b.rect.right) - max(a.rect.x, b.rect.x)
+    dy = min(a.rect.bottom, b.rect.bottom) - max(a.rect.y, b.rect.y)
+    if dx <= 0 or dy <= 0:
+        return None
+    depth = min(dx, dy)
+    if depth > error_threshold:
+        return Overlap(depth=depth, severity="error", a=a, b=b)
+    if depth > warn_threshold:
+        return Overlap(depth=depth, severity="warning", a=a, b=b)
+    return None
+
+
+def compute_overlaps_bruteforce(
     nodes: List[Node], warn_threshold: float, error_threshold: float
 ) -> List[Overlap]:
+    """Reference O(n²) pairwise check, kept for tests and benchmarks."""
     overlaps: List[Overlap] = []
     for i, a in enumerate(nodes):
         for b in nodes[i + 1 :]:
-            dx = min(a.rect.right, b.rect.right) - max(a.rect.x, b.rect.x)
-            dy = min(a.rect.bottom, b.rect.bottom) - max(a.rect.y, b.rect.y)
-            if dx <= 0 or dy <= 0:
-                continue
-            depth = min(dx, dy)
-            severity: Optional[str] = None
-            if depth > error_threshold:
-                severity = "error"
-            elif depth > warn_threshold:
-                severity = "warning"
-            if severity:
-                overlaps.append(Overlap(depth=depth, severity=severity, a=a, b=b))
+            overlap = _classify_overlap(a, b, warn_threshold, error_threshold)
+            if overlap:
+                overlaps.append(overlap)
     return overlaps
 
 
+def _grid_cell_size(values: List[float]) -> float:
+    """Median extent of the nodes, used as the uniform grid pitch."""
+    ordered = sorted(values)
+    size = ordered[len(ordered) // 2]
+    return size if size > 0 else 1.0
+
+
+def compute_overlaps(
+    nodes: List[Node], warn_threshold: float, error_threshold: float
+) -> List[Overlap]:
+    """Find overlapping node pairs using a uniform grid spatial index.
+
+    Returns the same overlaps as ``compute_overlaps_bruteforce`` in the same
+    order (by index of ``a`` then ``b`` in ``nodes``). Each pair is reported
+    only from the grid cell holding the top-left corner of its intersection,
+    so no deduplication set is needed. Nodes spanning more than
+    ``GRID_MAX_CELLS_PER_NODE`` cells are checked against every node instead.
+    """
+    # Zero-area rectangles can never produce a positive overlap.
+    candidates = [
+        i for i, n in enumerate(nodes) if n.rect.width > 0 and n.rect.height > 0
+    ]
+    if len(candidates) < 2:
+        return []
+
+    cell_w = _grid_cell_size([nodes[i].rect.width for i in candidates])
+    cell_h = _grid_cell_size([nodes[i].rect.height for i in candidates])
+
+    grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    oversized: List[int] = []
+    for i in candidates:
+        rect = nodes[i].rect
+        x0, x1 = math.floor(rect.x / cell_w), math.floor(rect.right / cell_w)
+        y0, y1 = math.floor(rect.y / cell_h), math.floor(rect.bottom / cell_h)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > GRID_MAX_CELLS_PER_NODE:
+            oversized.append(i)
+            continue
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                grid[(cx, cy)].append(i)
+
+    found: List[Tuple[int, int, Overlap]] = []
+    for (cx, cy), members in grid.items():
+        # members are appended in node order, so i < j holds for every pair
+        for pos, i in enumerate(members):
+            a = nodes[i]
+            for j in members[pos + 1 :]:
+                b = nodes[j]
+                overlap = _classify_overlap(a, b, warn_threshold, error_threshold)
+                if overlap is None:
+                    continue
+                corner_x = max(a.rect.x, b.rect.x)
+                corner_y = max(a.rect.y, b.rect.y)
+                if (
+                    math.floor(corner_x / cell_w) == cx
+                    and math.floor(corner_y / cell_h) == cy
+                ):
+                    found.append((i, j, overlap))
+
+    oversized_set = set(oversized)
+    for i in oversized:
+        for j in candidates:
+            if j == i or (j in oversized_set and j < i):
+                continue
+            first, second = (i, j) if i < j else (j, i)
+            overlap = _classify_overlap(
+                nodes[first], nodes[second], warn_threshold, error_threshold
+            )
+            if overlap:
+                found.append((first, second, overlap))
+
+    found.sort(key=lambda item: (item[0], item[1]))
+    return [overlap for _, _, overlap in found]
+
+
 def node_hint(node: Node) -> str:
     ident_parts = [node.tag.lower()]
     if node.id_attr:
@@ -264,6 +366,158 @@ def node_hint(node: Node) -> str:
     return "".join(ident_parts)
 
 
+def overlap_to_dict(overlap: Overlap) -> dict:
+    return {
+        "severity": overlap.severity,
+        "depth": overlap.depth,
+        "a": {
+            "text": overlap.a.text,
+            "selector": node_hint(overlap.a),
+            "rect": overlap.a.rect.__dict__,
+        },
+        "b": {
+            "text": overlap.b.text,
+            "selector": node_hint(overlap.b),
+            "rect": overlap.b.rect.__dict__,
+        },
+    }
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def rules_digest(
+    rules: IgnoreRules,
+    viewport: Tuple[int, int],
+    warn_threshold: float,
+    error_threshold: float,
+) -> str:
+    """Hash every input besides the HTML itself that can change a file's result."""
+    payload = {
+        "selectors": rules.selectors,
+        "text_patterns": [p.pattern for p in rules.text_patterns],
+        "viewport": list(viewport),
+        "warn_threshold": warn_threshold,
+        "error_threshold": error_threshold,
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def load_cache(path: Optional[Path]) -> dict:
+    """Cached results, or an empty cache if missing, damaged or of another version."""
+    if path is None or not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data
+
+
+def save_cache(path: Optional[Path], cache: dict) -> None:
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+@dataclass
+class CheckJob:
+    index: int
+    path: Path
+    rules: IgnoreRules
+
+
+def check_page(
+    page: Page, job: CheckJob, warn_threshold: float, error_threshold: float
+) -> List[dict]:
+    page.goto(job.path.resolve().as_uri())
+    nodes = gather_nodes(page, job.rules.selectors)
+    nodes = filter_nodes_by_text(nodes, job.rules.text_patterns)
+    overlaps = compute_overlaps(nodes, warn_threshold, error_threshold)
+    return [overlap_to_dict(o) for o in overlaps]
+
+
+def _run_worker(
+    jobs: "queue.SimpleQueue[CheckJob]",
+    results: Dict[int, List[dict]],
+    viewport: Tuple[int, int],
+    warn_threshold: float,
+    error_threshold: float,
+) -> None:
+    """Drain the job queue with one browser context; pages are closed after use."""
+    # The sync Playwright API is bound to the thread that started it, so every
+    # worker owns its own driver, browser and context.
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        context = browser.new_context(
+            viewport={"width": viewport[0], "height": viewport[1]}
+        )
+        try:
+            while True:
+                try:
+                    job = jobs.get_nowait()
+                except queue.Empty:
+                    break
+                page = context.new_page()
+                try:
+                    results[job.index] = check_page(
+                        page, job, warn_threshold, error_threshold
+                    )
+                finally:
+                    page.close()
+        finally:
+            context.close()
+            browser.close()
+
+
+def run_checks(
+    jobs: List[CheckJob],
+    viewport: Tuple[int, int],
+    warn_threshold: float,
+    error_threshold: float,
+    workers: int = 1,
+) -> Dict[int, List[dict]]:
+    """Check every job and return overlap dicts keyed by job index."""
+    results: Dict[int, List[dict]] = {}
+    if not jobs:
+        return results
+    job_queue: "queue.SimpleQueue[CheckJob]" = queue.SimpleQueue()
+    for job in jobs:
+        job_queue.put(job)
+    worker_count = max(1, min(workers, len(jobs)))
+    if worker_count == 1:
+        _run_worker(job_queue, results, viewport, warn_threshold, error_threshold)
+        return results
+
+    errors: List[BaseException] = []
+
+    def _target() -> None:
+        try:
+            _run_worker(job_queue, results, viewport, warn_threshold, error_threshold)
+        except BaseException as exc:  # surfaced on the main thread below
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=_target, name=f"overlap-worker-{idx}")
+        for idx in range(worker_count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     args = parse_args(argv)
     try:
@@ -278,51 +532,57 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return 2
 
     config = load_ignore_config(Path(args.config))
-
-    report = {"files": []}
-    any_errors = False
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            viewport={"width": viewport[0], "height": viewport[1]}
+    cache_path = Path(args.cache_path) if args.cache_path else None
+    cache = load_cache(cache_path)
+    cache_files = cache.get("files", {}) if isinstance(cache.get("files"), dict) else {}
+
+    entries: List[Optional[dict]] = [None] * len(html_files)
+    keys: List[Tuple[str, str]] = []
+    pending: List[CheckJob] = []
+    for index, file_path in enumerate(html_files):
+        rules = compile_ignores(
+            config, args.ignore_selector, args.ignore_text, file_path
         )
-        for file_path in html_files:
-            page = context.new_page()
-            url = file_path.resolve().as_uri()
-            page.goto(url)
-            rules = compile_ignores(
-                config, args.ignore_selector, args.ignore_text, file_path
-            )
-            nodes = gather_nodes(page, rules.selectors)
-            nodes = filter_nodes_by_text(nodes, rules.text_patterns)
-            overlaps = compute_overlaps(
-                nodes, args.warn_threshold, args.error_threshold
-            )
-            errors = [o for o in overlaps if o.severity == "error"]
-            any_errors = any_errors or bool(errors)
-            file_entry = {
-                "file": str(file_path),
-                "overlaps": [
-                    {
-                        "severity": o.severity,
-                        "depth": o.depth,
-                        "a": {
-                            "text": o.a.text,
-                            "selector": node_hint(o.a),
-                            "rect": o.a.rect.__dict__,
-                        },
-                        "b": {
-                            "text": o.b.text,
-                            "selector": node_hint(o.b),
-                            "rect": o.b.rect.__dict__,
-                        },
-                    }
-                    for o in overlaps
-                ],
+        key = (
+            file_digest(file_path),
+            rules_digest(rules, viewport, args.warn_threshold, args.error_threshold),
+        )
+        keys.append(key)
+        cached = cache_files.get(str(file_path))
+        if (
+            cached
+            and cached.get("html_hash") == key[0]
+            and cached.get("rules_hash") == key[1]
+        ):
+            entries[index] = {"file": str(file_path), "overlaps": cached["overlaps"]}
+        else:
+            pending.append(CheckJob(index=index, path=file_path, rules=rules))
+
+    skipped = len(html_files) - len(pending)
+    if skipped:
+        logging.info("Skipping %d unchanged HTML file(s) (cached results).", skipped)
+
+    results = run_checks(
+        pending,
+        viewport,
+        args.warn_threshold,
+        args.error_threshold,
+        workers=args.workers,
+    )
+    for job in pending:
+        entries[job.index] = {"file": str(job.path), "overlaps": results[job.index]}
+
+    report = {"files": [entry for entry in entries if entry is not None]}
+
+    if cache_path is not None:
+        cache_files = dict(cache_files)
+        for file_path, key, entry in zip(html_files, keys, report["files"]):
+            cache_files[str(file_path)] = {
+                "html_hash": key[0],
+                "rules_hash": key[1],
+                "overlaps": entry["overlaps"],
             }
-            report["files"].append(file_entry)
-        browser.close()
+        save_cache(cache_path, {"version": CACHE_VERSION, "files": cache_files})
 
     if args.json_path:
         Path(args.json_path).write_text(json.dumps(report, indent=2), encoding="utf-8")
@@ -342,7 +602,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         print("Warnings detected (overlaps above warn threshold).")
     if total_err:
         print("Errors detected (overlaps above error threshold).", file=sys.stderr)
-    return 1 if any_errors else 0
+    return 1 if total_err else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+from typer.testing import CliRunner
+
+from filare.cli import cli
+from filare.render.layout_cache import LayoutCache
+
+
+def test_cache_stats_and_prune(monkeypatch, tmp_path):
+    runner = CliRunner()
+    monkeypatch.setenv("FIL_CONFIG_PATH", str(tmp_path / "cfg"))
+    monkeypatch.setenv("WV_LAYOUT_CACHE_DIR", str(tmp_path / "cache"))
+    cache = LayoutCache(tmp_path / "cache")
+    cache.put("aa", b"x" * 10)
+    cache.put("bb", b"x" * 10)
+
+    stats = runner.invoke(cli, ["cache", "stats"])
+    assert stats.exit_code == 0, stats.output
+    assert "entries:   2" in stats.output
+    assert str(tmp_path / "cache") in stats.output
+
+    pruned = runner.invoke(cli, ["cache", "prune", "--all"])
+    assert pruned.exit_code == 0, pruned.output
+    assert "Removed 2 entries; 0 left" in pruned.output
@@ -1,3 +1,4 @@
+import json
 import textwrap
 
 import pytest
@@ -336,3 +337,62 @@ def test_page_cli_title_page_config(monkeypatch, tmp_path):
     assert result.exit_code == 0, result.output
     assert "titlepage" in calls
     assert "render_called" not in calls
+
+
+def test_cli_draft_skips_png_titlepage_and_pdf(monkeypatch, tmp_path):
+    runner = CliRunner()
+    harness_path, _ = _write_minimal_files(tmp_path)
+
+    calls = {}
+
+    def fake_parse(components, metadata_files, return_types, output_formats, **kwargs):
+        calls["parse_formats"] = set(output_formats)
+        calls["draft"] = kwargs["draft"]
+        return {"shared_bom": kwargs["shared_bom"]}
+
+    def fake_titlepage(*_args, **_kwargs):
+        calls["titlepage_called"] = True
+
+    def fake_pdf_bundle(paths):
+        calls["pdf_bundle"] = list(paths)
+
+    monkeypatch.setattr("filare.cli.render.wv.parse", fake_parse)
+    monkeypatch.setattr("filare.cli.render.build_titlepage", fake_titlepage)
+    monkeypatch.setattr("filare.cli.render.build_pdf_bundle", fake_pdf_bundle)
+
+    result = runner.invoke(
+        cli, ["run", str(harness_path), "-f", "hpsP", "-o", str(tmp_path), "--draft"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls["draft"] is True
+    assert calls["parse_formats"] == {"html", "svg"}
+    assert "titlepage_called" not in calls
+    assert "pdf_bundle" not in calls
+
+
+def test_cli_j_code_writes_bom_json_lines(tmp_path):
+    runner = CliRunner()
+    harness_path, metadata_path = _write_minimal_files(tmp_path)
+
+    result = runner.invoke(
+        cli,
+        [
+            "run",
+            str(harness_path),
+            "-d",
+            str(metadata_path),
+            "-f",
+            "jb",
+            "-o",
+            str(tmp_path),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    for name in ("h.jsonl", "shared_bom.jsonl"):
+        records = [
+            json.loads(line) for line in (tmp_path / name).read_text().splitlines()
+        ]
+        assert records and all(isinstance(record, dict) for record in records)
+    assert not (tmp_path / "h.csv").exists()
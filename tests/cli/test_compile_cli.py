@@ -0,0 +1,58 @@
+import os
+import textwrap
+
+from typer.testing import CliRunner
+
+from filare.cli import cli
+from filare.settings import settings
+
+HARNESS = """\
+connectors:
+  J1:
+    pincount: {pins}
+    pn: CON-1
+  J2:
+    pincount: 2
+    pn: CON-2
+
+cables:
+  W1:
+    wirecount: 2
+    length: 1
+
+connections:
+  -
+    - J1: [1, 2]
+    - W1: [1, 2]
+    - J2: [1, 2]
+"""
+
+
+def test_run_loads_compiled_harness_until_inputs_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "compiled_harness", True)
+    runner = CliRunner()
+    sheet = tmp_path / "sheet.yml"
+    sheet.write_text(textwrap.dedent(HARNESS.format(pins=2)))
+    compiled, plain = tmp_path / "compiled", tmp_path / "plain"
+    compiled.mkdir()
+    plain.mkdir()
+
+    result = runner.invoke(cli, ["compile", str(sheet), "-o", str(compiled)])
+    assert result.exit_code == 0, result.output
+    assert (compiled / "sheet.harness.bin").exists()
+    assert "2 connectors, 1 cables" in result.output
+
+    for output_dir in (compiled, plain):
+        result = runner.invoke(
+            cli, ["run", str(sheet), "-f", "t", "-o", str(output_dir)]
+        )
+        assert result.exit_code == 0, result.output
+    assert (compiled / "sheet.tsv").read_text() == (plain / "sheet.tsv").read_text()
+
+    # an edited input is parsed again instead of using the stale artifact
+    sheet.write_text(textwrap.dedent(HARNESS.format(pins=3)))
+    stat = sheet.stat()
+    os.utime(sheet, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    result = runner.invoke(cli, ["run", str(sheet), "-f", "t", "-o", str(compiled)])
+    assert result.exit_code == 0, result.output
+    assert "3 pins" in (compiled / "sheet.tsv").read_text()
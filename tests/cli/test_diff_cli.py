@@ -0,0 +1,49 @@
+import json
+import textwrap
+
+from typer.testing import CliRunner
+
+from filare.cli import cli
+
+HARNESS = """\
+connectors:
+  J1:
+    pincount: 2
+  J2:
+    pincount: 2
+
+cables:
+  W1:
+    wirecount: 2
+
+connections:
+  -
+    - J1: [1, 2]
+    - W1: [1, 2]
+    - J2: [{pins}]
+"""
+
+
+def test_diff_table_and_json(tmp_path):
+    runner = CliRunner()
+    old = tmp_path / "old.yml"
+    new = tmp_path / "new.yml"
+    old.write_text(textwrap.dedent(HARNESS.format(pins="1, 2")))
+    new.write_text(textwrap.dedent(HARNESS.format(pins="2, 1")))
+
+    table = runner.invoke(cli, ["diff", str(old), str(new)])
+    assert table.exit_code == 0, table.output
+    assert "J1:1 -> W1:1 -> J2:2" in table.output
+    assert "removed" in table.output and "added" in table.output
+
+    result = runner.invoke(
+        cli, ["diff", str(old), str(new), "-f", "json", "--exit-code"]
+    )
+    assert result.exit_code == 1
+    record = json.loads(result.output)
+    assert len(record["connections"]["added"]) == 2
+    assert record["bom"] == []
+
+    same = runner.invoke(cli, ["diff", str(old), str(old), "--exit-code"])
+    assert same.exit_code == 0, same.output
+    assert "No differences." in same.output
@@ -10,9 +10,10 @@ def test_examples_cli_build_calls_tool(monkeypatch, tmp_path):
     runner = CliRunner()
     calls = {}
 
-    def fake_build(groups, output_base=None):
+    def fake_build(groups, output_base=None, jobs=1):
         calls["groups"] = list(groups)
         calls["output_base"] = output_base
+        calls["jobs"] = jobs
 
     monkeypatch.setattr(build_examples, "build_generated", fake_build)
 
@@ -28,12 +29,15 @@ def test_examples_cli_build_calls_tool(monkeypatch, tmp_path):
             "minimal-document",
             "--output-dir",
             str(tmp_path),
+            "--jobs",
+            "2",
         ],
     )
 
     assert result.exit_code == 0, result.output
     assert calls["groups"] == ["basic", "minimal-document"]
     assert calls["output_base"] == tmp_path
+    assert calls["jobs"] == 2
 
 
 @pytest.mark.functional
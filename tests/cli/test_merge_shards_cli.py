@@ -0,0 +1,80 @@
+import json
+import textwrap
+
+from typer.testing import CliRunner
+
+from filare.cli import cli
+
+HARNESS = """\
+connectors:
+  J1:
+    pincount: 2
+    pn: CON-{pn}
+  J2:
+    pincount: 2
+    pn: CON-2
+
+cables:
+  W1:
+    wirecount: 2
+    length: {length}
+
+connections:
+  -
+    - J1: [1, 2]
+    - W1: [1, 2]
+    - J2: [1, 2]
+"""
+
+
+def _write_sheets(tmp_path):
+    sheets = []
+    for idx, (pn, length) in enumerate([("A", 1), ("B", 2), ("A", 3)]):
+        path = tmp_path / f"sheet{idx}.yml"
+        path.write_text(textwrap.dedent(HARNESS.format(pn=pn, length=length)))
+        sheets.append(str(path))
+    return sheets
+
+
+def test_merged_shards_match_single_run(tmp_path):
+    runner = CliRunner()
+    sheets = _write_sheets(tmp_path)
+    single, sharded = tmp_path / "single", tmp_path / "sharded"
+    single.mkdir()
+    sharded.mkdir()
+
+    result = runner.invoke(cli, ["run", *sheets, "-f", "tb", "-o", str(single)])
+    assert result.exit_code == 0, result.output
+    for shard in ("1/2", "2/2"):
+        result = runner.invoke(
+            cli, ["run", *sheets, "-f", "tb", "-o", str(sharded), "--shard", shard]
+        )
+        assert result.exit_code == 0, result.output
+    assert not (sharded / "shared_bom.tsv").exists()
+    manifest = json.loads((sharded / "shard-1-of-2.json").read_text())
+    assert [sheet["sheet"] for sheet in manifest["sheets"]] == [0, 2]
+    assert "sheet0.tsv" in manifest["sheets"][0]["outputs"]
+    assert (sharded / "sheet1.tsv").read_text()
+
+    manifests = [str(sharded / f"shard-{i}-of-2.json") for i in (1, 2)]
+    result = runner.invoke(cli, ["merge-shards", *manifests])
+    assert result.exit_code == 0, result.output
+    for name in ("shared_bom.tsv", "sheet0.tsv", "sheet1.tsv", "sheet2.tsv"):
+        assert (sharded / name).read_bytes() == (single / name).read_bytes(), name
+
+
+def test_merge_shards_reports_missing_shards(tmp_path):
+    runner = CliRunner()
+    sheets = _write_sheets(tmp_path)
+    result = runner.invoke(
+        cli, ["run", *sheets, "-f", "tb", "-o", str(tmp_path), "--shard", "2/3"]
+    )
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(cli, ["merge-shards", str(tmp_path / "shard-2-of-3.json")])
+    assert result.exit_code != 0
+    assert "Missing shard manifests for shards 1, 3 of 3" in result.output
+
+    result = runner.invoke(cli, ["run", *sheets, "-f", "tb", "--shard", "4/3"])
+    assert result.exit_code != 0
+    assert "Invalid shard" in result.output
@@ -0,0 +1,61 @@
+import json
+import textwrap
+
+from typer.testing import CliRunner
+
+from filare.cli import cli
+
+
+def _write_harness(tmp_path):
+    harness_path = tmp_path / "h.yml"
+    harness_path.write_text(textwrap.dedent("""\
+            connectors:
+              J1:
+                pincount: 2
+              J2:
+                pincount: 2
+
+            cables:
+              W1:
+                wirecount: 2
+
+            connections:
+              -
+                - J1: [1, 2]
+                - W1: [1, 2]
+                - J2: [1, 2]
+            """))
+    return harness_path
+
+
+def test_netlist_export_pin_and_net(tmp_path):
+    runner = CliRunner()
+    harness_path = _write_harness(tmp_path)
+
+    exported = runner.invoke(
+        cli,
+        [
+            "netlist",
+            "export",
+            str(harness_path),
+            "-f",
+            "json",
+            "-o",
+            str(tmp_path / "n.json"),
+        ],
+    )
+    assert exported.exit_code == 0, exported.output
+    nets = json.loads((tmp_path / "n.json").read_text())
+    assert nets[1] == {"name": "J1:2", "pins": ["J1:2", "J2:2"], "wires": ["W1:2"]}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["h.yml", "n.json"]
+
+    pin = runner.invoke(cli, ["netlist", "pin", str(harness_path), "-p", "J2:1"])
+    assert pin.exit_code == 0, pin.output
+    assert "J2:1: J1:1 (J1:1, J2:1, W1:1)" in pin.output
+
+    unknown = runner.invoke(cli, ["netlist", "pin", str(harness_path), "-p", "J9:1"])
+    assert unknown.exit_code != 0
+
+    net = runner.invoke(cli, ["netlist", "net", str(harness_path), "-n", "J1:2"])
+    assert net.exit_code == 0, net.output
+    assert net.output.strip() == "J1:2: J1:2, J2:2, W1:2"
@@ -40,6 +40,10 @@ def test_overlap_cli_passes_arguments(monkeypatch, tmp_path):
             "Draft",
             "--config",
             str(tmp_path / "config.yml"),
+            "--workers",
+            "4",
+            "--cache",
+            str(tmp_path / "cache.json"),
         ],
     )
 
@@ -53,3 +57,5 @@ def test_overlap_cli_passes_arguments(monkeypatch, tmp_path):
     assert "--ignore-selector" in argv and ".legend" in argv
     assert "--ignore-text" in argv and "Draft" in argv
     assert "--config" in argv and str(tmp_path / "config.yml") in argv
+    assert "--workers" in argv and "4" in argv
+    assert "--cache" in argv and str(tmp_path / "cache.json") in argv
@@ -0,0 +1,103 @@
+import pickle
+
+import pytest
+
+import filare.flows.build_harness as build_harness
+from filare.errors import CompiledHarnessError
+from filare.flows.build_harness import compile_harness, load_harness
+from filare.flows.compiled_harness import (
+    COMPILED_MAGIC,
+    CompiledHarness,
+    code_digest,
+    compiled_path,
+    find_compiled_harness,
+)
+from filare.models.partnumber import PartNumberInfo
+from filare.settings import settings
+
+HARNESS = """\
+metadata:
+  title: compiled
+connectors:
+  X:
+    pincount: 3
+    pn: CON
+cables:
+  W:
+    wirecount: 3
+    length: 0.5
+    pn: CAB
+connections:
+  -
+    - X.X1: [1-3]
+    - W.W1: [1-3]
+    - X.X2: [1-3]
+additional_bom_items:
+  - type: Label
+    qty: 2
+"""
+
+
+def test_load_harness_uses_fresh_compiled_artifact(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "compiled_harness", True)
+    sheet = tmp_path / "sheet.yml"
+    sheet.write_text(HARNESS)
+    expected = load_harness([sheet])
+    path = compile_harness([sheet]).write(compiled_path(sheet))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML parsed although a compiled harness exists")
+
+    monkeypatch.setattr(build_harness, "parse_concat_merge_files", fail)
+    harness = load_harness([sheet])
+
+    assert list(harness.connectors) == ["X1", "X2"]
+    assert harness.metadata.title == "compiled"
+    assert [(str(e.description), e.qty) for e in harness.bom.values()] == [
+        (str(e.description), e.qty) for e in expected.bom.values()
+    ]
+    assert harness.netlist.connected(("X1", 1), ("X2", 1))
+
+    # artifacts of another schema (or Filare version) are ignored
+    data = path.read_bytes().replace(b'"schema": 2', b'"schema": 0', 1)
+    path.write_bytes(data)
+    with pytest.raises(CompiledHarnessError):
+        CompiledHarness.read_header(path)
+    assert path.read_bytes().startswith(COMPILED_MAGIC)
+    assert find_compiled_harness([sheet], [], "sheet", [tmp_path]) is None
+
+
+def test_compiled_artifacts_are_opt_in(tmp_path, monkeypatch):
+    sheet = tmp_path / "sheet.yml"
+    sheet.write_text(HARNESS)
+    path = compile_harness([sheet]).write(compiled_path(sheet))
+    parsed = []
+    parse = build_harness.parse_concat_merge_files
+
+    def counting_parse(*args, **kwargs):
+        parsed.append(args)
+        return parse(*args, **kwargs)
+
+    monkeypatch.setattr(build_harness, "parse_concat_merge_files", counting_parse)
+    load_harness([sheet])
+    assert len(parsed) == 1  # the artifact is not unpickled by default
+
+    # artifacts written by other Filare sources are ignored
+    monkeypatch.setattr(settings, "compiled_harness", True)
+    code = f'"code": "{code_digest()}"'.encode()
+    path.write_bytes(path.read_bytes().replace(code, b'"code": "other"', 1))
+    with pytest.raises(CompiledHarnessError, match="Filare sources"):
+        CompiledHarness.read_header(path)
+    load_harness([sheet])
+    assert len(parsed) == 2
+
+
+def test_partnumbers_drop_process_specific_state_when_pickled():
+    shared = PartNumberInfo.intern(pn="P-1")
+    assert pickle.loads(pickle.dumps(shared)) is shared
+
+    own = PartNumberInfo(pn="P-2")
+    hash(own)
+    copy = pickle.loads(pickle.dumps(own))
+    assert copy._hash is None
+    assert copy == own
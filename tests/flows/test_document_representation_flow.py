@@ -4,7 +4,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from filare.flows.build_harness import build_harness_from_files
+from filare.flows.build_harness import build_harness_from_files, load_hash_registry
 from filare.index_table import IndexTable
 from filare.models.document import DocumentRepresentation
 from filare.models.harness import Harness
@@ -53,6 +53,115 @@ def test_document_representation_written(tmp_path: Path, caplog):
     assert registry.exists()
 
 
+def test_shared_hash_registry_is_saved_by_caller(tmp_path: Path):
+    metadata_path = tmp_path / "m.yml"
+    metadata_path.write_text(
+        "metadata:\n"
+        "  pn: T\n"
+        "  company: ACME\n"
+        "  address: 1 Road\n"
+        "  sheet_total: 2\n"
+        "  sheet_current: 1\n"
+        "  sheet_name: S\n"
+        "  output_dir: .\n"
+        "  titlepage: t\n"
+        "  output_names: [a, b]\n"
+        "  files: [a.yml, b.yml]\n"
+        "  use_qty_multipliers: false\n"
+        "  multiplier_file_name: qty.txt\n"
+    )
+    registry = load_hash_registry(tmp_path)
+    for name in ("a", "b"):
+        harness_path = tmp_path / f"{name}.yml"
+        harness_path.write_text("connectors:\n  J1:\n    pincount: 1\n")
+        build_harness_from_files(
+            [harness_path],
+            [metadata_path],
+            output_formats=(),
+            output_dir=tmp_path,
+            return_types=("document",),
+            hash_registry=registry,
+        )
+        assert (tmp_path / f"{name}.document.yaml").exists()
+    assert not registry.path.exists()
+
+    registry.save()
+    saved = yaml.safe_load(registry.path.read_text())
+    assert sorted(saved) == ["a.document.yaml", "b.document.yaml"]
+
+
+def test_document_representation_written_as_json(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(settings, "document_format", "json")
+    harness_path = tmp_path / "h.json"
+    metadata_path = tmp_path / "m.json"
+    harness_path.write_text(
+        '{"connectors": {"J1": {"pincount": 1}}, "connections": [[{"J1": [1]}]]}'
+    )
+    metadata_path.write_text(
+        '{"metadata": {"pn": "T", "company": "ACME", "address": "1 Road",'
+        ' "sheet_total": 1, "sheet_current": 1, "sheet_name": "S",'
+        ' "output_dir": ".", "titlepage": "t", "output_names": ["h"],'
+        ' "files": ["h.json"], "use_qty_multipliers": false,'
+        ' "multiplier_file_name": "qty.txt"}}'
+    )
+
+    for _ in range(2):  # the second build reads the JSON document back
+        returned = build_harness_from_files(
+            [harness_path],
+            [metadata_path],
+            output_formats=(),
+            output_dir=tmp_path,
+            return_types="harness",
+        )
+
+    harness = returned["harness"]
+    assert list(harness.connectors) == ["J1"]
+    assert harness.connectors["J1"].pincount == 1
+    document = DocumentRepresentation.from_yaml(tmp_path / "h.document.json")
+    assert document.metadata["pn"] == "T"
+    assert (tmp_path / "document_hashes.json").exists()
+    assert not (tmp_path / "h.document.yaml").exists()
+
+
+def test_json_document_keeps_revision_dates(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(settings, "document_format", "json")
+    harness_path = tmp_path / "h.yml"
+    metadata_path = tmp_path / "m.yml"
+    harness_path.write_text("connectors:\n  J1:\n    pincount: 1\n")
+    metadata_path.write_text(
+        "metadata:\n"
+        "  pn: T\n"
+        "  company: ACME\n"
+        "  address: 1 Road\n"
+        "  sheet_total: 1\n"
+        "  sheet_current: 1\n"
+        "  sheet_name: S\n"
+        "  output_dir: .\n"
+        "  titlepage: t\n"
+        "  output_names: [h]\n"
+        "  files: [h.yml]\n"
+        "  use_qty_multipliers: false\n"
+        "  multiplier_file_name: qty.txt\n"
+        "  revisions:\n"
+        "    a:\n"
+        "      name: bob ross\n"
+        "      date: 2023-03-29\n"
+        "      changelog: initial release\n"
+    )
+
+    build_harness_from_files(
+        [harness_path],
+        [metadata_path],
+        output_formats=(),
+        output_dir=tmp_path,
+        return_types="harness",
+    )
+
+    document = DocumentRepresentation.from_yaml(tmp_path / "h.document.json")
+    revision = document.metadata["revisions"]["a"]
+    assert revision["date"] == "2023-03-29"
+
+
 @pytest.mark.functional
 def test_document_representation_not_overwritten_on_user_edit(tmp_path: Path, caplog):
     caplog.set_level(logging.WARNING)
@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+from filare.errors import FilareFlowException
+from filare.flows.pipeline import Pipeline, Stage
+
+
+def test_pipeline_keeps_input_order_with_concurrent_stages():
+    def slow_square(value):
+        time.sleep(0.001 * (value % 3))
+        return value * value
+
+    pipeline = Pipeline(
+        [
+            Stage("inc", lambda value: value + 1),
+            Stage("square", slow_square, workers=4),
+            Stage("str", str, workers=2),
+        ],
+        queue_size=2,
+    )
+
+    assert pipeline.run(range(50)) == [str((n + 1) ** 2) for n in range(50)]
+    assert [stat.items for stat in pipeline.stats] == [50, 50, 50]
+    assert all(stat.max_depth <= 2 for stat in pipeline.stats)
+
+
+def test_pipeline_reraises_first_failing_item():
+    def fail_on_odd(value):
+        if value % 2:
+            raise ValueError(f"item {value}")
+        return value
+
+    pipeline = Pipeline([Stage("check", fail_on_odd), Stage("next", str, workers=2)])
+
+    with pytest.raises(ValueError, match="item 1"):
+        pipeline.run(range(10))
+    with pytest.raises(FilareFlowException):
+        Pipeline([Stage("write", str, workers=0)])
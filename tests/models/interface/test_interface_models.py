@@ -1,3 +1,5 @@
+import json
+
 import yaml
 
 from filare.models.interface.base import FilareInterfaceModel
@@ -20,6 +22,15 @@ def test_interface_model_to_yaml_round_trip():
     assert rebuilt.template.name
 
 
+def test_interface_model_to_json_round_trip():
+    harness = FakeHarnessInterfaceFactory.build()
+    rebuilt = type(harness).model_validate_json(harness.to_json())
+    assert rebuilt == harness
+    assert list(json.loads(harness.to_json())) == list(
+        yaml.safe_load(harness.to_yaml())
+    )
+
+
 def test_factories_build_valid_models():
     connector = FakeConnectorInterfaceFactory.build()
     cable = FakeCableInterfaceFactory.build()
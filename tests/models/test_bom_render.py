@@ -1,6 +1,7 @@
 from filare.models.bom import BomEntry, BomRender, BomRenderOptions
 from filare.models.numbers import NumberAndUnit
 from filare.models.partnumber import PartNumberInfo
+from filare.models.table_models import TablePaginationOptions
 
 
 def make_entry(desc="Widget", qty=1, designators=None, per_harness=None):
@@ -66,3 +67,18 @@ def test_bom_render_as_tsv():
     tsv = render.as_tsv()
     assert "Item1" in tsv
     assert "Item2" in tsv
+
+
+def test_bom_render_paginate_splits_rows_across_pages():
+    render = BomRender(
+        header=["#", "Qty", "Unit", "Description", "Designators", ""],
+        rows=[make_entry(desc=f"Item{i}").as_list() + [""] for i in range(5)],
+        strip_empty_columns=True,
+    )
+
+    pages = render.paginate(TablePaginationOptions(rows_per_page=2))
+
+    assert [page.suffix for page in pages] == ["a", "b", "c"]
+    assert [len(page.rows) for page in pages] == [2, 2, 1]
+    assert "Item2" in pages[1].html and "Item1" not in pages[1].html
+    assert all(len(row) == 6 for row in render.rows)  # source rows untouched
@@ -21,3 +21,18 @@ def test_cable_qty_multiplier_applies_length(cable):
     cable.compute_qty_multipliers()
     sleeve = cable.additional_components[0]
     assert sleeve._qty_multiplier_computed == cable.length.number
+
+
+def test_pins_wires_and_connections_have_no_instance_dict(cable, pin_pair):
+    left_pin, right_pin = pin_pair
+    cable._connect(left_pin, 1, right_pin)
+    wire = cable.wire_objects[1]
+
+    for item in (left_pin, wire, cable._connections[0]):
+        assert not hasattr(item, "__dict__")
+    assert wire.parent == "C1" and wire.length == cable.length
+    assert left_pin._num_connections == 0 and left_pin == PinClass(
+        index=0, id="1", label="L1", color=MultiColor("RD"), parent="X1"
+    )
+    # methods using super() keep working on the slotted classes
+    assert wire.partnumbers is not None and hash(wire)
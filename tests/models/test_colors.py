@@ -168,3 +168,21 @@ def test_color_output_mode_changes(monkeypatch, mode):
     elif "HTML_" in mode.name:
         assert c.html is not None
         assert s.lower().startswith("#") or s == c.html
+
+
+def test_equal_color_inputs_share_one_immutable_instance(monkeypatch):
+    red = SingleColor("RD")
+
+    assert SingleColor("RD") is red and SingleColor(red) is red
+    assert MultiColor("RDBK") is MultiColor("RDBK")
+    assert MultiColor([red, "BK"]) is MultiColor([SingleColor("RD"), "BK"])
+    assert MultiColor(colors=[red]) is not MultiColor([red])
+    with pytest.raises(ValueError):
+        red.html = "#000000"
+
+    monkeypatch.setattr(
+        "filare.models.colors.color_output_mode", ColorOutputMode.DE_LOWER
+    )
+    assert red.code_de == "rt"
+    monkeypatch.setattr("filare.models.colors.padding_amount", 3)
+    assert red.html_padded == "#ff0000:#ff0000:#ff0000"
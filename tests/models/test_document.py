@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from types import SimpleNamespace
@@ -150,3 +151,66 @@ def test_make_jsonable_handles_path_and_enum():
     assert result["path"] == "a/b.txt"
     assert result["choice"] == "value"
     assert result["items"] == ["c/d"]
+
+
+def test_document_representation_json_round_trip(tmp_path: Path):
+    doc = DocumentRepresentation(
+        metadata={"title": "Harness"},
+        pages=[HarnessPage(type=PageType.harness, name="main", formats=["svg"])],
+        notes="remember to torque",
+        extras={"options": {"bgcolor": "WH"}},
+    )
+    yaml_path = tmp_path / "doc.document.yaml"
+    json_path = tmp_path / "doc.document.json"
+    doc.to_yaml(yaml_path)
+    doc.to_yaml(json_path)
+    assert json_path.read_text().startswith("{")
+
+    from_json = DocumentRepresentation.from_yaml(json_path)
+    assert from_json.as_dict() == DocumentRepresentation.from_yaml(yaml_path).as_dict()
+    assert isinstance(from_json.pages[0], HarnessPage)
+    assert from_json.compute_hash() == doc.compute_hash()
+
+    registry = DocumentHashRegistry(tmp_path / "document_hashes.json")
+    registry.add(json_path.name, doc.compute_hash(), allow_override=False)
+    registry.save()
+    reloaded = DocumentHashRegistry(tmp_path / "document_hashes.json")
+    reloaded.load()
+    assert reloaded.contains(json_path.name, from_json.compute_hash())
+
+
+def test_document_hash_registry_saves_are_merged(tmp_path: Path):
+    reg_path = tmp_path / "document_hashes.yaml"
+    registries = [DocumentHashRegistry(reg_path) for _ in range(32)]
+    for registry in registries:
+        registry.load()
+    for idx, registry in enumerate(registries):
+        registry.add(f"doc{idx}.yaml", f"hash{idx}", allow_override=False)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(DocumentHashRegistry.save, registries))
+
+    merged = DocumentHashRegistry(reg_path)
+    merged.load()
+    for idx in range(32):
+        assert merged.contains(f"doc{idx}.yaml", f"hash{idx}")
+    assert sorted(path.name for path in tmp_path.iterdir()) == [reg_path.name]
+
+
+def test_document_hash_registry_save_skips_unchanged(tmp_path: Path):
+    registry = DocumentHashRegistry(tmp_path / "document_hashes.yaml")
+    registry.load()
+    registry.save()
+    assert not registry.path.exists()
+    registry.add("doc.yaml", "abc")
+    registry.save()
+    mtime = registry.path.stat().st_mtime_ns
+    registry.add("doc.yaml", "abc")
+    registry.save()
+    assert registry.path.stat().st_mtime_ns == mtime
+
+
+def test_document_hash_ignores_key_order():
+    first = DocumentRepresentation(metadata={"title": "H", "pn": "1"})
+    second = DocumentRepresentation(metadata={"pn": "1", "title": "H"})
+    assert first.compute_hash() == second.compute_hash()
+    assert first.compute_hash() != DocumentRepresentation().compute_hash()
@@ -0,0 +1,173 @@
+from filare.models.bom import BomEntry, BomIndex, BomSlot
+from filare.models.cable import CableModel
+from filare.models.connector import ConnectorModel
+from filare.models.harness import Harness
+from filare.models.notes import Notes
+from filare.models.numbers import NumberAndUnit
+from filare.models.options import PageOptions
+from filare.models.partnumber import PartNumberInfo
+
+
+def _harness(metadata):
+    harness = Harness(metadata=metadata, options=PageOptions(), notes=Notes())
+    harness.add_connector_model(
+        ConnectorModel(
+            designator="J1",
+            pincount=2,
+            additional_components=[
+                {"type": "Crimp", "qty_multiplier": "populated"},
+            ],
+        )
+    )
+    harness.add_connector_model(ConnectorModel(designator="J2", pincount=2))
+    harness.add_cable_model(
+        CableModel(designator="W1", wirecount=2, colors=["RD", "BK"], length=1)
+    )
+    harness.add_additional_bom_item({"type": "Tag"})
+    return harness
+
+
+def _quantities(bom):
+    return {entry.description: entry.qty.number for entry in bom.values()}
+
+
+def test_bom_is_tracked_as_components_are_added(basic_metadata):
+    harness = _harness(basic_metadata)
+    harness.connect("J1", 1, "W1", 1, "J2", 1)
+
+    harness.populate_bom()
+
+    quantities = _quantities(harness.bom)
+    assert quantities["Tag"] == 1
+    assert quantities["Crimp"] == 1
+    assert [entry.id for entry in harness.bom.values()] == list(
+        range(1, len(harness.bom) + 1)
+    )
+
+
+def test_connect_updates_qty_multipliers(basic_metadata):
+    harness = _harness(basic_metadata)
+    harness.connect("J1", 1, "W1", 1, "J2", 1)
+    harness.populate_bom()
+    assert _quantities(harness.bom)["Crimp"] == 1
+
+    harness.connect("J1", 2, "W1", 2, "J2", 2)
+    harness.populate_bom()
+
+    rebuilt = _harness(basic_metadata)
+    rebuilt.connect("J1", 1, "W1", 1, "J2", 1)
+    rebuilt.connect("J1", 2, "W1", 2, "J2", 2)
+    rebuilt.populate_bom()
+    assert _quantities(harness.bom)["Crimp"] > 1
+    assert _quantities(harness.bom) == _quantities(rebuilt.bom)
+
+
+def test_populate_bom_twice_is_stable(basic_metadata):
+    harness = _harness(basic_metadata)
+    harness.connect("J1", 1, "W1", 1, "J2", 1)
+    harness.populate_bom()
+    first = _quantities(harness.bom)
+    shared_first = {k: v.qty.number for k, v in harness.shared_bom.items()}
+
+    harness.populate_bom()
+
+    assert _quantities(harness.bom) == first
+    assert {k: v.qty.number for k, v in harness.shared_bom.items()} == shared_first
+
+
+def test_invalidate_bom_picks_up_edited_component(basic_metadata):
+    harness = _harness(basic_metadata)
+    harness.populate_bom()
+    assert "Tag" in _quantities(harness.bom)
+
+    harness.connectors["J2"].ignore_in_bom = True
+    harness.populate_bom()
+    assert len([e for e in harness.bom.values() if "J2" in e.designators]) == 1
+
+    harness.invalidate_bom("J2")
+    harness.populate_bom()
+    assert not [e for e in harness.bom.values() if "J2" in e.designators]
+
+
+def test_bom_index_regroups_items_whose_key_changed():
+    class Item:
+        ignore_in_bom = False
+
+        def __init__(self, description):
+            self.description = description
+
+        @property
+        def bom_entry(self):
+            return BomEntry(
+                qty=NumberAndUnit(number=1, unit=None),
+                partnumbers=PartNumberInfo(pn="PN"),
+                description=self.description,
+            )
+
+    first, second = Item("A"), Item("A")
+    index = BomIndex()
+    key = hash(first.bom_entry)
+    index.set_source("first", [BomSlot((0,), first, (key,))])
+    index.set_source("second", [BomSlot((1,), second, (key,))])
+    assert [e.qty.number for e in index.entries().values()] == [2]
+
+    second.description = "B"
+    index.invalidate("second")
+
+    entries = index.entries()
+    assert [(e.description, e.qty.number) for e in entries.values()] == [
+        ("A", 1),
+        ("B", 1),
+    ]
+
+
+def test_invalidated_cable_with_length_multiplier(basic_metadata):
+    harness = Harness(metadata=basic_metadata, options=PageOptions(), notes=Notes())
+    harness.add_cable_model(
+        CableModel(
+            designator="W1",
+            wirecount=1,
+            length="2 m",
+            additional_components=[
+                {"type": "Sleeve", "qty": 1, "qty_multiplier": "length"},
+            ],
+        )
+    )
+    harness.populate_bom()
+    sleeve = [e for e in harness.bom.values() if e.description == "Sleeve"]
+
+    harness.invalidate_bom("W1")
+    harness.populate_bom()
+
+    again = [e for e in harness.bom.values() if e.description == "Sleeve"]
+    assert [str(e.qty) for e in again] == [str(e.qty) for e in sleeve]
+
+
+def test_sheet_bom_lists_only_its_own_harness(basic_metadata):
+    shared_bom = {}
+    first = _harness(basic_metadata)
+    second = _harness(basic_metadata.model_copy(update={"output_name": "other"}))
+    first.shared_bom = second.shared_bom = shared_bom
+    first.populate_bom()
+    second.populate_bom()  # parsed before the first sheet is written
+
+    for entry in first.bom.values():
+        assert list(entry.per_harness) == [first.name]
+    for entry in shared_bom.values():
+        assert list(entry.per_harness) == [first.name, second.name]
+
+
+def test_populate_bom_again_drops_removed_entries(basic_metadata):
+    harness = _harness(basic_metadata)
+    harness.populate_bom()
+    assert "Tag" in _quantities(harness.shared_bom)
+
+    harness.additional_bom_items[0].ignore_in_bom = True
+    harness.invalidate_bom()
+    harness.populate_bom()
+
+    assert "Tag" not in _quantities(harness.shared_bom)
+    assert _quantities(harness.shared_bom) == _quantities(harness.bom)
+    assert sorted(e.id for e in harness.shared_bom.values()) == sorted(
+        e.id for e in harness.bom.values()
+    )
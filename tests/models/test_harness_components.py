@@ -0,0 +1,84 @@
+import filare.models.harness as harness_module
+from filare.models.harness import Harness
+from filare.models.notes import Notes
+from filare.models.options import PageOptions
+
+
+def _harness(metadata):
+    harness = Harness(metadata=metadata, options=PageOptions(), notes=Notes())
+    for designator in ("J1", "J2", "J3", "J4", "J5"):
+        harness.add_connector_model({"designator": designator, "pincount": 2})
+    harness.add_cable_model({"designator": "W1", "wirecount": 1, "colors": ["RD"]})
+    harness.add_cable_model({"designator": "W2", "wirecount": 1, "colors": ["BK"]})
+    harness.connect("J1", 1, "W1", 1, "J2", 1)
+    harness.connect("J3", 1, "W2", 1, "J4", 1)
+    return harness
+
+
+def test_graph_components_follow_connections(basic_metadata):
+    harness = _harness(basic_metadata)
+
+    assert harness.graph_components() == [
+        ["J1", "J2", "W1"],
+        ["J3", "J4", "W2"],
+        ["J5"],
+    ]
+
+
+def test_component_graphs_only_contain_their_nodes(basic_metadata, monkeypatch):
+    harness = _harness(basic_metadata)
+    monkeypatch.setattr(harness_module.settings, "graphviz_split_components", True)
+
+    graphs = harness.component_graphs()
+
+    assert len(graphs) == 3
+    assert "J1" in graphs[0].source and "J3" not in graphs[0].source
+    assert "W2" in graphs[1].source and "W1" not in graphs[1].source
+    assert [(g, f) for g, f in harness.layout_jobs(["html", "png"])][-1] == (
+        harness.graph,
+        ["png"],
+    )
+
+    # the raster PDF diagram is drawn from the layouts of the packed components
+    monkeypatch.setattr(harness_module.settings, "pdf_diagram", "raster")
+    assert [f for _, f in harness.layout_jobs(["html"])] == [["svg", "dot"]] * 3
+
+
+def test_render_graph_packs_component_svgs(basic_metadata, monkeypatch):
+    harness = _harness(basic_metadata)
+    monkeypatch.setattr(harness_module.settings, "graphviz_split_components", True)
+    sizes = iter([(100, 40), (60, 20), (10, 10)])
+
+    def fake_pipe_graphs(graphs, fmt, cache=None):
+        svgs = []
+        for graph in graphs:
+            width, height = next(sizes)
+            svgs.append(
+                f'<svg width="{width}pt" height="{height}pt" '
+                f'viewBox="0.00 0.00 {width}.00 {height}.00">'
+                f'<g id="graph0"><polygon fill="white" stroke="none"/></g></svg>'.encode()
+            )
+        return svgs
+
+    monkeypatch.setattr(harness_module, "pipe_graphs", fake_pipe_graphs)
+
+    svg = harness.render_graph("svg").decode()
+
+    assert 'width="100pt"' in svg
+    assert svg.count('id="c') == 3
+    assert 'y="76.00" width="60.00"' in svg
+
+
+def test_wire_padding_is_passed_to_the_graph(basic_metadata, monkeypatch):
+    harness = _harness(basic_metadata)
+    source = harness.create_graph().source
+    # sheets are laid out concurrently: the module default must not leak in
+    monkeypatch.setattr("filare.models.colors.padding_amount", 3)
+    assert harness.wire_padding == 1
+    assert harness.create_graph().source == source
+
+    harness.add_cable_model({"designator": "W3", "wirecount": 1, "colors": ["RDBK"]})
+    harness.connect("J5", 1, "W3", 1, "J5", 2)
+    monkeypatch.setattr("filare.models.colors.padding_amount", 1)
+    assert harness.wire_padding == 3
+    assert "#000000:#ff0000:#000000:#ff0000:#000000" in harness.create_graph().source
@@ -0,0 +1,43 @@
+from filare.models.harness import Harness
+from filare.models.harness_diff import diff_harnesses
+from filare.models.notes import Notes
+from filare.models.options import PageOptions
+
+
+def _harness(metadata, revision):
+    harness = Harness(metadata=metadata, options=PageOptions(), notes=Notes())
+    harness.add_connector_model({"designator": "J1", "pincount": 2, "pn": "CON-1"})
+    harness.add_connector_model(
+        {"designator": "J2", "pincount": 2, "pn": "CON-2" if revision else "CON-1"}
+    )
+    harness.add_cable_model(
+        {"designator": "W1", "wirecount": 2, "colors": ["RD", "BK"]}
+    )
+    harness.connect("J1", 1, "W1", 1, "J2", 1)
+    harness.connect("J1", 2, "W1", 2, "J2", 1 if revision else 2)
+    if not revision:
+        harness.add_connector_model({"designator": "J3", "pincount": 1})
+    harness.populate_bom()
+    return harness
+
+
+def test_diff_reports_items_connections_and_bom(basic_metadata):
+    old, new = _harness(basic_metadata, 0), _harness(basic_metadata, 1)
+
+    result = diff_harnesses(old, new)
+
+    assert result.connectors.removed == ["J3"]
+    assert [c.field for c in result.connectors.changed["J2"]] == ["partnumbers"]
+    assert not result.cables and not result.wires
+    assert result.connections.removed == ["J1:2 -> W1:2 -> J2:2"]
+    assert result.connections.added == ["J1:2 -> W1:2 -> J2:1"]
+    assert sorted((d.old, d.new) for d in result.bom) == [(0, 1), (1, 0), (2, 1)]
+    assert ["connector", "J3", "removed", "", "", ""] in result.rows()
+    assert result.record()["connectors"]["removed"] == ["J3"]
+
+
+def test_diff_of_identical_harnesses_is_empty(basic_metadata):
+    result = diff_harnesses(_harness(basic_metadata, 0), _harness(basic_metadata, 0))
+
+    assert not result
+    assert result.rows() == []
@@ -98,6 +98,7 @@ def test_harness_output_and_tables(tmp_path, basic_metadata, monkeypatch):
     assert (out.with_suffix(".svg")).exists()
     assert (out.with_suffix(".gv")).exists()
     assert (out.with_suffix(".tsv")).exists()
+    assert (out.with_suffix(".csv")).exists()
     assert template_calls  # cut/termination tables rendered
     assert html_calls  # html output invoked
 
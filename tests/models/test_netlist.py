@@ -0,0 +1,71 @@
+import io
+import json
+
+import pytest
+
+from filare.errors import PinResolutionError
+from filare.models.harness import Harness
+from filare.models.netlist import write_netlist_csv, write_netlist_json
+from filare.models.notes import Notes
+from filare.models.options import PageOptions
+
+
+def _harness(metadata):
+    harness = Harness(metadata=metadata, options=PageOptions(), notes=Notes())
+    harness.add_connector_model(
+        {"designator": "J1", "pincount": 3, "loops": [{"first": 2, "second": 3}]}
+    )
+    for designator in ("J2", "J3"):
+        harness.add_connector_model({"designator": designator, "pincount": 3})
+    harness.add_cable_model(
+        {"designator": "W1", "wirecount": 2, "colors": ["RD", "BK"], "shield": True}
+    )
+    harness.add_cable_model({"designator": "W2", "wirecount": 1, "colors": ["BU"]})
+    harness.connect("J1", 1, "W1", 1, "J2", 1)
+    harness.connect("J1", 2, "W1", 2, "J2", 2)
+    harness.connect("J2", 1, "W2", 1, "J3", 1)
+    harness.connect("J1", 1, "W1", "s", None, None)
+    return harness
+
+
+def test_netlist_joins_pins_across_cables_loops_and_shields(basic_metadata):
+    netlist = _harness(basic_metadata).netlist
+
+    assert [net.record() for net in netlist] == [
+        {
+            "name": "J1:1",
+            "pins": ["J1:1", "J2:1", "J3:1"],
+            "wires": ["W1:1", "W1:s", "W2:1"],
+        },
+        {"name": "J1:2", "pins": ["J1:2", "J1:3", "J2:2"], "wires": ["W1:2"]},
+    ]
+    assert netlist.net_of("J3", 1) is netlist.net("J1:1")
+    assert netlist.connected(("J1", 3), ("J2", "2"))
+    assert not netlist.connected(("J1", 1), ("J1", 2))
+    assert netlist.net_of("J3", 3) is None
+    with pytest.raises(PinResolutionError):
+        netlist.net_of("J9", 1)
+
+
+def test_netlist_is_rebuilt_after_new_connections(basic_metadata):
+    harness = _harness(basic_metadata)
+    assert not harness.netlist.connected(("J3", 2), ("J1", 3))
+
+    harness.add_cable_model({"designator": "W3", "wirecount": 1, "colors": ["GN"]})
+    harness.connect("J3", 2, "W3", 1, "J2", 2)
+
+    assert harness.netlist.connected(("J3", 2), ("J1", 3))
+
+
+def test_netlist_writers(basic_metadata):
+    netlist = _harness(basic_metadata).netlist
+    csv_stream = io.StringIO(newline="")
+    json_stream = io.StringIO()
+
+    assert write_netlist_csv(csv_stream, netlist) == 10
+    assert write_netlist_json(json_stream, netlist) == 2
+
+    lines = csv_stream.getvalue().splitlines()
+    assert lines[0] == "Net,Designator,Pin/Wire,Kind,Label"
+    assert "J1:1,W1,s,shield,Shield" in lines
+    assert json.loads(json_stream.getvalue())[1]["name"] == "J1:2"
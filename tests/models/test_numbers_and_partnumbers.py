@@ -1,5 +1,9 @@
+import random
+from functools import reduce
+
 import pytest
 
+import filare.models.partnumber as partnumber_module
 from filare.errors import (
     PartNumberValidationError,
     UnitMismatchError,
@@ -171,3 +175,80 @@ def test_partnumbers2list_without_parents():
     parent = PartNumberInfo(pn="Solo", manufacturer="ACME")
     lst_with_parent = partnumbers2list(pn, PartnumberInfoList(pn_list=[parent]))
     assert isinstance(lst_with_parent, list)
+
+
+def test_partnumberinfo_intern_shares_immutable_instances():
+    first = PartNumberInfo.intern(pn="I1", manufacturer="ACME")
+    assert PartNumberInfo.intern(pn="I1", manufacturer="ACME", mpn=None) is first
+    assert first == PartNumberInfo(pn="I1", manufacturer="ACME")
+    with pytest.raises(UnsupportedModelOperation):
+        first.mpn = "M"
+    editable = first.copy()
+    editable.mpn = "M"
+    assert editable != first
+    assert hash(editable) == hash(PartNumberInfo(pn="I1", manufacturer="ACME", mpn="M"))
+    assert first.replace(mpn="M") is PartNumberInfo.intern(
+        pn="I1", manufacturer="ACME", mpn="M"
+    )
+
+
+def test_partnumberinfo_intern_table_is_bounded(monkeypatch):
+    monkeypatch.setattr(partnumber_module, "MAX_INTERNED_PARTNUMBERS", 1)
+    monkeypatch.setattr(PartNumberInfo, "_interned", {})
+    monkeypatch.setattr(PartNumberInfo, "_interned_inputs", {})
+    first = PartNumberInfo.intern(pn="B1")
+    second = PartNumberInfo.intern(pn="B2")
+    assert PartNumberInfo.intern(pn="B1") is first
+    assert PartNumberInfo.intern(pn="B2") is not second
+    assert PartNumberInfo.intern(pn="B2") == second
+    with pytest.raises(UnsupportedModelOperation):
+        second.pn = "B3"
+    assert len(PartNumberInfo._interned) == len(PartNumberInfo._interned_inputs) == 1
+
+
+def test_number_and_unit_is_an_immutable_hashable_value():
+    parsed = NumberAndUnit.to_number_and_unit("2.5 m")
+    assert NumberAndUnit.to_number_and_unit("2.5 m") is parsed
+    assert parsed == NumberAndUnit(2.5, "m")
+    assert len({parsed, NumberAndUnit(2.5, "m"), NumberAndUnit(2.5, "mm")}) == 2
+    with pytest.raises(UnsupportedModelOperation):
+        parsed.number = 3
+    total = parsed + 1
+    assert str(total) == "3.50 m" and str(parsed) == "2.50 m"
+    with pytest.raises(UnitMismatchError):
+        parsed + NumberAndUnit(1, "mm")
+
+
+def _pairwise_keep_unique(pn_list, other):
+    """Reference implementation comparing every pair of parts."""
+    kept = []
+    for pn_1 in pn_list:
+        for pn_2 in pn_list:
+            if pn_1 == pn_2:
+                continue
+            eq = pn_1.keep_only_eq(pn_2)
+            if eq:
+                kept.append(eq)
+    if not kept:
+        shared = reduce(lambda x, y: x.keep_only_eq(y), pn_list) if pn_list else None
+        if not shared:
+            return [pn.fields_key for pn in other]
+    else:
+        shared = reduce(lambda x, y: x.keep_only_eq(y), kept)
+    return [r.fields_key for r in (pn.remove_eq(shared) for pn in other) if r]
+
+
+def test_partnumberinfo_list_keep_unique_matches_pairwise():
+    rng = random.Random(0)
+    for _ in range(200):
+        pn_list = [
+            PartNumberInfo(
+                pn=rng.choice(["", "A", "B"]),
+                manufacturer=rng.choice(["", "M1", "M2"]),
+                mpn=rng.choice(["", "X"]),
+            )
+            for _ in range(rng.randint(1, 6))
+        ]
+        lst = PartnumberInfoList(pn_list=pn_list)
+        kept = [pn.fields_key for pn in lst.keep_unique(pn_list)]
+        assert kept == _pairwise_keep_unique(pn_list, pn_list)
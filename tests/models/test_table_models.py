@@ -1,4 +1,9 @@
-from filare.models.table_models import TableCell, TableRow
+from filare.models.table_models import (
+    TableCell,
+    TableData,
+    TableRow,
+    paginate_table,
+)
 
 
 def test_table_cell_defaults():
@@ -11,3 +16,36 @@ def test_table_row_values_property():
     cells = [TableCell(value="a"), TableCell(value="b", css_class="bold")]
     row = TableRow(cells=cells)
     assert row.values == ["a", "b"]
+
+
+def test_paginate_table_by_count_and_height():
+    rows = [("a",), ("bb",), ("c",), ("dddd",), ("e",)]
+
+    assert paginate_table(rows, rows_per_page=2) == [
+        ("a", [("a",), ("bb",)]),
+        ("b", [("c",), ("dddd",)]),
+        ("c", [("e",)]),
+    ]
+    assert paginate_table(rows) == [("", rows)]
+    assert paginate_table([], rows_per_page=2) == []
+
+    pages = paginate_table(
+        rows, max_height=4, row_height=lambda row: len(row[0]), use_letter_suffix=False
+    )
+    assert [chunk for _, chunk in pages] == [
+        [("a",), ("bb",), ("c",)],
+        [("dddd",)],
+        [("e",)],
+    ]
+    assert {suffix for suffix, _ in pages} == {""}
+
+
+def test_table_data_strips_empty_columns():
+    table = TableData(["#", "", "Desc"], [[1, "x", "Wire"]], ["id", "blank", "desc"])
+
+    stripped = table.strip_empty_columns()
+
+    assert stripped.header == ("#", "Desc")
+    assert stripped.columns_class == ("id", "desc")
+    assert stripped.rows == [("1", "Wire")]
+    assert table.rows == [("1", "x", "Wire")]
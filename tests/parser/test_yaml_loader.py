@@ -76,3 +76,43 @@ def test_merge_item_handles_none_and_type_mismatch():
 
 def test_merge_item_lists_are_concatenated():
     assert merge_item([1, 2], [3, 4]) == [1, 2, 3, 4]
+
+
+def test_merge_item_keeps_key_order():
+    merged = merge_item({"b": 1, "a": {"y": 1}}, {"c": 2, "a": {"x": 2}})
+    assert list(merged) == ["b", "a", "c"]
+    assert list(merged["a"]) == ["y", "x"]
+
+
+def test_parse_merge_files_reads_json_like_yaml(tmp_path):
+    yml = tmp_path / "a.yml"
+    jsn = tmp_path / "b.json"
+    yml.write_text("a: {pins: [1, 2]}\nb: 1.5")
+    jsn.write_text('{"a": {"pins": [3], "pn": 10}, "c": null}')
+    merged = parse_merge_files([yml, jsn])
+    assert merged == {"a": {"pins": ["1", "2", "3"], "pn": "10"}, "b": 1.5, "c": None}
+
+
+def test_parse_concat_merge_files_json_matches_yaml(tmp_path):
+    components = tmp_path / "components.yml"
+    components.write_text("connectors:\n  X: &x {pincount: 2}\n")
+    harness = tmp_path / "harness.yml"
+    harness.write_text("connectors:\n  Y: *x\ncables:\n  W: {wirecount: 2}\n")
+    meta = tmp_path / "meta.yml"
+    meta.write_text("metadata: {title: T}\ncables: {W: {length: 1}}\n")
+    expected = parse_concat_merge_files([components, harness], [meta])
+
+    harness_json = tmp_path / "harness.json"
+    harness_json.write_text(
+        '{"connectors": {"Y": {"pincount": 2}}, "cables": {"W": {"wirecount": 2}}}'
+    )
+    meta_json = tmp_path / "meta.json"
+    meta_json.write_text('{"metadata": {"title": "T"}, "cables": {"W": {"length": 1}}}')
+    # as with concatenated YAML, the harness connectors replace the components'
+    assert expected["connectors"] == {"Y": {"pincount": "2"}}
+    assert parse_concat_merge_files([components, harness_json], [meta_json]) == expected
+    # YAML files next to each other still share anchors
+    extra = tmp_path / "extra.json"
+    extra.write_text('{"options": {"bgcolor": "WH"}}')
+    merged = parse_concat_merge_files([components, harness, extra], [meta_json])
+    assert merged == {**expected, "options": {"bgcolor": "WH"}}
@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+
+import pytest
+
+from filare.errors import UnsupportedBomExportFormat
+from filare.models.bom import BomEntry
+from filare.models.numbers import NumberAndUnit
+from filare.models.partnumber import PartNumberInfo
+from filare.render.bom_export import (
+    export_bom,
+    write_bom_csv,
+    write_bom_jsonl,
+    write_bom_tsv,
+)
+
+
+def _bom():
+    quoted = BomEntry(
+        qty=NumberAndUnit(0.5, "m"),
+        partnumbers=PartNumberInfo(pn="PN-2", manufacturer="ACME"),
+        id="2",
+        description='Sleeve, 3/4", black, <a href="x">link</a>',
+        category="ADDITIONAL",
+        per_harness={"H1": {"qty": NumberAndUnit(0.5, "m")}},
+    )
+    empty = BomEntry(
+        qty=NumberAndUnit(0, None),
+        partnumbers=PartNumberInfo(pn="PN-3"),
+        id="3",
+        description="Unused",
+    )
+    return {hash(quoted): quoted, hash(empty): empty}
+
+
+def test_write_bom_csv_quotes_fields(bom_entry_sample):
+    bom = {hash(bom_entry_sample): bom_entry_sample, **_bom()}
+    stream = io.StringIO(newline="")
+
+    assert write_bom_csv(stream, bom) == 2
+
+    assert "\r\n" in stream.getvalue()
+    rows = list(csv.reader(io.StringIO(stream.getvalue(), newline="")))
+    assert rows[0] == ["#", "Qty", "Unit", "Description", "Designators", "Per Harness"]
+    assert rows[1] == ["1", "2", "", "Test Part", "X1", "H1: 1"]
+    assert rows[2] == ["2", "0.5", "m", 'Sleeve, 3/4", black, link', "", "H1: 0.50 m"]
+
+
+def test_write_bom_tsv_keeps_empty_entries_when_not_filtering():
+    stream = io.StringIO()
+
+    assert write_bom_tsv(stream, _bom(), include_per_harness=False) == 1
+    assert write_bom_tsv(io.StringIO(), _bom(), filter_entries=False) == 2
+
+    lines = stream.getvalue().splitlines()
+    assert lines[0] == "#\tQty\tUnit\tDescription\tDesignators"
+    assert lines[1].split("\t")[:3] == ["2", "0.5", "m"]
+
+
+def test_write_bom_jsonl_records():
+    stream = io.StringIO()
+
+    write_bom_jsonl(stream, _bom(), filter_entries=False)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [r["id"] for r in records] == ["2", "3"]
+    assert records[0]["qty"] == 0.5 and records[0]["unit"] == "m"
+    assert records[0]["partnumbers"]["manufacturer"] == "ACME"
+    assert records[0]["per_harness"] == {"H1": {"qty": 0.5, "unit": "m"}}
+    assert records[1]["qty"] == 0
+
+
+def test_export_bom_writes_requested_formats(tmp_path):
+    written = export_bom(_bom(), tmp_path / "h", ["csv", "tsv", "jsonl"])
+
+    assert [p.name for p in written] == ["h.csv", "h.tsv", "h.jsonl"]
+    with pytest.raises(UnsupportedBomExportFormat):
+        export_bom(_bom(), tmp_path / "h", ["xlsx"])
@@ -0,0 +1,60 @@
+import io
+
+import pytest
+from PIL import Image
+
+from filare.errors import InvalidSVGRoot
+from filare.render.graph_pack import pack_pngs, pack_svgs
+
+GRAPHVIZ_SVG = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN"
+ "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">
+<!-- Generated by graphviz -->
+<svg width="{w}pt" height="{h}pt"
+ viewBox="0.00 0.00 {w}.00 {h}.00" xmlns="http://www.w3.org/2000/svg">
+<g id="graph0" class="graph">
+<polygon fill="#ffffff" stroke="none" points="0,0 1,1"/>
+<g id="node1" class="node"><path fill="url(#grad)"/></g>
+<linearGradient id="grad"/>
+</g>
+</svg>
+"""
+
+
+def test_pack_svgs_stacks_components_with_unique_ids():
+    packed = pack_svgs(
+        [GRAPHVIZ_SVG.format(w=200, h=50), GRAPHVIZ_SVG.format(w=80, h=30)], gap=10
+    )
+
+    assert packed.startswith('<svg width="200pt" height="90pt"')
+    assert '<rect width="100%" height="100%" fill="#ffffff"/>' in packed
+    assert '<svg x="0" y="60.00" width="80.00" height="30.00"' in packed
+    assert 'id="c0_node1"' in packed and 'id="c1_node1"' in packed
+    assert 'fill="url(#c1_grad)"' in packed
+    assert "<!DOCTYPE" not in packed
+
+
+def test_pack_svgs_single_component_is_unchanged():
+    svg = GRAPHVIZ_SVG.format(w=10, h=10)
+    assert pack_svgs([svg]) == svg
+    with pytest.raises(InvalidSVGRoot):
+        pack_svgs([svg, "<g/>"])
+
+
+def _png(width, height, color):
+    data = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(data, format="PNG")
+    return data.getvalue()
+
+
+def test_pack_pngs_stacks_like_pack_svgs():
+    single = _png(10, 10, "red")
+    assert pack_pngs([single], dpi=144) is single
+
+    packed = Image.open(io.BytesIO(pack_pngs([single, _png(30, 5, "blue")], dpi=144)))
+
+    # the 36pt gap is 72px at 144 dpi and takes the first background
+    assert packed.size == (30, 10 + 72 + 5)
+    assert packed.getpixel((0, 0))[:3] == (255, 0, 0)
+    assert packed.getpixel((20, 40))[:3] == (255, 0, 0)
+    assert packed.getpixel((20, 84))[:3] == (0, 0, 255)
@@ -249,3 +249,21 @@ def test_set_dot_basics_accepts_dict_colors(monkeypatch):
     gv.set_dot_basics(dot, opts)
     assert dot.graph_attrs[0]["bgcolor"] == "#ffffff"
     assert dot.node_attrs[0]["fillcolor"] in ("#000000", "bk")
+
+
+def test_draft_nodes_and_graph_attributes(basic_page_options):
+    conn = Connector(
+        designator="X1", pincount=2, pinlabels=["A", "B"], pincolors=["RD", "BK"]
+    )
+    conn.ports_left = True
+    conn.ports_right = False
+
+    full = gv.gv_node_connector(conn)
+    draft = gv.gv_node_connector(conn, draft=True)
+    assert 'sides="TBL"' in full
+    assert 'sides="TBL"' not in draft
+
+    dot = graphviz.Graph()
+    gv.set_dot_basics(dot, basic_page_options, draft=True)
+    assert "splines=line" in dot.source
+    assert "ranksep=1" in dot.source
@@ -0,0 +1,54 @@
+import base64
+
+from filare.models.options import PageOptions
+from filare.render import html
+from filare.render.html_assets import ASSETS_DIR, externalize_assets, write_html_page
+from filare.settings import settings
+
+PNG = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNk+A8AAwAB/lf8dwAAAABJRU5ErkJggg=="
+
+
+def _page(body: str) -> str:
+    return (
+        '<html><head><style type="text/css">body { margin: 0; }</style></head>'
+        f"<body>{body}"
+        f'<svg><image xlink:href="data:image/png;base64, {PNG}" /></svg>'
+        "</body></html>"
+    )
+
+
+def test_inline_by_default(tmp_path):
+    target = tmp_path / "a.html"
+    write_html_page(target, _page("A"))
+    assert target.read_text() == _page("A")
+    assert not (tmp_path / ASSETS_DIR).exists()
+
+
+def test_shared_pages_link_one_copy_of_each_asset(tmp_path):
+    write_html_page(tmp_path / "a.html", _page("A"), shared_assets=True)
+    write_html_page(tmp_path / "b.html", _page("B"), shared_assets=True)
+
+    assets = sorted(path.name for path in (tmp_path / ASSETS_DIR).iterdir())
+    assert [name.rsplit(".", 1)[1] for name in assets] == ["css", "png"]
+    css, png = (f"{ASSETS_DIR}/{name}" for name in assets)
+    for name in ("a.html", "b.html"):
+        page = (tmp_path / name).read_text()
+        assert f'<link rel="stylesheet" href="{css}" type="text/css">' in page
+        assert f'xlink:href="{png}"' in page
+        assert "<style" not in page and "base64" not in page
+    assert (tmp_path / png).read_bytes() == base64.b64decode(PNG)
+    assert (tmp_path / css).read_text() == "body { margin: 0; }"
+
+
+def test_externalize_keeps_invalid_data_uris(tmp_path):
+    page = '<img src="data:image/png;base64,abc">'
+    assert externalize_assets(page, tmp_path, "") == page
+
+
+def test_pdf_pages_stay_inline(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "html_assets", "shared")
+    html._write_page(tmp_path / "pdf.html", _page("P"), PageOptions(for_pdf=True))
+    html._write_page(tmp_path / "web.html", _page("W"), PageOptions())
+
+    assert (tmp_path / "pdf.html").read_text() == _page("P")
+    assert "<style" not in (tmp_path / "web.html").read_text()
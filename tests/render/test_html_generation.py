@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import filare
+from filare.flows.templates import build_aux_table_model
 from filare.models.bom import BomContent, BomEntry, BomRenderOptions
 from filare.models.metadata import Metadata, PageTemplateConfig, RevisionSignature
 from filare.models.notes import Notes
@@ -7,6 +9,7 @@ from filare.models.numbers import NumberAndUnit
 from filare.models.options import PageOptions
 from filare.models.partnumber import PartNumberInfo
 from filare.models.types import BomCategory
+from filare.render.html import _build_part_number, _write_aux_pages
 from filare.render.output import generate_html_output
 
 
@@ -58,3 +61,46 @@ def test_generate_html_output_creates_file(tmp_path):
         bom_render_options=BomRenderOptions(no_per_harness=True),
     )
     assert (tmp_path / "h.html").exists()
+
+
+def test_paginated_aux_pages_match_full_render(tmp_path, basic_metadata):
+    options = PageOptions(
+        include_cut_diagram=True,
+        include_termination_diagram=True,
+        cut_rows_per_page=1,
+    )
+    cut_rows = [
+        {"wire": f"W{idx}", "partno": "", "color": "RD", "length": "1 m"}
+        for idx in range(2)
+    ]
+    _write_aux_pages(tmp_path / "h", basic_metadata, options, {}, cut_rows=cut_rows)
+
+    generator = f"{filare.APP_NAME} {filare.__version__}"
+    partno = _build_part_number("PN-1", basic_metadata.revision, 1, "din-6771")
+    for page, rows in (("cut.a", cut_rows[:1]), ("cut.b", cut_rows[1:])):
+        expected = build_aux_table_model(
+            "cut",
+            rows,
+            "",
+            basic_metadata,
+            options,
+            page_suffix=page[-1],
+            generator=generator,
+            partno=partno,
+        ).render()
+        assert (tmp_path / f"h.{page}.html").read_text(encoding="utf-8") == expected
+        assert f"Sheet 1{page[-1]} of 1" in expected
+    # no termination rows: the page says so
+    termination = (tmp_path / "h.termination.html").read_text(encoding="utf-8")
+    assert (
+        termination
+        == build_aux_table_model(
+            "termination",
+            [],
+            "",
+            basic_metadata,
+            options,
+            generator=generator,
+            partno=partno,
+        ).render()
+    )
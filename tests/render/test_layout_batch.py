@@ -0,0 +1,157 @@
+import subprocess
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+import filare.render.layout_batch as layout_batch_module
+from filare.cli import cli
+from filare.render.layout_batch import LayoutBatch
+from filare.render.layout_cache import LayoutCache, pipe_graph
+
+
+class FakeGraph:
+    engine = "dot"
+
+    def __init__(self, source):
+        self.source = source
+        self.pipe_calls = 0
+
+    def pipe(self, format="svg"):
+        self.pipe_calls += 1
+        return f"piped {self.source}".encode()
+
+
+class FakeHarness:
+    def __init__(self, source):
+        self.graph = FakeGraph(source)
+        self.written = {}
+
+    def graph_formats(self, fmt):
+        return [f for f in fmt if f in ("png", "svg")]
+
+    def layout_jobs(self, fmt):
+        return [(self.graph, self.graph_formats(fmt))]
+
+    def output(self, filename, fmt, view=False, layout_cache=None):
+        for render_format in self.graph_formats(fmt):
+            self.written[render_format] = pipe_graph(
+                self.graph, render_format, layout_cache
+            )
+
+
+def _fake_dot(calls):
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        formats = [arg[2:] for arg in cmd if arg.startswith("-T")]
+        for path in map(Path, cmd[cmd.index("-O") + 1 :]):
+            for fmt in formats:
+                path.with_name(f"{path.name}.{fmt}").write_text(
+                    f"{fmt} of {path.read_text()}"
+                )
+
+    return run
+
+
+def test_flush_lays_out_all_sheets_in_one_run(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(layout_batch_module, "graphviz_version", lambda: "9.0.0")
+    monkeypatch.setattr("filare.render.layout_cache.graphviz_version", lambda: "9.0.0")
+    monkeypatch.setattr(layout_batch_module.subprocess, "run", _fake_dot(calls))
+    batch = LayoutBatch(cache=LayoutCache(tmp_path / "cache"))
+    sheets = [FakeHarness(f"graph {{ s{idx} }}") for idx in range(3)]
+
+    for idx, sheet in enumerate(sheets):
+        batch.defer(sheet, tmp_path / f"s{idx}", ("svg", "png", "tsv"))
+    assert batch.pending == 3
+    batch.flush()
+
+    assert len(calls) == 1
+    assert calls[0][:4] == ["dot", "-Kdot", "-Tsvg", "-Tpng"]
+    for idx, sheet in enumerate(sheets):
+        assert sheet.written["svg"] == f"svg of graph {{ s{idx} }}".encode()
+        assert sheet.written["png"] == f"png of graph {{ s{idx} }}".encode()
+        assert sheet.graph.pipe_calls == 0
+    assert batch.pending == 0
+    assert batch.cache.stats().entries == 6
+
+
+def test_batch_runs_the_graphviz_executable(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(layout_batch_module, "graphviz_version", lambda: "9.0.0")
+    monkeypatch.setattr(layout_batch_module.subprocess, "run", _fake_dot(calls))
+    monkeypatch.setattr(
+        layout_batch_module.dot_command, "DOT_BINARY", Path("/opt/gv/bin/dot")
+    )
+    batch = LayoutBatch(cache=LayoutCache(tmp_path / "cache"))
+    batch.layout([(FakeGraph("graph { a }"), ["svg"])])
+
+    assert calls[0][:2] == ["/opt/gv/bin/dot", "-Kdot"]
+
+
+def test_failed_batch_falls_back_to_per_sheet_render(tmp_path, monkeypatch):
+    def failing_run(cmd, **kwargs):
+        raise subprocess.CalledProcessError(1, cmd)
+
+    monkeypatch.setattr(layout_batch_module, "graphviz_version", lambda: "9.0.0")
+    monkeypatch.setattr("filare.render.layout_cache.graphviz_version", lambda: "9.0.0")
+    monkeypatch.setattr(layout_batch_module.subprocess, "run", failing_run)
+    batch = LayoutBatch(cache=LayoutCache(tmp_path / "cache"))
+    sheet = FakeHarness("graph { a }")
+
+    batch.defer(sheet, tmp_path / "a", ("svg",))
+    batch.flush()
+
+    assert sheet.written["svg"] == b"piped graph { a }"
+    assert sheet.graph.pipe_calls == 1
+
+
+def test_deferred_sheets_list_only_their_own_bom_quantities(tmp_path):
+    sheets = []
+    for name in ("h1", "h2"):
+        path = tmp_path / f"{name}.yml"
+        path.write_text(
+            "connectors:\n  J1:\n    pincount: 1\n"
+            "cables:\n  C1:\n    wirecount: 1\n    length: 1\n"
+            "connections:\n  -\n    - J1: [1]\n    - C1: [1]\n"
+        )
+        sheets.append(str(path))
+
+    result = CliRunner().invoke(cli, ["run", *sheets, "-f", "tb", "-o", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+
+    def per_harness(name):
+        rows = (tmp_path / name).read_text().splitlines()[1:]
+        return {row.split("\t")[3].strip(): row.split("\t")[-1] for row in rows}
+
+    assert per_harness("h1.tsv")["Cable, 1 wires"].split("; ") == ["h1: 1"]
+    assert per_harness("shared_bom.tsv")["Cable, 1 wires"].split("; ") == [
+        "h1: 1",
+        "h2: 1",
+    ]
+
+
+def test_run_lays_out_each_chunk_of_sheets_in_one_dot_call(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(layout_batch_module, "graphviz_version", lambda: "9.0.0")
+    monkeypatch.setattr("filare.render.layout_cache.graphviz_version", lambda: "9.0.0")
+    monkeypatch.setattr(layout_batch_module.subprocess, "run", _fake_dot(calls))
+    monkeypatch.setenv("WV_PIPELINE_LAYOUT_WORKERS", "2")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    sheets = []
+    for idx in range(5):
+        path = tmp_path / f"h{idx}.yml"
+        path.write_text(
+            f"connectors:\n  J{idx}:\n    pincount: 1\n"
+            f"cables:\n  C{idx}:\n    wirecount: 1\n    length: 1\n"
+            f"connections:\n  -\n    - J{idx}: [1]\n    - C{idx}: [1]\n"
+        )
+        sheets.append(str(path))
+
+    result = CliRunner().invoke(cli, ["run", *sheets, "-f", "p", "-o", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+
+    # five sheets, two layout workers: two chunks, each laid out by one dot run
+    assert len(calls) == 2
+    assert [len(cmd[cmd.index("-O") + 1 :]) for cmd in calls] == [3, 2]
+    for idx in range(5):
+        assert (tmp_path / f"h{idx}.png").read_text().startswith("png of ")
@@ -0,0 +1,81 @@
+import os
+
+import filare.render.layout_cache as layout_cache_module
+from filare.render.layout_cache import LayoutCache, pipe_graph
+
+
+class FakeGraph:
+    def __init__(self, source="graph { a -- b }", engine="dot"):
+        self.source = source
+        self.engine = engine
+        self.pipe_calls = []
+
+    def pipe(self, format="svg"):
+        self.pipe_calls.append(format)
+        return f"<{format}>{self.source}</{format}>".encode()
+
+
+def test_pipe_graph_reuses_cached_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(layout_cache_module, "graphviz_version", lambda: "9.0.0")
+    cache = LayoutCache(tmp_path)
+    graph = FakeGraph()
+
+    first = pipe_graph(graph, "svg", cache)
+    second = pipe_graph(FakeGraph(), "svg", cache)
+    pipe_graph(graph, "png", cache)
+    pipe_graph(FakeGraph(engine="neato"), "svg", cache)
+
+    assert first == second
+    assert graph.pipe_calls == ["svg", "png"]
+    assert cache.stats().entries == 3
+
+
+def test_pipe_graph_bypasses_cache_without_graphviz_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(layout_cache_module, "graphviz_version", lambda: None)
+    cache = LayoutCache(tmp_path)
+    graph = FakeGraph()
+
+    pipe_graph(graph, "svg", cache)
+    pipe_graph(graph, "svg", cache)
+
+    assert graph.pipe_calls == ["svg", "svg"]
+    assert cache.stats().entries == 0
+
+
+def test_layout_cache_evicts_least_recently_used(tmp_path):
+    cache = LayoutCache(tmp_path, max_bytes=25)
+    for age, key in enumerate(["aa", "bb", "cc"]):
+        cache.put(key, b"x" * 10)
+        os.utime(cache.path_for(key), (1000 + age, 1000 + age))
+    # bound exceeded on the third put: the oldest entry went first
+    assert cache.get("aa") is None
+    assert cache.stats().entries == 2
+
+    os.utime(cache.path_for("bb"), (2000, 2000))  # bb is now most recent
+    assert cache.prune(10) == 1
+    assert cache.get("bb") == b"x" * 10
+    assert cache.get("cc") is None
+
+
+def test_layout_cache_key_follows_referenced_images(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "logo.png").write_bytes(b"old")
+    source = 'graph { a [image="logo.png"]; b [label=<<img src="logo.png"/>>] }'
+
+    key = LayoutCache.key(source, "dot", "svg", "9.0.0")
+    assert LayoutCache.key(source, "dot", "svg", "9.0.0") == key
+
+    (tmp_path / "logo.png").write_bytes(b"new image")
+    assert LayoutCache.key(source, "dot", "svg", "9.0.0") != key
+
+
+def test_layout_cache_scans_its_directory_once(tmp_path, monkeypatch):
+    cache = LayoutCache(tmp_path, max_bytes=1000)
+    scans = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+
+    for key in ["aa", "bb", "cc"]:
+        cache.put(key, b"x" * 10)
+
+    assert len(scans) == 1
@@ -0,0 +1,47 @@
+from filare.render import pdf
+
+PHOTO = "data:image/png;base64, " + "A" * 400
+
+
+class FakeDocument:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def copy(self, pages):
+        return FakeDocument(pages)
+
+    def write_pdf(self, target, **options):
+        target.write(" ".join(self.pages).encode())
+
+
+def test_pages_share_font_config_and_image_cache(tmp_path, monkeypatch, capsys):
+    renders = []
+
+    class FakeHTML:
+        def __init__(self, string, base_url):
+            self.base_url = base_url
+
+        def render(self, **kwargs):
+            renders.append(kwargs)
+            return FakeDocument([self.base_url.split("/")[-1].split(".")[0]])
+
+    monkeypatch.setattr(pdf, "HTML", FakeHTML)
+    (tmp_path / "logo.png").write_bytes(b"x" * 1000)
+    sheets = [tmp_path / "a", tmp_path / "b", tmp_path / "c"]
+    for sheet in sheets:
+        sheet.with_suffix(".html").write_text(
+            f'<img src="logo.png"><svg><image xlink:href="{PHOTO}"/></svg>'
+            f'<img src="{sheet.name}.png">'  # missing, not counted
+        )
+    pdf.generate_pdf_output(sheets)
+
+    pdf_path = tmp_path / f"{tmp_path.name}.pdf"
+    assert pdf_path.read_bytes() == b"a b c"
+    assert not list(tmp_path.glob("*.tmp"))
+    assert len({id(kwargs["font_config"]) for kwargs in renders}) == 1
+    assert len({id(kwargs["cache"]) for kwargs in renders}) == 1
+    # two more copies of the 1000 byte logo and of the 300 byte photo
+    assert pdf._shared_images(
+        [pdf._page_images(s.with_suffix(".html").read_text(), s) for s in sheets]
+    ) == (2, 2600)
+    assert "2 images shared by several pages" in capsys.readouterr().out
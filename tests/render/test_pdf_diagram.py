@@ -0,0 +1,69 @@
+from filare.render import pdf_diagram
+from filare.settings import settings
+
+SVG = (
+    '<svg width="120pt" height="80pt" viewBox="0 0 120 80">'
+    '<g><svg x="0"><path d="M0 0"/></svg><text>J1</text></g></svg>'
+)
+PAGE = (
+    f'<html><body><div id="diagram" class="diagram-default">{SVG}</div></body></html>'
+)
+
+
+class FakeGraph:
+    def __init__(self, name="a"):
+        self.name = name
+        self.formats = []
+
+    def pipe(self, format="svg"):
+        self.formats.append(format)
+        return f'graph {{\n\t{self.name} [pos="1,2"];\n}}\n'.encode()
+
+
+def test_svg_element_count():
+    assert pdf_diagram.svg_element_count(SVG) == 5
+
+
+def test_use_raster_diagram_modes(monkeypatch):
+    assert not pdf_diagram.use_raster_diagram(SVG)  # vector by default
+    monkeypatch.setattr(settings, "pdf_diagram", "raster")
+    assert pdf_diagram.use_raster_diagram(SVG)
+    monkeypatch.setattr(settings, "pdf_diagram", "auto")
+    monkeypatch.setattr(settings, "pdf_diagram_raster_elements", 5)
+    assert pdf_diagram.use_raster_diagram(SVG)
+    monkeypatch.setattr(settings, "pdf_diagram_raster_elements", 6)
+    assert not pdf_diagram.use_raster_diagram(SVG)
+
+
+def test_write_print_png_draws_the_layout_at_dpi_and_drops_stale(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "layout_cache", False)
+    monkeypatch.setattr(settings, "pdf_diagram", "raster")
+    monkeypatch.setattr(settings, "pdf_diagram_dpi", 300)
+    monkeypatch.setattr(
+        pdf_diagram._LaidOutGraph, "pipe", lambda self, format: self.source.encode()
+    )
+    target = tmp_path / "sheet.print.png"
+    graph = FakeGraph()
+
+    pdf_diagram.write_print_png([graph], tmp_path / "sheet", SVG)
+    assert graph.formats == ["dot"]  # laid out once, then drawn as laid out
+    assert target.read_bytes() == b'graph {\n\ta [pos="1,2"];\n\tdpi=300;\n}\n'
+
+    monkeypatch.setattr(settings, "pdf_diagram", "vector")
+    pdf_diagram.write_print_png([graph], tmp_path / "sheet", SVG)
+    assert not target.exists()
+
+
+def test_raster_diagram_html_replaces_outer_svg(tmp_path, monkeypatch):
+    page = tmp_path / "sheet.html"
+    assert pdf_diagram.raster_diagram_html(PAGE, page) is None  # no PNG
+
+    (tmp_path / "sheet.print.png").write_bytes(b"png")
+    assert pdf_diagram.raster_diagram_html(PAGE, page) is None  # vector
+
+    monkeypatch.setattr(settings, "pdf_diagram", "raster")
+    assert pdf_diagram.raster_diagram_html(PAGE, page) == (
+        '<html><body><div id="diagram" class="diagram-default">'
+        '<img src="sheet.print.png" alt="diagram" style="width:120pt;height:80pt;">'
+        "</div></body></html>"
+    )
@@ -1,5 +1,10 @@
 import pytest
 
+from filare.flows.templates import (
+    build_titleblock_model,
+    render_titleblock,
+    titleblock_frame,
+)
 from filare.models.templates import (
     FakeTitleblockTemplateFactory,
     TitleblockTemplateModel,
@@ -63,3 +68,19 @@ def test_titleblock_respects_metadata_and_options_overrides():
     assert "of 4" in rendered
     assert f"height: {options.titleblock_row_height}mm" in rendered
     assert metadata.revisions_list[0].revision in rendered
+
+
+@pytest.mark.parametrize("sheet_current,sheet_suffix", [(1, ""), (2, "b"), (12, "")])
+def test_render_titleblock_matches_full_render(
+    basic_metadata, basic_page_options, sheet_current, sheet_suffix
+):
+    metadata = basic_metadata.model_copy(
+        update={"sheet_current": sheet_current, "sheet_suffix": sheet_suffix}
+    )
+    expected = build_titleblock_model(metadata, basic_page_options, "PN-1-02").render()
+
+    assert render_titleblock(metadata, basic_page_options, "PN-1-02") == expected
+    # sheets differing only in number, suffix and part number share one frame
+    assert titleblock_frame(metadata, basic_page_options) is titleblock_frame(
+        basic_metadata, basic_page_options
+    )
@@ -1,5 +1,8 @@
 import os
 
+import pytest
+from pydantic import ValidationError
+
 from filare.settings import FilareSettings, settings
 
 
@@ -21,5 +24,22 @@ def test_settings_debug_env_case_insensitive(monkeypatch):
     assert s.debug is True
 
 
+def test_settings_layout_cache_off_by_default(monkeypatch):
+    monkeypatch.delenv("WV_LAYOUT_CACHE", raising=False)
+    assert FilareSettings().layout_cache is False
+
+
 def test_filare_settings_alias_points_to_filare():
     assert FilareSettings is settings.__class__
+
+
+def test_settings_reject_unknown_pdf_diagram(monkeypatch):
+    monkeypatch.setenv("WV_PDF_DIAGRAM", "rasta")
+    with pytest.raises(ValidationError):
+        FilareSettings()
+
+
+def test_settings_reject_unknown_html_assets(monkeypatch):
+    monkeypatch.setenv("WV_HTML_ASSETS", "shard")
+    with pytest.raises(ValidationError):
+        FilareSettings()
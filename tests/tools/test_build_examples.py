@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import yaml
+
 from filare.tools import build_examples
 
 
@@ -47,3 +49,51 @@ def test_build_generated_writes_readme_and_uses_output_dir(tmp_path, monkeypatch
     assert readme_path.exists()
     content = readme_path.read_text()
     assert "[Bill of Materials](ex01.tsv)" in content
+
+
+def test_compare_generated_reports_only_changed_files(tmp_path, monkeypatch):
+    examples_dir = tmp_path / "examples"
+    out_dir = tmp_path / "out" / "temp"
+    out_dir.mkdir(parents=True)
+    monkeypatch.setattr(
+        build_examples,
+        "groups",
+        {
+            "temp": {
+                "path": examples_dir,
+                "prefix": "ex",
+                build_examples.readme: [],
+                "title": "Temp",
+            }
+        },
+    )
+    (out_dir / "ex01.gv").write_text(
+        "// Graph generated by Filare 0.1\ndigraph {}\n", encoding="utf-8"
+    )
+    (out_dir / "ex01.tsv").write_text("Id\tQty\n1\t2\n", encoding="utf-8")
+    (out_dir / "ex01.document.yaml").write_text(
+        f"output_dir: {out_dir}\n", encoding="utf-8"
+    )
+    (out_dir / "ex01.yml").write_text("connectors: {}\n", encoding="utf-8")
+
+    build_examples.snapshot_generated(["temp"], output_base=out_dir.parent)
+    stored = yaml.safe_load((out_dir / build_examples.hashes_file).read_text())
+    assert sorted(stored) == ["ex01.document.yaml", "ex01.gv", "ex01.tsv"]
+
+    # a new version and another output directory are not changes
+    moved = tmp_path / "moved" / "temp"
+    moved.parent.mkdir()
+    out_dir.rename(moved)
+    (moved / "ex01.gv").write_text(
+        "// Graph generated by Filare 0.2.1\ndigraph {}\n", encoding="utf-8"
+    )
+    (moved / "ex01.document.yaml").write_text(
+        f"output_dir: {moved}\n", encoding="utf-8"
+    )
+    assert build_examples.compare_generated(["temp"], moved.parent) == {"temp": []}
+
+    (moved / "ex01.tsv").write_text("Id\tQty\n1\t3\n", encoding="utf-8")
+    (moved / "ex02.svg").write_text("<svg/>", encoding="utf-8")
+    assert build_examples.compare_generated(["temp"], moved.parent) == {
+        "temp": [("changed", "ex01.tsv"), ("added", "ex02.svg")]
+    }
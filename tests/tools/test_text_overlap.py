@@ -0,0 +1,131 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from filare.tools import text_overlap
+from filare.tools.text_overlap import Node, Rect
+
+
+def _node(idx, x, y, width, height):
+    return Node(
+        text=f"n{idx}",
+        rect=Rect(x=x, y=y, width=width, height=height),
+        tag="SPAN",
+        id_attr="",
+        classes=[],
+    )
+
+
+def _as_tuples(overlaps):
+    return [(o.a.text, o.b.text, o.severity, o.depth) for o in overlaps]
+
+
+def test_compute_overlaps_reports_severity():
+    nodes = [
+        _node(0, 0, 0, 10, 10),
+        _node(1, 8.5, 0, 10, 10),  # depth 1.5 -> warning
+        _node(2, 5, 5, 10, 10),  # depth 5 against n0 -> error
+        _node(3, 100, 100, 5, 5),  # isolated
+    ]
+    overlaps = text_overlap.compute_overlaps(nodes, 1.0, 2.0)
+    assert _as_tuples(overlaps) == [
+        ("n0", "n1", "warning", 1.5),
+        ("n0", "n2", "error", 5.0),
+        ("n1", "n2", "error", 5.0),
+    ]
+
+
+def test_compute_overlaps_ignores_zero_area_nodes():
+    nodes = [_node(0, 0, 0, 10, 10), _node(1, 2, 2, 0, 10), _node(2, 2, 2, 5, 0)]
+    assert text_overlap.compute_overlaps(nodes, 0.0, 1.0) == []
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_compute_overlaps_matches_bruteforce(seed):
+    rng = random.Random(seed)
+    nodes = [
+        _node(
+            i,
+            rng.uniform(-50, 400),
+            rng.uniform(-50, 400),
+            rng.uniform(0, 40),
+            rng.uniform(0, 12),
+        )
+        for i in range(400)
+    ]
+    # a few oversized nodes exercise the fallback path
+    nodes.append(_node(400, 0, 0, 400, 400))
+    nodes.insert(10, _node(401, -10, 50, 500, 30))
+
+    expected = text_overlap.compute_overlaps_bruteforce(nodes, 1.0, 2.0)
+    actual = text_overlap.compute_overlaps(nodes, 1.0, 2.0)
+    assert expected
+    assert _as_tuples(actual) == _as_tuples(expected)
+
+
+def _fake_overlap(path):
+    return {
+        "severity": "error",
+        "depth": 3.0,
+        "a": {"text": path.stem, "selector": "span", "rect": {}},
+        "b": {"text": "b", "selector": "span", "rect": {}},
+    }
+
+
+def test_main_keeps_input_order_and_skips_cached_files(tmp_path, monkeypatch):
+    files = []
+    for name in ["c", "a", "b"]:
+        path = tmp_path / f"{name}.html"
+        path.write_text(f"<p>{name}</p>")
+        files.append(path)
+    cache_path = tmp_path / "cache.json"
+    report_path = tmp_path / "report.json"
+    calls = []
+
+    def fake_run_checks(jobs, viewport, warn, error, workers=1):
+        calls.append((sorted(job.path.name for job in jobs), workers))
+        # complete out of order, as parallel workers would
+        return {job.index: [_fake_overlap(job.path)] for job in reversed(jobs)}
+
+    monkeypatch.setattr(text_overlap, "run_checks", fake_run_checks)
+    monkeypatch.chdir(tmp_path)
+    argv = [
+        "*.html",
+        "--workers",
+        "3",
+        "--cache",
+        str(cache_path),
+        "--json",
+        str(report_path),
+        "--config",
+        str(tmp_path / "missing.yml"),
+    ]
+
+    assert text_overlap.main(argv) == 1
+    first = json.loads(report_path.read_text())
+    assert [Path(f["file"]).name for f in first["files"]] == [
+        "a.html",
+        "b.html",
+        "c.html",
+    ]
+    assert [f["overlaps"][0]["a"]["text"] for f in first["files"]] == ["a", "b", "c"]
+    assert calls == [(["a.html", "b.html", "c.html"], 3)]
+
+    (tmp_path / "b.html").write_text("<p>changed</p>")
+    assert text_overlap.main(argv) == 1
+    assert calls[-1] == (["b.html"], 3)
+    assert json.loads(report_path.read_text()) == first
+
+    # a different ignore rule invalidates every cached entry
+    assert text_overlap.main(argv + ["--ignore-text", "^x$"]) == 1
+    assert calls[-1] == (["a.html", "b.html", "c.html"], 3)
+
+    # so does a cache written by another version of the tool
+    assert text_overlap.main(argv) == 1
+    cache = json.loads(cache_path.read_text())
+    cache_path.write_text(json.dumps({**cache, "version": 0}))
+    calls.clear()
+    assert text_overlap.main(argv) == 1
+    assert calls == [(["a.html", "b.html", "c.html"], 3)]